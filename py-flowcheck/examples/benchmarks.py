@@ -3,6 +3,7 @@
 Performance benchmarks for py-flowcheck validation.
 """
 
+import re
 import time
 import statistics
 from typing import List, Dict, Any
@@ -119,6 +120,122 @@ def create_schemas() -> Dict[str, Schema]:
         })
     }
 
+def interpret_validate(schema_def: Dict[str, Any], data: Dict[str, Any], prefix: str = "") -> List[str]:
+    """
+    Reference interpreter that walks the raw rule dict on every call, the way
+    Schema.validate worked before definitions were compiled.
+
+    :param schema_def: The raw schema definition.
+    :param data: The data to validate.
+    :param prefix: Path prefix for nested fields.
+    :return: List of violations.
+    """
+    violations = []
+
+    for field, rule in schema_def.items():
+        violations.extend(_interpret_rule(rule, data.get(field), prefix + field))
+
+    return violations
+
+def _interpret_rule(rule: Any, value: Any, path: str) -> List[str]:
+    """Interpret a single rule against a value."""
+    if value is None and not (isinstance(rule, dict) and rule.get("nullable")):
+        return [f"Field '{path}' is required but missing"]
+    if isinstance(rule, dict) and rule.get("nullable") and value is None:
+        return []
+
+    expected_type = rule if isinstance(rule, type) else rule.get("type")
+    if expected_type and not isinstance(value, expected_type):
+        return [f"Field '{path}' must be of type {expected_type.__name__}, got {type(value).__name__}"]
+
+    violations = []
+    if isinstance(rule, dict) and "regex" in rule:
+        if not re.match(rule["regex"], str(value)):
+            violations.append(f"Field '{path}' does not match the required pattern")
+    if isinstance(rule, dict) and "min" in rule and value < rule["min"]:
+        violations.append(f"Field '{path}' must be at least {rule['min']}")
+    if isinstance(rule, dict) and "max" in rule and value > rule["max"]:
+        violations.append(f"Field '{path}' must be at most {rule['max']}")
+    if isinstance(rule, dict) and "enum" in rule and value not in rule["enum"]:
+        violations.append(f"Field '{path}' must be one of {rule['enum']}")
+    if isinstance(rule, dict) and "min_length" in rule and len(value) < rule["min_length"]:
+        violations.append(f"Field '{path}' must be at least {rule['min_length']} characters")
+    if isinstance(rule, dict) and "max_length" in rule and len(value) > rule["max_length"]:
+        violations.append(f"Field '{path}' must be at most {rule['max_length']} characters")
+    if isinstance(rule, dict) and "schema" in rule:
+        violations.extend(interpret_validate(rule["schema"], value, path + "."))
+    if isinstance(rule, dict) and "items" in rule:
+        for index, item in enumerate(value):
+            violations.extend(_interpret_rule(rule["items"], item, f"{path}[{index}]"))
+    return violations
+
+def benchmark_compiled_vs_interpreted():
+    """Benchmark the compiled validation plan against per-call rule interpretation."""
+    print("\n=== Compiled vs Interpreted Benchmark ===")
+
+    test_data = create_test_data()
+    schemas = create_schemas()
+
+    for name, schema in schemas.items():
+        data = test_data[name]
+
+        def compiled():
+            schema.validate(data)
+
+        def interpreted():
+            if interpret_validate(schema.schema, data):
+                raise ValidationError("Schema validation failed")
+
+        compiled_results = benchmark_function(compiled, 1000)
+        interpreted_results = benchmark_function(interpreted, 1000)
+        speedup = interpreted_results["mean_ms"] / compiled_results["mean_ms"]
+
+        print(f"{name.capitalize()} schema: compiled {compiled_results['mean_ms']:.4f}ms, "
+              f"interpreted {interpreted_results['mean_ms']:.4f}ms ({speedup:.2f}x)")
+
+def benchmark_codegen():
+    """Benchmark code-generated validators against the compiled plan."""
+    print("\n=== Code Generation Benchmark ===")
+
+    test_data = create_test_data()
+    schemas = create_schemas()
+
+    for name, schema in schemas.items():
+        data = test_data[name]
+        generated = Schema(schema.schema, codegen=True)
+
+        planned_results = benchmark_function(lambda: schema.validate(data), 1000)
+        generated_results = benchmark_function(lambda: generated.validate(data), 1000)
+        speedup = planned_results["mean_ms"] / generated_results["mean_ms"]
+
+        print(f"{name.capitalize()} schema: plan {planned_results['mean_ms']:.4f}ms, "
+              f"codegen {generated_results['mean_ms']:.4f}ms ({speedup:.2f}x)")
+
+def benchmark_columnar_validation():
+    """Benchmark columnar validation against per-record batch validation."""
+    print("\n=== Columnar Validation Benchmark ===")
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("numpy not installed, skipping")
+        return
+
+    schema = Schema({
+        "id": {"type": int, "min": 0},
+        "score": {"type": float, "min": 0.0, "max": 100.0},
+    })
+    rows = 100_000
+    columns = {"id": np.arange(rows), "score": np.random.uniform(0, 100, rows)}
+    records = [{"id": int(i), "score": float(s)} for i, s in zip(columns["id"], columns["score"])]
+
+    batch = benchmark_function(lambda: schema.validate_many(records), 5)
+    columnar = benchmark_function(lambda: schema.validate_columns(columns), 5)
+
+    print(f"{rows} rows: validate_many {batch['mean_ms']:.2f}ms, "
+          f"validate_columns {columnar['mean_ms']:.2f}ms "
+          f"({batch['mean_ms'] / columnar['mean_ms']:.1f}x)")
+
 def benchmark_validation_overhead():
     """Benchmark validation overhead compared to no validation."""
     print("=== Validation Overhead Benchmark ===")
@@ -150,6 +267,126 @@ def benchmark_validation_overhead():
     print(f"With validation: {validated['mean_ms']:.4f}ms")
     print(f"Overhead: {overhead:.4f}ms ({overhead_percent:.2f}%)")
 
+def benchmark_metrics_recording():
+    """Benchmark timing recording and get_metrics() against the size of the history."""
+    print("\n=== Metrics Recording Benchmark ===")
+    from py_flowcheck.decorators import _record_batch
+
+    for history in [1000, 100000]:
+        configure(max_metrics_history=history)
+        reset_metrics()
+        record_results = benchmark_function(lambda: _record_batch(1, 0, 0.5), 100000)
+        snapshot_results = benchmark_function(get_metrics, 200)
+        print(f"max_metrics_history={history}: record {record_results['mean_ms'] * 1000:.3f}µs, "
+              f"get_metrics {snapshot_results['mean_ms']:.4f}ms, "
+              f"timings kept {len(get_metrics()['validation_time_ms'])}")
+
+    configure(max_metrics_history=1000)
+    reset_metrics()
+
+def benchmark_latency_quantiles():
+    """Benchmark health probes and Prometheus rendering against recorded traffic."""
+    print("\n=== Latency Quantiles Benchmark ===")
+    import random
+    from py_flowcheck import get_health_status, get_prometheus_metrics
+    from py_flowcheck.decorators import _record_batch
+
+    reset_metrics()
+    recorded = 0
+    for volume in [1000, 100000, 1000000]:
+        while recorded < volume:
+            _record_batch(1, 0, random.lognormvariate(0, 1))
+            recorded += 1
+        health_results = benchmark_function(get_health_status, 200)
+        prometheus_results = benchmark_function(get_prometheus_metrics, 200)
+        p99 = get_metrics()["validation_latency"]["p99_ms"]
+        print(f"{volume} timings: health {health_results['mean_ms']:.4f}ms, "
+              f"prometheus {prometheus_results['mean_ms']:.4f}ms, p99 {p99:.3f}ms")
+
+    reset_metrics()
+
+def benchmark_labeled_metrics():
+    """Benchmark decorated calls with labeled metrics against validate_with_mode()."""
+    print("\n=== Labeled Metrics Benchmark ===")
+    from py_flowcheck import check_input
+    from py_flowcheck.decorators import validate_with_mode
+
+    schema = Schema({"id": int, "name": str}, name="user")
+    data = {"id": 1, "name": "a"}
+
+    @check_input(schema, source="args")
+    def handler(data):
+        return data
+
+    reset_metrics()
+    unlabeled_results = benchmark_function(lambda: validate_with_mode(schema, data), 10000)
+    labeled_results = benchmark_function(lambda: handler(data), 10000)
+    print(f"validate_with_mode {unlabeled_results['mean_ms'] * 1000:.2f}µs, "
+          f"check_input with labeled metrics {labeled_results['mean_ms'] * 1000:.2f}µs")
+    reset_metrics()
+
+def benchmark_threaded_metrics():
+    """Benchmark check_input throughput with metrics recorded from several threads."""
+    print("\n=== Threaded Metrics Benchmark ===")
+    import threading
+    from py_flowcheck import check_input
+
+    schema = Schema({"id": int}, name="threaded")
+
+    @check_input(schema, source="args")
+    def handler(data):
+        return data
+
+    calls = 20000
+    for threads in [1, 8, 32]:
+        reset_metrics()
+        per_thread = calls // threads
+
+        def hammer():
+            for i in range(per_thread):
+                handler({"id": i})
+
+        workers = [threading.Thread(target=hammer) for _ in range(threads)]
+        start_time = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start_time
+        collect_results = benchmark_function(get_metrics, 100)
+        print(f"{threads} threads: {per_thread * threads / elapsed:,.0f} calls/s, "
+              f"counted {get_metrics()['validation_calls']}, get_metrics {collect_results['mean_ms']:.3f}ms")
+    reset_metrics()
+
+def benchmark_shared_metrics():
+    """Benchmark publishing to and aggregating a shared metrics file."""
+    print("\n=== Shared Metrics Benchmark ===")
+    import os
+    import tempfile
+    from py_flowcheck.metrics import MetricShard
+    from py_flowcheck.shared_metrics import SharedMetrics
+
+    local = MetricShard(0)
+    for i in range(10000):
+        local.calls += 1
+        local.latency.record(0.01 * (i % 500 + 1))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "metrics")
+        workers = [SharedMetrics(path, lambda: local, slots=65) for _ in range(64)]
+        for worker in workers:
+            worker.attach()
+            worker.publish()
+        try:
+            publish_results = benchmark_function(workers[0].publish, 1000)
+            collect_results = benchmark_function(workers[0].collect, 100)
+            total, live = workers[0].collect()
+            print(f"{live} worker slots: publish {publish_results['mean_ms'] * 1000:.1f}µs, "
+                  f"aggregate {collect_results['mean_ms']:.3f}ms ({total.calls} calls)")
+        finally:
+            for worker in workers:
+                worker.close()
+
 def benchmark_schema_complexity():
     """Benchmark different schema complexities."""
     print("\n=== Schema Complexity Benchmark ===")
@@ -225,7 +462,7 @@ def benchmark_nested_validation():
     schemas = {}
     test_data = {}
     
-    for depth in [1, 3, 5, 7]:
+    for depth in [1, 3, 5, 7, 50, 200, 1000]:
         # Build nested schema
         schema_def = {"value": int}
         data = {"value": 42}
@@ -244,8 +481,146 @@ def benchmark_nested_validation():
             schema.validate(data)
         
         results = benchmark_function(validate, 1000)
-        depth = name.split("_")[1]
-        print(f"Nesting depth {depth}: {results['mean_ms']:.4f}ms")
+        depth = int(name.split("_")[1])
+        print(f"Nesting depth {depth}: {results['mean_ms']:.4f}ms "
+              f"({results['mean_ms'] * 1000 / depth:.2f}µs per level)")
+
+def benchmark_delta_validation():
+    """Benchmark validate_delta() against full revalidation of a wide document."""
+    print("\n=== Delta Validation Benchmark ===")
+
+    schema_def = {f"field_{i}": {"type": str, "regex": r"^\w+$", "max_length": 50} for i in range(200)}
+    schema = Schema(schema_def)
+    document = {f"field_{i}": f"value{i}" for i in range(200)}
+    changes = {"field_7": "changed", "field_42": "updated"}
+
+    full_results = benchmark_function(lambda: schema.validate({**document, **changes}), 1000)
+    delta_results = benchmark_function(lambda: schema.validate_delta(document, changes), 1000)
+    speedup = full_results["mean_ms"] / delta_results["mean_ms"]
+
+    print(f"200 fields, 2 changed: full {full_results['mean_ms']:.4f}ms, "
+          f"delta {delta_results['mean_ms']:.4f}ms ({speedup:.2f}x)")
+
+def benchmark_union_dispatch():
+    """Benchmark discriminated one_of dispatch against ordered branch trial."""
+    print("\n=== Union Dispatch Benchmark ===")
+
+    branches = [
+        {"type": {"type": str, "enum": [f"event_{i}"]}, f"payload_{i}": {"type": int, "min": 0}}
+        for i in range(60)
+    ]
+    discriminated = Schema({"event": {"one_of": branches, "discriminator": "type"}})
+    trial = Schema({"event": {"any_of": branches}})
+    data = {"event": {"type": "event_59", "payload_59": 1}}
+
+    indexed_results = benchmark_function(lambda: discriminated.validate(data), 1000)
+    trial_results = benchmark_function(lambda: trial.validate(data), 1000)
+    speedup = trial_results["mean_ms"] / indexed_results["mean_ms"]
+
+    print(f"60 variants, last branch: trial {trial_results['mean_ms']:.4f}ms, "
+          f"discriminator {indexed_results['mean_ms']:.4f}ms ({speedup:.2f}x)")
+
+def benchmark_json_parsing():
+    """Benchmark validate_json() against json.loads() followed by validate()."""
+    print("\n=== JSON Parse and Validate Benchmark ===")
+    import json
+    from py_flowcheck.json_backend import BACKEND
+
+    schema = Schema({
+        "id": int,
+        "name": str,
+        "scores": {"type": list, "items": float},
+        "tags": {"type": list, "items": str},
+    })
+    raw = json.dumps({
+        "id": 1,
+        "name": "benchmark",
+        "scores": [i / 7 for i in range(200)],
+        "tags": [f"tag{i}" for i in range(50)],
+    }).encode()
+
+    stdlib_results = benchmark_function(lambda: schema.validate(json.loads(raw)), 2000)
+    backend_results = benchmark_function(lambda: schema.validate_json(raw), 2000)
+    speedup = stdlib_results["mean_ms"] / backend_results["mean_ms"]
+
+    print(f"{len(raw)} byte body: json.loads + validate {stdlib_results['mean_ms']:.4f}ms, "
+          f"validate_json ({BACKEND}) {backend_results['mean_ms']:.4f}ms ({speedup:.2f}x)")
+
+def benchmark_schema_loading():
+    """Benchmark cold (compiling) and warm (cached plan) loads of a schema directory."""
+    print("\n=== Schema Loading Benchmark ===")
+    import json
+    import tempfile
+    from py_flowcheck import SchemaRegistry
+    from py_flowcheck.schema import _pattern_cache
+
+    definition = {
+        f"field_{i}": {"type": "str", "regex": rf"^value{i}_\w+$", "max_length": 64, "nullable": True}
+        for i in range(50)
+    }
+    definition["address"] = {"type": "dict", "schema": {"city": "str", "zip": {"type": "str", "regex": r"^\d{5}$"}}}
+
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(200):
+            with open(f"{directory}/schema_{i}.json", "w") as f:
+                json.dump(definition, f)
+
+        cold = SchemaRegistry.load_dir(directory).load_stats()
+        # Start the warm load without compiled regexes, as a fresh process would
+        _pattern_cache.clear()
+        re.purge()
+        warm = SchemaRegistry.load_dir(directory).load_stats()
+
+    print(f"200 schema files: cold {cold['cold_ms']:.1f}ms, warm {warm['warm_ms']:.1f}ms "
+          f"({cold['cold_ms'] / warm['warm_ms']:.2f}x)")
+
+def benchmark_parallel_validation(num_records: int = 1_000_000):
+    """Benchmark validate_parallel() throughput from one worker up to every core."""
+    print("\n=== Parallel Validation Benchmark ===")
+    import os
+    from py_flowcheck import validate_parallel
+
+    schema = create_schemas()["complex"]
+    template = create_test_data()["complex"]
+
+    def records():
+        for i in range(num_records):
+            yield {**template, "user": {**template["user"], "id": i}}
+
+    start_time = time.perf_counter()
+    schema.validate_many(records())
+    sequential = num_records / (time.perf_counter() - start_time)
+    print(f"{num_records:,} records, validate_many: {sequential:,.0f} records/s")
+
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    for workers in worker_counts:
+        start_time = time.perf_counter()
+        validate_parallel(schema, records(), workers=workers, chunk_size=20000)
+        throughput = num_records / (time.perf_counter() - start_time)
+        print(f"{workers} worker(s): {throughput:,.0f} records/s ({throughput / sequential:.2f}x)")
+
+def benchmark_shared_memory_transport(num_records: int = 1_000_000):
+    """Benchmark pickled record chunks against shared-memory JSON Lines for a simple schema."""
+    print("\n=== Shared Memory Transport Benchmark ===")
+    import json
+    import os
+    from py_flowcheck import validate_parallel, validate_jsonl_parallel
+
+    schema = Schema({"id": int, "name": str})
+    raw = "".join(json.dumps({"id": i, "name": f"user_{i}"}) + "\n" for i in range(num_records)).encode()
+    workers = os.cpu_count() or 1
+
+    start_time = time.perf_counter()
+    validate_parallel(schema, (json.loads(line) for line in raw.splitlines()), workers=workers, chunk_size=20000)
+    pickled = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    validate_jsonl_parallel(schema, raw, workers=workers)
+    shared = time.perf_counter() - start_time
+
+    print(f"{num_records:,} JSONL records on {workers} worker(s): parse + pickle {pickled * 1000:.0f}ms, "
+          f"shared memory {shared * 1000:.0f}ms ({pickled / shared:.2f}x)")
 
 def run_all_benchmarks():
     """Run all performance benchmarks."""
@@ -256,10 +631,24 @@ def run_all_benchmarks():
     configure(env="dev", sample_size=1.0, mode="raise")
     
     benchmark_validation_overhead()
+    benchmark_metrics_recording()
+    benchmark_latency_quantiles()
+    benchmark_labeled_metrics()
+    benchmark_threaded_metrics()
+    benchmark_shared_metrics()
     benchmark_schema_complexity()
+    benchmark_compiled_vs_interpreted()
+    benchmark_codegen()
+    benchmark_columnar_validation()
     benchmark_sampling_performance()
     benchmark_validation_modes()
     benchmark_nested_validation()
+    benchmark_delta_validation()
+    benchmark_union_dispatch()
+    benchmark_json_parsing()
+    benchmark_schema_loading()
+    benchmark_parallel_validation()
+    benchmark_shared_memory_transport()
     
     print("\n" + "=" * 50)
     print("Benchmark completed!")
@@ -1,5 +1,5 @@
 from fastapi import FastAPI, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 import uvicorn
 from py_flowcheck import Schema, ValidationError, configure
 from py_flowcheck.integrations.fastapi import (
@@ -7,8 +7,7 @@ from py_flowcheck.integrations.fastapi import (
     create_validation_dependency,
     check_output_fastapi
 )
-from py_flowcheck.monitoring import get_health_status, is_healthy
-from py_flowcheck.decorators import get_metrics
+from py_flowcheck.monitoring import get_health_status, is_healthy, get_prometheus_metrics
 from py_flowcheck.logging_config import setup_production_logging
 
 # Setup production logging
@@ -38,22 +37,10 @@ async def detailed_health():
     """Detailed health status with metrics."""
     return get_health_status()
 
-@app.get("/metrics")
+@app.get("/metrics", response_class=PlainTextResponse)
 async def metrics_endpoint():
     """Prometheus-style metrics endpoint."""
-    metrics = get_metrics()
-    health = get_health_status()
-    
-    # Convert to Prometheus format
-    prometheus_metrics = []
-    prometheus_metrics.append(f"py_flowcheck_validation_calls_total {metrics['validation_calls']}")
-    prometheus_metrics.append(f"py_flowcheck_validation_failures_total {metrics['validation_failures']}")
-    prometheus_metrics.append(f"py_flowcheck_sampling_skips_total {metrics['sampling_skips']}")
-    prometheus_metrics.append(f"py_flowcheck_success_rate_percent {health['metrics']['success_rate_percent']}")
-    prometheus_metrics.append(f"py_flowcheck_avg_validation_time_ms {health['metrics']['average_time_ms']}")
-    prometheus_metrics.append(f"py_flowcheck_uptime_seconds {health['uptime_seconds']}")
-    
-    return "\n".join(prometheus_metrics)
+    return get_prometheus_metrics()
 
 # Define schemas
 user_create_schema = Schema({
@@ -1,5 +1,9 @@
 # This file initializes the py_flowcheck package.
-from .schema import Schema, ValidationError
+from .schema import Schema, ValidationError, ValidationResult, Violation, BatchResult
+from .columnar import ColumnarResult
+from .loader import SchemaRegistry
+from .batching import BatchedValidator, batched_validator
+from .parallel import validate_parallel, validate_jsonl_parallel, validate_columns_parallel
 from .decorators import (
     check_input, 
     check_output, 
@@ -9,10 +13,21 @@ from .decorators import (
     debug_function_call,
     get_metrics,
     reset_metrics,
+    get_latency_histogram,
     validate_with_mode
 )
+from .metrics import LatencyHistogram
+from .streaming import (
+    validate_stream,
+    validate_jsonl,
+    validate_json_array,
+    iter_json_array,
+    InvalidRecord,
+    CollectingSink,
+    JsonlSink
+)
 from .config import configure, get_config, Config, reset_config
-from .monitoring import get_health_status, is_healthy
+from .monitoring import get_health_status, is_healthy, get_prometheus_metrics
 from .logging_config import setup_production_logging, get_logger
 
 
@@ -20,6 +35,16 @@ __version__ = "0.1.0"
 __all__ = [
     "Schema", 
     "ValidationError", 
+    "ValidationResult",
+    "Violation",
+    "BatchResult",
+    "ColumnarResult",
+    "SchemaRegistry",
+    "BatchedValidator",
+    "batched_validator",
+    "validate_parallel",
+    "validate_jsonl_parallel",
+    "validate_columns_parallel",
     "check_output", 
     "check_input", 
     "configure", 
@@ -32,9 +57,19 @@ __all__ = [
     "debug_function_call",
     "get_metrics",
     "reset_metrics",
+    "get_latency_histogram",
+    "LatencyHistogram",
     "validate_with_mode",
+    "validate_stream",
+    "validate_jsonl",
+    "validate_json_array",
+    "iter_json_array",
+    "InvalidRecord",
+    "CollectingSink",
+    "JsonlSink",
     "get_health_status",
     "is_healthy",
+    "get_prometheus_metrics",
     "setup_production_logging",
     "get_logger"
 ]
@@ -0,0 +1,133 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+# A batch lookup: receives distinct values and returns one verdict per value,
+# either as a sequence in the same order or as a mapping keyed by value
+BatchFunc = Callable[[List[Any]], Awaitable[Union[Sequence[Any], Mapping[Any, Any]]]]
+
+
+class BatchedValidator:
+    """
+    An async validator that coalesces lookups into batch calls.
+
+    Every value requested while a batch is being gathered, across all
+    concurrent validations on the event loop, is sent to ``batch_func`` in
+    a single call, and identical values share one lookup. A value whose
+    lookup is already in flight joins it instead of starting another.
+    Values are told apart by type as well, so 1, 1.0 and True are looked
+    up separately; a batch holding such values must return a sequence,
+    since a mapping keyed by value cannot tell them apart.
+
+    Example:
+        @batched_validator(max_batch_size=500)
+        async def user_exists(ids):
+            found = await cache.get_many(ids)
+            return {user_id: user_id in found for user_id in ids}
+
+        schema = Schema({"user_id": {"type": int, "validator": user_exists}})
+        await schema.avalidate(payload)
+    """
+
+    def __init__(self, batch_func: BatchFunc, max_batch_size: int = 256, max_wait: float = 0.0):
+        """
+        :param batch_func: Async function verifying a list of distinct values.
+        :param max_batch_size: Send the batch as soon as it holds this many values.
+        :param max_wait: Seconds to keep gathering values before sending a
+            batch; 0 sends it on the next event loop iteration.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.batch_func = batch_func
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        # Pending lookups keyed by (type, value)
+        self._gathering: Dict[Tuple[type, Any], asyncio.Future] = {}
+        self._in_flight: Dict[Tuple[type, Any], asyncio.Future] = {}
+        # Running batches, referenced until done so they are not garbage collected
+        self._tasks: Set[asyncio.Future] = set()
+        self._flush_handle: Optional[asyncio.Handle] = None
+
+    async def __call__(self, value: Any) -> Any:
+        key = (type(value), value)
+        try:
+            future = self._gathering.get(key) or self._in_flight.get(key)
+        except TypeError:
+            # Unhashable values cannot be shared; look them up on their own
+            return (await self._lookup([value]))[0]
+
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._gathering[key] = loop.create_future()
+            if len(self._gathering) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                if self.max_wait:
+                    self._flush_handle = loop.call_later(self.max_wait, self._flush)
+                else:
+                    self._flush_handle = loop.call_soon(self._flush)
+
+        # Shielded so one cancelled caller does not cancel the shared lookup
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Sends the values gathered so far as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._gathering = self._gathering, {}
+        if batch:
+            self._in_flight.update(batch)
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[Tuple[type, Any], asyncio.Future]) -> None:
+        values = [value for _, value in batch]
+        try:
+            results = await self._lookup(values)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future, result in zip(batch.values(), results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            for key, future in batch.items():
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+
+    async def _lookup(self, values: List[Any]) -> List[Any]:
+        self.batches += 1
+        results = await self.batch_func(values)
+        if isinstance(results, Mapping):
+            # A mapping cannot tell 1, True and 1.0 apart, so it would give
+            # them all the same verdict; only a sequence keeps them separate
+            if len(values) > 1 and len(set(values)) < len(values):
+                raise ValueError(
+                    "Batch validator returned a mapping for equal values of different types "
+                    f"({values!r}); return a sequence in the order of the values instead"
+                )
+            return [results.get(value, False) for value in values]
+        results = list(results)
+        if len(results) != len(values):
+            raise ValueError(f"Batch validator returned {len(results)} results for {len(values)} values")
+        return results
+
+
+def batched_validator(
+    max_batch_size: int = 256, max_wait: float = 0.0
+) -> Callable[[BatchFunc], BatchedValidator]:
+    """
+    Decorator turning an async batch lookup into a BatchedValidator usable as
+    a "validator" rule.
+
+    :param max_batch_size: Send the batch as soon as it holds this many values.
+    :param max_wait: Seconds to keep gathering values before sending a batch.
+    :return: A decorator returning a BatchedValidator.
+    """
+    def decorator(batch_func: BatchFunc) -> BatchedValidator:
+        return BatchedValidator(batch_func, max_batch_size, max_wait)
+    return decorator
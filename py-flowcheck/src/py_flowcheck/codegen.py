@@ -0,0 +1,170 @@
+import builtins
+import itertools
+import linecache
+import math
+from typing import Any, Callable, Dict, List, Tuple
+from py_flowcheck.schema import (
+    _Check,
+    _FieldPlan,
+    _RegexCheck,
+    _MinCheck,
+    _MaxCheck,
+    _EnumCheck,
+    _LengthCheck,
+    _NestedCheck,
+    _ItemsCheck,
+    Violation,
+)
+
+# Types whose instances are always hashable, so an enum lookup can be inlined
+_HASHABLE_TYPES = (str, int, float, bool, bytes)
+
+# Literal types that can be inlined into generated source via repr()
+_LITERAL_TYPES = (int, float, str, bool)
+
+_counter = itertools.count()
+
+
+def _escape(text: str) -> str:
+    """Escape static text for use inside a double-quoted f-string."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("{", "{{")
+        .replace("}", "}}")
+    )
+
+
+class _CodeGenerator:
+    """
+    Emits specialized Python source for a compiled validation plan.
+
+    Field lookups, type checks and simple rule constants are inlined, nested
+    schemas are unrolled and list items become plain for-loops. Rules that
+    cannot be specialized are called through their compiled checker object.
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {"Violation": Violation}
+        self._names = itertools.count()
+
+    def var(self, prefix: str) -> str:
+        return f"{prefix}{next(self._names)}"
+
+    def constant(self, value: Any) -> str:
+        name = self.var("_c")
+        self.namespace[name] = value
+        return name
+
+    def literal(self, value: Any) -> str:
+        # repr() of nan and infinities is not valid source, so those become constants
+        if type(value) in _LITERAL_TYPES and (type(value) is not float or math.isfinite(value)):
+            return repr(value)
+        return self.constant(value)
+
+    def type_name(self, expected_type: type) -> str:
+        # Builtin types are referenced by name so the source reads naturally;
+        # tuples of types and other classes go through the namespace
+        if isinstance(expected_type, type) and getattr(builtins, expected_type.__name__, None) is expected_type:
+            return expected_type.__name__
+        return self.constant(expected_type)
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def violation(self, indent: int, path: str, code: str, *args: str) -> None:
+        arguments = "".join(f", {arg}" for arg in args)
+        self.emit(indent, f'violations.append(Violation(f"{path}", {code!r}{arguments}))')
+
+    def fields(self, plan: List[_FieldPlan], data: str, prefix: str, indent: int) -> None:
+        get = self.var("get")
+        self.emit(indent, f"{get} = {data}.get")
+        for field in plan:
+            value = self.var("v")
+            self.emit(indent, f"{value} = {get}({field.name!r})")
+            self.value(field, value, prefix + _escape(field.name), indent)
+
+    def value(self, field: _FieldPlan, value: str, path: str, indent: int) -> None:
+        self.emit(indent, f"if {value} is None:")
+        if field.nullable:
+            self.emit(indent + 1, "pass")
+        else:
+            self.violation(indent + 1, path, "required")
+
+        expected_type = field.expected_type
+        if expected_type is not None:
+            type_name = self.type_name(expected_type)
+            if isinstance(expected_type, type):
+                self.emit(indent, f"elif type({value}) is not {type_name} and not isinstance({value}, {type_name}):")
+            else:
+                self.emit(indent, f"elif not isinstance({value}, {type_name}):")
+            self.violation(indent + 1, path, "type", type_name, f"type({value})")
+
+        if field.checks:
+            self.emit(indent, "else:")
+            for check in field.checks:
+                self.check(check, field, value, path, indent + 1)
+
+    def check(self, check: _Check, field: _FieldPlan, value: str, path: str, indent: int) -> None:
+        if isinstance(check, _RegexCheck):
+            matcher = self.constant(check.matcher)
+            if field.expected_type is str:
+                self.emit(indent, f"if not {matcher}({value}):")
+            else:
+                self.emit(indent, f"if not {matcher}({value} if type({value}) is str else str({value})):")
+            self.violation(indent + 1, path, "pattern", repr(check.pattern.pattern))
+        elif isinstance(check, _MinCheck):
+            minimum = self.literal(check.minimum)
+            self.emit(indent, f"if {value} < {minimum}:")
+            self.violation(indent + 1, path, "min", minimum)
+        elif isinstance(check, _MaxCheck):
+            maximum = self.literal(check.maximum)
+            self.emit(indent, f"if {value} > {maximum}:")
+            self.violation(indent + 1, path, "max", maximum)
+        elif (
+            isinstance(check, _EnumCheck)
+            and isinstance(check.lookup, frozenset)
+            and field.expected_type in _HASHABLE_TYPES
+        ):
+            self.emit(indent, f"if {value} not in {self.constant(check.lookup)}:")
+            self.violation(indent + 1, path, "enum", self.constant(check.choices))
+        elif isinstance(check, _LengthCheck):
+            length = self.var("n")
+            self.emit(indent, f"{length} = len({value})")
+            if check.min_length is not None:
+                self.emit(indent, f"if {length} < {check.min_length!r}:")
+                self.violation(indent + 1, path, "min_length", repr(check.min_length))
+            if check.max_length is not None:
+                self.emit(indent, f"if {length} > {check.max_length!r}:")
+                self.violation(indent + 1, path, "max_length", repr(check.max_length))
+        elif isinstance(check, _NestedCheck):
+            self.fields(check.plan, value, path + ".", indent)
+        elif isinstance(check, _ItemsCheck):
+            index, item = self.var("i"), self.var("v")
+            self.emit(indent, f"for {index}, {item} in enumerate({value}):")
+            self.value(check.item, item, f"{path}[{{{index}}}]", indent + 1)
+        else:
+            self.emit(indent, f'{self.constant(check)}({value}, f"{path}", violations)')
+
+    def build(self, plan: List[_FieldPlan]) -> Tuple[Callable[[Any, List[Violation]], None], str]:
+        self.emit(0, "def validate(data, violations):")
+        self.fields(plan, "data", "", 1)
+        source = "\n".join(self.lines) + "\n"
+
+        filename = f"<py_flowcheck-schema-{next(_counter)}>"
+        # Register the source so tracebacks through generated code are readable
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        exec(compile(source, filename, "exec"), self.namespace)
+        return self.namespace["validate"], source
+
+
+def generate_validator(plan: List[_FieldPlan]) -> Tuple[Callable[[Any, List[Violation]], None], str]:
+    """
+    Generates and compiles a single validation function for a compiled plan.
+
+    :param plan: The compiled validation plan.
+    :return: The compiled function (taking data and a violations list) and its source.
+    """
+    return _CodeGenerator().build(plan)
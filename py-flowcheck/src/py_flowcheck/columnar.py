@@ -0,0 +1,218 @@
+import time
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+from py_flowcheck.schema import (
+    _FieldPlan,
+    _MinCheck,
+    _MaxCheck,
+    _EnumCheck,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
+# dtype kinds that satisfy isinstance(value, expected_type) for every element
+_ACCEPTED_KINDS = {
+    int: "iub",
+    float: "f",
+    bool: "b",
+    str: "U",
+    bytes: "S",
+}
+
+# dtype kinds whose elements are never None and map cleanly to Python scalars
+_NATIVE_KINDS = "iufbUS"
+
+
+class ColumnarResult:
+    """
+    Result of validating columnar data.
+
+    ``violations`` maps each failing field to a mapping of rule code
+    ("required", "type", "min", "max", "enum", "rules") to the NumPy array
+    of offending row indices.
+    """
+    __slots__ = ("num_rows", "violations")
+
+    def __init__(self, num_rows: int, violations: Dict[str, Dict[str, Any]]):
+        self.num_rows = num_rows
+        self.violations = violations
+
+    @property
+    def ok(self) -> bool:
+        """True if no row violates any rule."""
+        return not self.violations
+
+    @property
+    def rows(self) -> Dict[str, Any]:
+        """Offending row indices per field, across all rules."""
+        return {
+            field: np.unique(np.concatenate(list(rules.values())))
+            for field, rules in self.violations.items()
+        }
+
+    @property
+    def invalid_rows(self) -> Any:
+        """Sorted indices of rows with at least one violation."""
+        if not self.violations:
+            return np.empty(0, dtype=np.intp)
+        return np.unique(np.concatenate([
+            indices for rules in self.violations.values() for indices in rules.values()
+        ]))
+
+    def __repr__(self) -> str:
+        return f"<ColumnarResult rows={self.num_rows} invalid={len(self.invalid_rows)}>"
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Columnar validation requires numpy: pip install numpy")
+
+
+def _as_array(name: str, column: Any) -> Any:
+    """Converts a column to a 1-D array without copying existing arrays."""
+    if isinstance(column, np.ndarray):
+        if column.ndim != 1:
+            raise ValueError(f"Column '{name}' must be one-dimensional")
+        return column
+
+    column = list(column)
+    element_types = set(map(type, column))
+    if len(element_types) == 1 and element_types.pop() in _ACCEPTED_KINDS:
+        # Homogeneous scalars convert losslessly to a native dtype
+        array = np.asarray(column)
+        if array.ndim == 1:
+            return array
+
+    # Mixed, nullable or nested values stay as Python objects so that type
+    # checks see exactly what a row-at-a-time validation would see
+    array = np.empty(len(column), dtype=object)
+    array[:] = column
+    return array
+
+
+def _elementwise(func: Any, values: Any) -> Any:
+    return np.fromiter((func(value) for value in values), dtype=bool, count=len(values))
+
+
+def _type_mask(array: Any, expected_type: type) -> Any:
+    """Returns a boolean mask of rows whose value is an instance of expected_type."""
+    kind = array.dtype.kind
+    accepted = _ACCEPTED_KINDS.get(expected_type)
+    if accepted is not None and kind in _NATIVE_KINDS:
+        return np.full(len(array), kind in accepted)
+    values = array if kind == "O" else array.astype(object)
+    return _elementwise(lambda value: isinstance(value, expected_type), values)
+
+
+def _compare(values: Any, op: str, bound: Any) -> Any:
+    if values.dtype.kind == "O":
+        return _elementwise(lambda value: value < bound if op == "<" else value > bound, values)
+    return values < bound if op == "<" else values > bound
+
+
+def _enum_mask(values: Any, check: _EnumCheck) -> Any:
+    kind = values.dtype.kind
+    choice_types = set(map(type, check.choices))
+    if kind == "U" and choice_types <= {str}:
+        return np.isin(values, check.choices)
+    if kind in "iufb" and choice_types <= {int, float, bool}:
+        return np.isin(values, check.choices)
+
+    def member(value: Any) -> bool:
+        try:
+            return value in check.lookup
+        except TypeError:
+            return value in check.choices
+
+    return _elementwise(member, values if kind == "O" else values.astype(object))
+
+
+def _validate_field(field: _FieldPlan, array: Any, num_rows: int) -> Dict[str, Any]:
+    """Evaluates one field rule over a whole column and returns failing rows per rule."""
+    failures: Dict[str, Any] = {}
+
+    if array is None:
+        if not field.nullable and num_rows:
+            failures["required"] = np.arange(num_rows)
+        return failures
+
+    if array.dtype.kind == "O":
+        null = _elementwise(lambda value: value is None, array)
+    else:
+        null = np.zeros(num_rows, dtype=bool)
+
+    if not field.nullable and null.any():
+        failures["required"] = np.flatnonzero(null)
+
+    # Rows still under consideration: present and of the expected type
+    candidates = np.flatnonzero(~null)
+    if field.expected_type is not None and len(candidates):
+        type_ok = _type_mask(array[candidates], field.expected_type)
+        if not type_ok.all():
+            failures["type"] = candidates[~type_ok]
+            candidates = candidates[type_ok]
+
+    if not len(candidates):
+        return failures
+
+    values = array[candidates]
+    leftover = []
+    for check in field.checks:
+        if isinstance(check, _MinCheck):
+            bad = _compare(values, "<", check.minimum)
+            code = "min"
+        elif isinstance(check, _MaxCheck):
+            bad = _compare(values, ">", check.maximum)
+            code = "max"
+        elif isinstance(check, _EnumCheck):
+            bad = ~_enum_mask(values, check)
+            code = "enum"
+        else:
+            leftover.append(check)
+            continue
+        if bad.any():
+            failures[code] = candidates[bad]
+
+    if leftover:
+        # Rules without a vectorized form run row by row on the remaining values
+        objects = values if values.dtype.kind == "O" else values.astype(object)
+        bad_rows = []
+        for row, value in zip(candidates.tolist(), objects):
+            violations: List[str] = []
+            for check in leftover:
+                check(value, field.name, violations)
+            if violations:
+                bad_rows.append(row)
+        if bad_rows:
+            failures["rules"] = np.asarray(bad_rows, dtype=np.intp)
+
+    return failures
+
+
+def validate_columns(plan: List[_FieldPlan], columns: Mapping[str, Sequence[Any]]) -> Tuple[ColumnarResult, float]:
+    """
+    Validates columnar data against a compiled plan.
+
+    :param plan: The compiled validation plan.
+    :param columns: Mapping of field name to a list or 1-D NumPy array.
+    :return: The ColumnarResult and the elapsed time in milliseconds.
+    :raises ValueError: If the columns have different lengths.
+    """
+    _require_numpy()
+    start_time = time.perf_counter()
+
+    arrays = {name: _as_array(name, column) for name, column in columns.items()}
+    lengths = {len(array) for array in arrays.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"All columns must have the same length, got {sorted(lengths)}")
+    num_rows = lengths.pop() if lengths else 0
+
+    violations = {}
+    for field in plan:
+        failures = _validate_field(field, arrays.get(field.name), num_rows)
+        if failures:
+            violations[field.name] = failures
+
+    return ColumnarResult(num_rows, violations), (time.perf_counter() - start_time) * 1000
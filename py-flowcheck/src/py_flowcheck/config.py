@@ -12,6 +12,10 @@ class Config:
     mode: Mode = "raise"
     enable_metrics: bool = True
     max_metrics_history: int = 1000
+    fail_fast: bool = False
+    max_violations: int = 0
+    schema_cache_dir: Optional[str] = None
+    shared_metrics_path: Optional[str] = None
 
     def __post_init__(self):
         """Validating config values"""
@@ -23,6 +27,8 @@ class Config:
             raise ValueError("Mode must be 'raise', 'log', or 'silent'")
         if self.max_metrics_history < 0:
             raise ValueError("max_metrics_history must be non-negative")
+        if self.max_violations < 0:
+            raise ValueError("max_violations must be non-negative")
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -32,7 +38,11 @@ class Config:
             sample_size=float(os.getenv("PY_FLOWCHECK_SAMPLE_SIZE", "1.0")),
             mode=os.getenv("PY_FLOWCHECK_MODE", "raise"),
             enable_metrics=os.getenv("PY_FLOWCHECK_ENABLE_METRICS", "true").lower() == "true",
-            max_metrics_history=int(os.getenv("PY_FLOWCHECK_MAX_METRICS_HISTORY", "1000"))
+            max_metrics_history=int(os.getenv("PY_FLOWCHECK_MAX_METRICS_HISTORY", "1000")),
+            fail_fast=os.getenv("PY_FLOWCHECK_FAIL_FAST", "false").lower() == "true",
+            max_violations=int(os.getenv("PY_FLOWCHECK_MAX_VIOLATIONS", "0")),
+            schema_cache_dir=os.getenv("PY_FLOWCHECK_SCHEMA_CACHE_DIR") or None,
+            shared_metrics_path=os.getenv("PY_FLOWCHECK_SHARED_METRICS_PATH") or None
         )
 
     def is_production(self) -> bool:
@@ -59,11 +69,18 @@ def configure(
     sample_size: Optional[float] = None,
     mode: Optional[Mode] = None,
     enable_metrics: Optional[bool] = None,
-    max_metrics_history: Optional[int] = None
+    max_metrics_history: Optional[int] = None,
+    fail_fast: Optional[bool] = None,
+    max_violations: Optional[int] = None,
+    schema_cache_dir: Optional[str] = None,
+    shared_metrics_path: Optional[str] = None
 ) -> None:
-    """Configure the global settings for py_flowcheck."""
-    global _config
-    
+    """
+    Configure the global settings for py_flowcheck.
+
+    ``shared_metrics_path`` enables cross-process metrics through a shared
+    file (see py_flowcheck.shared_metrics); pass "" to disable them.
+    """
     # Update only provided values
     updates = {}
     if env is not None:
@@ -76,6 +93,14 @@ def configure(
         updates['enable_metrics'] = enable_metrics
     if max_metrics_history is not None:
         updates['max_metrics_history'] = max_metrics_history
+    if fail_fast is not None:
+        updates['fail_fast'] = fail_fast
+    if max_violations is not None:
+        updates['max_violations'] = max_violations
+    if schema_cache_dir is not None:
+        updates['schema_cache_dir'] = schema_cache_dir
+    if shared_metrics_path is not None:
+        updates['shared_metrics_path'] = shared_metrics_path or None
     
     # Create new config with updates
     current_dict = {
@@ -83,11 +108,15 @@ def configure(
         'sample_size': _config.sample_size,
         'mode': _config.mode,
         'enable_metrics': _config.enable_metrics,
-        'max_metrics_history': _config.max_metrics_history
+        'max_metrics_history': _config.max_metrics_history,
+        'fail_fast': _config.fail_fast,
+        'max_violations': _config.max_violations,
+        'schema_cache_dir': _config.schema_cache_dir,
+        'shared_metrics_path': _config.shared_metrics_path
     }
     current_dict.update(updates)
     
-    _config = Config(**current_dict)
+    _set_config(Config(**current_dict))
 
 def get_config() -> Config:
     """Getting the current global configuration for the py_flowcheck."""
@@ -95,5 +124,23 @@ def get_config() -> Config:
 
 def reset_config() -> None:
     """Reset configuration to environment defaults."""
+    _set_config(Config.from_env())
+
+def _set_config(config: Config) -> None:
+    """
+    Install a new global config, resizing the metrics history and switching
+    the shared metrics file if their settings changed.
+    """
     global _config
-    _config = Config.from_env()
+    previous, _config = _config, config
+    if config.max_metrics_history != previous.max_metrics_history:
+        # Imported lazily: decorators imports this module
+        from py_flowcheck.decorators import _resize_timing_history
+        _resize_timing_history(config.max_metrics_history)
+    if config.shared_metrics_path != previous.shared_metrics_path:
+        from py_flowcheck.decorators import _use_shared_metrics
+        try:
+            _use_shared_metrics(config.shared_metrics_path)
+        except Exception:
+            _config = previous
+            raise
@@ -1,63 +1,267 @@
+import atexit
 import functools
 import logging
+import os
 import random
+import threading
 import time
-from typing import Callable, Any
-from py_flowcheck.schema import Schema, ValidationError
+from typing import Callable, Any, Optional
+from py_flowcheck.schema import (
+    Schema, ValidationError, ValidationResult, _pattern_cache,
+    _result_cache_stats, _reset_result_cache_stats,
+)
 from py_flowcheck.config import get_config
+from py_flowcheck.metrics import LatencyHistogram, MetricShard, ShardedMetrics
+from py_flowcheck.shared_metrics import SharedMetrics
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Metrics storage
-_metrics = {
-    "validation_calls": 0,
-    "validation_failures": 0,
-    "validation_time_ms": [],
-    "sampling_skips": 0
-}
+# Metrics storage: every thread records into its own shard (counters, a timing
+# ring buffer bounded by max_metrics_history, a latency histogram and labeled
+# series for check_input/check_output); get_metrics() merges the shards
+_metrics = ShardedMetrics(get_config().max_metrics_history)
+
+# Cross-process metrics file, enabled by the shared_metrics_path setting. The
+# process claims its slot on the first validation it records, so a process
+# that never validates (e.g. a preloading gunicorn master) is not counted
+_shared_metrics: Optional[SharedMetrics] = None
+_shared_slot_pending = False
+_shared_slot_lock = threading.Lock()
+
+# Cleared in process pool workers, whose batches the parent records as a whole
+_recording = True
 
 def get_metrics() -> dict:
-    """Get validation metrics."""
-    return _metrics.copy()
+    """
+    Get validation metrics, merged across threads.
+
+    ``validation_time_ms`` is a snapshot array of the most recent timings
+    (at most ``max_metrics_history``), oldest first within each thread.
+    ``validation_latency`` summarizes all timings since the last reset:
+    count, mean, max and the p50/p90/p99/p999 quantiles in ms. ``labeled``
+    breaks calls, failures, sampling skips and latency down by decorated
+    function, schema name and direction ("input" or "output").
+
+    With ``shared_metrics_path`` configured, the counters and
+    ``validation_latency`` cover every worker process sharing the file and
+    ``workers`` counts those that have recorded a validation; the other
+    entries describe this process only.
+    """
+    total = _metrics.collect()
+    combined, workers = total, 1
+    shared = _shared_metrics
+    if shared is not None:
+        shared.publish(total)
+        combined, workers = shared.collect()
+    return {
+        "validation_calls": combined.calls,
+        "validation_failures": combined.failures,
+        "validation_time_ms": total.timings.snapshot(),
+        "validation_latency": combined.latency.summary(),
+        "validation_batches": combined.batches,
+        "sampling_skips": combined.sampling_skips,
+        "workers": workers,
+        "regex_cache": _pattern_cache.stats(),
+        "result_cache": _result_cache_stats(),
+        "validators": _metrics.validator_rows(total),
+        "labeled": _metrics.labeled_rows(total),
+    }
 
 def reset_metrics() -> None:
     """Reset validation metrics."""
-    global _metrics
-    _metrics = {
-        "validation_calls": 0,
-        "validation_failures": 0,
-        "validation_time_ms": [],
-        "sampling_skips": 0
-    }
+    _metrics.reset()
+    _pattern_cache.reset_stats()
+    _reset_result_cache_stats()
+
+def get_latency_histogram(reset: bool = False) -> LatencyHistogram:
+    """
+    Get a snapshot of the validation latency histogram, merged across threads.
+
+    Snapshots can be merged with LatencyHistogram.merge(). With ``reset=True``
+    the histogram is cleared as the snapshot is taken, so successive calls
+    return non-overlapping windows; other metrics are left untouched.
 
-def _validate_with_metrics(schema: Schema, data: dict) -> None:
-    """Validate data with metrics collection."""
-    global _metrics
+    :param reset: Start a new window after taking the snapshot.
+    :return: A LatencyHistogram independent of later validations.
+    """
+    return _metrics.latency(reset)
+
+def _use_shared_metrics(path: Optional[str]) -> None:
+    """
+    Switch the cross-process metrics file, detaching from the previous one.
+    The slot in the new file is claimed by the next recorded validation.
+    """
+    global _shared_metrics, _shared_slot_pending
+    _shared_slot_pending = False
+    if _shared_metrics is not None:
+        _shared_metrics.close()
+        _shared_metrics = None
+    if path and _recording:
+        _shared_metrics = SharedMetrics(path, _metrics.collect)
+        _shared_slot_pending = True
+
+def _claim_shared_slot() -> None:
+    """Attach to the shared metrics file on the first recorded validation."""
+    global _shared_metrics, _shared_slot_pending
+    with _shared_slot_lock:
+        if not _shared_slot_pending:
+            return
+        _shared_slot_pending = False
+        try:
+            _shared_metrics.attach()
+        except Exception as e:
+            logger.warning(f"Shared metrics disabled in process {os.getpid()}: {e}")
+            _shared_metrics.close()
+            _shared_metrics = None
+
+def _close_shared_metrics() -> None:
+    """Publish the final metrics of an exiting process."""
+    if _shared_metrics is not None:
+        _shared_metrics.close()
+
+def _after_fork_in_child() -> None:
+    """
+    Start a forked worker with empty metrics (the parent keeps its own) and,
+    if shared metrics are enabled, claim a slot of its own in the shared file
+    once it records a validation.
+    """
+    global _shared_metrics, _shared_slot_lock
+    _metrics.reinit()
+    # Another thread may have held the lock when the process forked
+    _shared_slot_lock = threading.Lock()
+    if _shared_metrics is not None:
+        path = _shared_metrics.path
+        _shared_metrics.abandon()
+        _shared_metrics = None
+        try:
+            _use_shared_metrics(path)
+        except Exception as e:
+            logger.warning(f"Shared metrics disabled in worker {os.getpid()}: {e}")
+
+def _disable_recording() -> None:
+    """
+    Stop recording batch metrics and release any shared metrics slot; called
+    in process pool workers so their chunks are not counted twice.
+    """
+    global _recording, _shared_metrics, _shared_slot_pending
+    _recording = False
+    _shared_slot_pending = False
+    if _shared_metrics is not None:
+        _shared_metrics.close()
+        _shared_metrics = None
+
+def _resize_timing_history(capacity: int) -> None:
+    """Resize the timing buffers after max_metrics_history changes, keeping the newest timings."""
+    _metrics.resize(capacity)
+
+class _SeriesLabel:
+    """
+    The labeled series of a decorated function, resolved on its first
+    recorded call rather than at decoration time, so a schema named later
+    (e.g. by SchemaRegistry.register) is labeled by that name.
+    """
+    __slots__ = ("func", "schema", "direction", "_series_id")
+
+    def __init__(self, func: Callable, schema: Schema, direction: str):
+        self.func = func
+        self.schema = schema
+        self.direction = direction
+        self._series_id: Optional[int] = None
+
+    def __call__(self) -> int:
+        series_id = self._series_id
+        if series_id is None:
+            function = f"{self.func.__module__}.{self.func.__qualname__}"
+            series_id = self._series_id = _metrics.label_id(function, self.schema.name or "anonymous", self.direction)
+        return series_id
+
+def _count_skip(series_id: int) -> None:
+    """Record a validation skipped by sampling."""
+    if _shared_slot_pending:
+        _claim_shared_slot()
+    shard = _metrics.shard()
+    shard.sampling_skips += 1
+    shard.series(series_id).sampling_skips += 1
+
+def _count_failure(series_id: int) -> None:
+    """Record a validation that failed before reaching the schema."""
+    if _shared_slot_pending:
+        _claim_shared_slot()
+    shard = _metrics.shard()
+    shard.failures += 1
+    shard.series(series_id).failures += 1
+
+def _check_with_metrics(
+    schema: Schema,
+    data: dict,
+    fail_fast: Optional[bool] = None,
+    max_violations: Optional[int] = None,
+    series_id: Optional[int] = None
+) -> ValidationResult:
+    """
+    Validate data with metrics collection, returning the result instead of raising.
+
+    The labeled series ``series_id`` additionally receives the call, failure
+    and latency of this validation.
+    """
+    if _shared_slot_pending:
+        _claim_shared_slot()
+    shard: MetricShard = _metrics.shard()
+    series = shard.series(series_id) if series_id is not None else None
     start_time = time.time()
-    _metrics["validation_calls"] += 1
+    shard.calls += 1
+    if series is not None:
+        series.calls += 1
     
     try:
-        schema.validate(data)
-    except ValidationError as e:
-        _metrics["validation_failures"] += 1
-        raise
+        result = schema.check(data, fail_fast=fail_fast, max_violations=max_violations)
+        if not result.ok:
+            shard.failures += 1
+            if series is not None:
+                series.failures += 1
+        return result
     finally:
         validation_time = (time.time() - start_time) * 1000
-        _metrics["validation_time_ms"].append(validation_time)
+        shard.record(validation_time)
+        if series is not None:
+            series.latency.record(validation_time)
+
+def _record_batch(records: int, failures: int, elapsed_ms: float) -> None:
+    """Record one aggregated metrics entry for a batch validation."""
+    if not _recording:
+        return
+    if _shared_slot_pending:
+        _claim_shared_slot()
+    shard = _metrics.shard()
+    shard.calls += records
+    shard.failures += failures
+    shard.batches += 1
+    shard.record(elapsed_ms)
 
-def validate_with_mode(schema: Schema, data: dict, mode: str = None) -> None:
+if get_config().shared_metrics_path:
+    _use_shared_metrics(get_config().shared_metrics_path)
+atexit.register(_close_shared_metrics)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+def validate_with_mode(
+    schema: Schema,
+    data: dict,
+    mode: str = None,
+    fail_fast: Optional[bool] = None,
+    max_violations: Optional[int] = None
+) -> None:
     """Validate data respecting the validation mode."""
     config = get_config()
     effective_mode = mode or config.mode
     
-    try:
-        _validate_with_metrics(schema, data)
-    except ValidationError as e:
+    result = _check_with_metrics(schema, data, fail_fast, max_violations)
+    if not result.ok:
         if effective_mode == "raise":
-            raise
+            raise ValidationError("Schema validation failed", result.errors)
         elif effective_mode == "log":
-            logger.error(f"Validation failed: {e.violations}")
+            logger.error(f"Validation failed: {result.violations}")
         elif effective_mode == "silent":
             pass
 
@@ -113,16 +317,26 @@ def postcondition(postcondition: Callable[[Any], bool]) -> Callable:
 
 
 # Decorator for validating function inputs
-def check_input(schema: Schema, source: str = "json", sample_rate: float = None) -> Callable:
+def check_input(
+    schema: Schema,
+    source: str = "json",
+    sample_rate: float = None,
+    fail_fast: Optional[bool] = None,
+    max_violations: Optional[int] = None
+) -> Callable:
     """
     Decorator to validate function inputs against a schema.
 
     :param schema: The Schema instance to validate against.
     :param source: The source of the data (e.g., "json", "query", "args").
     :param sample_rate: Override global sample rate for this validation.
+    :param fail_fast: Override the schema/global fail_fast setting.
+    :param max_violations: Override the schema/global max_violations setting.
     :return: The decorated function.
     """
     def decorator(func: Callable) -> Callable:
+        series = _SeriesLabel(func, schema, "input")
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             config = get_config()
@@ -131,7 +345,7 @@ def check_input(schema: Schema, source: str = "json", sample_rate: float = None)
             # Skip validation in production based on sample rate
             if config.env == "prod" and effective_sample_rate < 1.0:
                 if random.random() > effective_sample_rate:
-                    _metrics["sampling_skips"] += 1
+                    _count_skip(series())
                     return func(*args, **kwargs)
 
             try:
@@ -151,23 +365,22 @@ def check_input(schema: Schema, source: str = "json", sample_rate: float = None)
                     raise ValueError(f"Unsupported source: {source}")
 
                 # Validate data with metrics
-                _validate_with_metrics(schema, data)
-                
-            except ValidationError as e:
-                if config.mode == "raise":
-                    raise ValidationError(f"Input validation failed: {e.violations}")
-                elif config.mode == "log":
-                    logger.error(f"Input validation failed for {func.__name__}: {e.violations}")
-                elif config.mode == "silent":
-                    pass
+                result = _check_with_metrics(schema, data, fail_fast, max_violations, series())
                     
             except Exception as e:
-                _metrics["validation_failures"] += 1
+                result = None
+                _count_failure(series())
                 
                 if config.mode == "raise":
                     raise ValueError(f"Input validation error: {str(e)}")
                 elif config.mode == "log":
                     logger.error(f"Input validation error for {func.__name__}: {str(e)}")
+
+            if result is not None and not result.ok:
+                if config.mode == "raise":
+                    raise ValidationError(f"Input validation failed: {result.violations}", result.errors)
+                elif config.mode == "log":
+                    logger.error(f"Input validation failed for {func.__name__}: {result.violations}")
             
             return func(*args, **kwargs)
         return wrapper
@@ -175,15 +388,24 @@ def check_input(schema: Schema, source: str = "json", sample_rate: float = None)
 
 
 # Decorator for validating function outputs
-def check_output(schema: Schema, sample_rate: float = None) -> Callable:
+def check_output(
+    schema: Schema,
+    sample_rate: float = None,
+    fail_fast: Optional[bool] = None,
+    max_violations: Optional[int] = None
+) -> Callable:
     """
     Decorator to validate function outputs against a schema.
 
     :param schema: The Schema instance to validate the output.
     :param sample_rate: Override global sample rate for this validation.
+    :param fail_fast: Override the schema/global fail_fast setting.
+    :param max_violations: Override the schema/global max_violations setting.
     :return: The decorated function.
     """
     def decorator(func: Callable) -> Callable:
+        series = _SeriesLabel(func, schema, "output")
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             config = get_config()
@@ -194,28 +416,27 @@ def check_output(schema: Schema, sample_rate: float = None) -> Callable:
             # Skip validation in production based on sample rate
             if config.env == "prod" and effective_sample_rate < 1.0:
                 if random.random() > effective_sample_rate:
-                    _metrics["sampling_skips"] += 1
+                    _count_skip(series())
                     return result
 
             try:
                 # Validate the result with metrics
-                _validate_with_metrics(schema, result)
-                
-            except ValidationError as e:
-                if config.mode == "raise":
-                    raise ValidationError(f"Output validation failed: {e.violations}")
-                elif config.mode == "log":
-                    logger.error(f"Output validation failed for {func.__name__}: {e.violations}")
-                elif config.mode == "silent":
-                    pass
+                outcome = _check_with_metrics(schema, result, fail_fast, max_violations, series())
                     
             except Exception as e:
-                _metrics["validation_failures"] += 1
+                outcome = None
+                _count_failure(series())
                 
                 if config.mode == "raise":
                     raise ValueError(f"Output validation error: {str(e)}")
                 elif config.mode == "log":
                     logger.error(f"Output validation error for {func.__name__}: {str(e)}")
+
+            if outcome is not None and not outcome.ok:
+                if config.mode == "raise":
+                    raise ValidationError(f"Output validation failed: {outcome.violations}", outcome.errors)
+                elif config.mode == "log":
+                    logger.error(f"Output validation failed for {func.__name__}: {outcome.violations}")
             
             return result
         return wrapper
@@ -3,9 +3,8 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request as StarletteRequest
 from starlette.responses import Response as StarletteResponse
-import json
 from typing import Callable, Optional
-from py_flowcheck import Schema, ValidationError, get_config
+from py_flowcheck import Schema, get_config
 
 
 class ValidationMiddleware(BaseHTTPMiddleware):
@@ -32,13 +31,14 @@ class ValidationMiddleware(BaseHTTPMiddleware):
                     if request.method in ["POST", "PUT", "PATCH"]:
                         body = await request.body()
                         if body:
-                            data = json.loads(body)
-                            rule["request_schema"].validate(data)
-                except ValidationError as e:
-                    return JSONResponse(
-                        status_code=422,
-                        content={"detail": f"Request validation failed: {e.violations}"}
-                    )
+                            result = await rule["request_schema"].acheck_json(body)
+                            if result.errors and result.errors[0].code == "invalid_json":
+                                raise ValueError(result.errors[0].actual)
+                            if not result.ok:
+                                return JSONResponse(
+                                    status_code=422,
+                                    content={"detail": f"Request validation failed: {result.violations}"}
+                                )
                 except Exception as e:
                     return JSONResponse(
                         status_code=400,
@@ -51,32 +51,28 @@ class ValidationMiddleware(BaseHTTPMiddleware):
         # Validate response if schema provided
         if rule_key in self.validation_rules and "response_schema" in self.validation_rules[rule_key]:
             rule = self.validation_rules[rule_key]
-            try:
-                # Only validate successful responses
-                if 200 <= response.status_code < 300:
-                    response_body = b""
-                    async for chunk in response.body_iterator:
-                        response_body += chunk
-                    
-                    if response_body:
-                        data = json.loads(response_body)
-                        rule["response_schema"].validate(data)
-                    
-                    # Recreate response with same body
-                    return StarletteResponse(
-                        content=response_body,
-                        status_code=response.status_code,
-                        headers=response.headers,
-                        media_type=response.media_type
-                    )
-            except ValidationError as e:
-                config = get_config()
-                if config.mode == "raise":
-                    return JSONResponse(
-                        status_code=500,
-                        content={"detail": f"Response validation failed: {e.violations}"}
-                    )
-                # In log or silent mode, return original response
+            # Only validate successful responses
+            if 200 <= response.status_code < 300:
+                response_body = b""
+                async for chunk in response.body_iterator:
+                    response_body += chunk
+                
+                if response_body:
+                    result = await rule["response_schema"].acheck_json(response_body)
+                    if not result.ok and get_config().mode == "raise":
+                        return JSONResponse(
+                            status_code=500,
+                            content={"detail": f"Response validation failed: {result.violations}"}
+                        )
+                
+                # Recreate response with same body; in log or silent mode the
+                # original response is returned even if validation failed
+                return StarletteResponse(
+                    content=response_body,
+                    status_code=response.status_code,
+                    headers=response.headers,
+                    media_type=response.media_type
+                )
         
         return response
 
@@ -92,28 +88,33 @@ def create_validation_dependency(schema: Schema, source: str = "json"):
     async def validate_request(request: Request):
         try:
             if source == "json":
-                data = await request.json()
-            elif source == "query":
-                data = dict(request.query_params)
-            elif source == "form":
-                form_data = await request.form()
-                data = dict(form_data)
+                # The body is parsed once, by the schema's JSON backend
+                result = await schema.acheck_json(await request.body())
+                if result.errors and result.errors[0].code == "invalid_json":
+                    raise ValueError(result.errors[0].actual)
+                data = result.value
             else:
-                raise ValueError(f"Unsupported source: {source}")
-            
-            schema.validate(data)
-            return data
+                if source == "query":
+                    data = dict(request.query_params)
+                elif source == "form":
+                    form_data = await request.form()
+                    data = dict(form_data)
+                else:
+                    raise ValueError(f"Unsupported source: {source}")
+                result = await schema.acheck(data)
             
-        except ValidationError as e:
-            raise HTTPException(
-                status_code=422,
-                detail=f"Validation failed: {e.violations}"
-            )
         except Exception as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"Request parsing error: {str(e)}"
             )
+        
+        if not result.ok:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Validation failed: {result.violations}"
+            )
+        return data
     
     return validate_request
 
@@ -128,18 +129,17 @@ def check_output_fastapi(schema: Schema):
     def decorator(func: Callable):
         async def wrapper(*args, **kwargs):
             response = await func(*args, **kwargs)
-            try:
-                schema.validate(response)
-            except ValidationError as e:
+            result = await schema.acheck(response)
+            if not result.ok:
                 config = get_config()
                 if config.mode == "raise":
                     raise HTTPException(
                         status_code=500, 
-                        detail=f"Response validation failed: {e.violations}"
+                        detail=f"Response validation failed: {result.violations}"
                     )
                 elif config.mode == "log":
                     import logging
-                    logging.error(f"Response validation failed for {func.__name__}: {e.violations}")
+                    logging.error(f"Response validation failed for {func.__name__}: {result.violations}")
             return response
         return wrapper
     return decorator
@@ -0,0 +1,22 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+# The JSON parser used by Schema.validate_json(), chosen once at import
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+if orjson is not None:
+    def loads(raw: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Parses a JSON document with orjson, which reads bytes and memoryviews directly."""
+        return orjson.loads(raw)
+else:
+    def loads(raw: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Parses a JSON document with the standard library."""
+        if isinstance(raw, memoryview):
+            raw = raw.tobytes()
+        return json.loads(raw)
@@ -0,0 +1,333 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import pickle
+import stat
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from py_flowcheck.config import get_config
+from py_flowcheck.schema import Schema, RegexMode, _FieldPlan
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - exercised only without PyYAML installed
+    yaml = None
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the pickled plan layout changes; it is part of every cache key
+_PLAN_CACHE_VERSION = 1
+
+# Default cache directory, created next to the schema files like __pycache__
+_CACHE_DIRNAME = "__flowcheck_cache__"
+
+_SUFFIXES = {".json": "json", ".yaml": "yaml", ".yml": "yaml"}
+
+# Type names usable in schema files
+_TYPE_NAMES: Dict[str, Any] = {
+    "str": str,
+    "string": str,
+    "int": int,
+    "integer": int,
+    "float": float,
+    "number": (int, float),
+    "bool": bool,
+    "boolean": bool,
+    "dict": dict,
+    "object": dict,
+    "list": list,
+    "array": list,
+    "bytes": bytes,
+}
+
+
+def _resolve_type(name: Any, where: str) -> Any:
+    """Maps a type name, or a list of names, from a schema file to Python types."""
+    if isinstance(name, list):
+        return tuple(_resolve_type(item, where) for item in name)
+    try:
+        return _TYPE_NAMES[name]
+    except (KeyError, TypeError):
+        raise ValueError(f"{where}: unknown type {name!r}") from None
+
+
+def _definition_from_file(document: Any, where: str) -> Dict[str, Any]:
+    """
+    Converts a parsed schema file into a Schema definition: type names become
+    Python types and nested schemas, items and union branches are converted
+    the same way.
+
+    :raises ValueError: If the document is not a mapping of fields, names an
+        unknown type or uses a rule that cannot be expressed in a file.
+    """
+    if not isinstance(document, dict):
+        raise ValueError(f"{where}: a schema file must contain a mapping of fields")
+    return {field: _rule_from_file(rule, f"{where}: field '{field}'") for field, rule in document.items()}
+
+
+def _rule_from_file(rule: Any, where: str) -> Any:
+    if not isinstance(rule, dict):
+        return _resolve_type(rule, where)
+    if "validator" in rule:
+        raise ValueError(f"{where}: 'validator' rules cannot be loaded from files")
+
+    converted = dict(rule)
+    if "type" in rule:
+        converted["type"] = _resolve_type(rule["type"], where)
+    if "schema" in rule:
+        converted["schema"] = _definition_from_file(rule["schema"], where)
+    if "items" in rule:
+        converted["items"] = _rule_from_file(rule["items"], f"{where} items")
+    for mode in ("one_of", "any_of"):
+        if mode in rule:
+            branches = rule[mode]
+            if isinstance(branches, dict):
+                converted[mode] = {tag: _definition_from_file(branch, where) for tag, branch in branches.items()}
+            else:
+                converted[mode] = [_definition_from_file(branch, where) for branch in branches]
+    return converted
+
+
+def _parse(raw: bytes, path: str) -> Any:
+    """Parses the raw bytes of a schema file according to its suffix."""
+    kind = _SUFFIXES.get(os.path.splitext(path)[1].lower())
+    if kind == "json":
+        return json.loads(raw)
+    if kind == "yaml":
+        if yaml is None:
+            raise ImportError("Loading YAML schema files requires PyYAML: pip install pyyaml")
+        return yaml.safe_load(raw)
+    raise ValueError(f"{path}: unsupported schema file type, expected .json, .yaml or .yml")
+
+
+def _cache_file(path: str, raw: bytes, regex_mode: RegexMode, cache_dir: Optional[str]) -> str:
+    """
+    Returns the cache file for a schema file's current content. The name
+    carries a hash of the absolute path (so files sharing a cache directory
+    don't clash) and of the content, cache version, Python version and
+    options that affect compilation.
+    """
+    directory = cache_dir or get_config().schema_cache_dir or os.path.join(os.path.dirname(path), _CACHE_DIRNAME)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    location = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:8]
+    content = hashlib.sha256()
+    content.update(f"{_PLAN_CACHE_VERSION}:{sys.version_info[0]}.{sys.version_info[1]}:{regex_mode}\n".encode())
+    content.update(raw)
+    return os.path.join(directory, f"{stem}-{location}-{content.hexdigest()[:16]}.plan")
+
+
+def _untrusted_reason(fd: int, directory: str) -> Optional[str]:
+    """
+    Returns why an open cache file may have been written by another user, or
+    None if it is safe to unpickle: it must be owned by this user or root,
+    writable by nobody else, and not in a directory where others can replace
+    files.
+    """
+    if not hasattr(os, "geteuid"):  # pragma: no cover - platforms without POSIX ownership
+        return None
+    file_stat = os.fstat(fd)
+    if file_stat.st_uid not in (os.geteuid(), 0):
+        return f"it is owned by uid {file_stat.st_uid}"
+    if file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        return "it is writable by other users"
+    dir_mode = os.stat(directory).st_mode
+    if dir_mode & (stat.S_IWGRP | stat.S_IWOTH) and not dir_mode & stat.S_ISVTX:
+        return "its directory is writable by other users"
+    return None
+
+
+def _read_cached(cache_path: str) -> Optional[Tuple[Dict[str, Any], List[_FieldPlan]]]:
+    """
+    Returns the cached (definition, plan), or None if missing, unreadable or
+    untrusted. Loading a plan unpickles it, so files other users could have
+    written are skipped.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            reason = _untrusted_reason(f.fileno(), os.path.dirname(cache_path))
+            if reason is not None:
+                logger.warning(f"Ignoring schema cache {cache_path}: {reason}")
+                return None
+            version, definition, plan = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable schema cache {cache_path}: {e}")
+        return None
+    if version != _PLAN_CACHE_VERSION:
+        return None
+    return definition, plan
+
+
+def _write_cached(cache_path: str, definition: Dict[str, Any], plan: List[_FieldPlan]) -> None:
+    """
+    Atomically writes a cached plan and removes stale entries for the same
+    file. Failures (read-only file systems, unpicklable rules) are logged
+    and ignored; the schema simply compiles again on the next load.
+    """
+    directory, name = os.path.split(cache_path)
+    try:
+        os.makedirs(directory, mode=0o755, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((_PLAN_CACHE_VERSION, definition, plan), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.debug(f"Could not write schema cache {cache_path}: {e}")
+        return
+
+    prefix = name.rsplit("-", 1)[0]
+    for stale in glob.glob(os.path.join(glob.escape(directory), glob.escape(prefix) + "-*.plan")):
+        if stale != cache_path:
+            try:
+                os.unlink(stale)
+            except OSError:
+                pass
+
+
+def load_schema(
+    path: Union[str, "os.PathLike[str]"],
+    regex_mode: RegexMode = "match",
+    cache_dir: Optional[str] = None,
+    cache: bool = True,
+) -> Tuple[Schema, bool, float]:
+    """
+    Loads a schema file, using the on-disk plan cache when possible.
+
+    :param path: Path to a .json, .yaml or .yml schema file.
+    :param regex_mode: Default regex semantics for "regex" rules.
+    :param cache_dir: Directory for cached plans (see Schema.load).
+    :param cache: Set to False to bypass the disk cache.
+    :return: The schema, whether it came from the cache, and the load time in ms.
+    """
+    start_time = time.perf_counter()
+    path = os.fspath(path)
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    cache_path = _cache_file(path, raw, regex_mode, cache_dir) if cache else None
+    cached = _read_cached(cache_path) if cache_path is not None else None
+    if cached is not None:
+        definition, plan = cached
+        schema = Schema(definition, regex_mode=regex_mode, name=name, _plan=plan)
+    else:
+        definition = _definition_from_file(_parse(raw, path), path)
+        schema = Schema(definition, regex_mode=regex_mode, name=name)
+        if cache_path is not None:
+            _write_cached(cache_path, definition, schema._plan)
+
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    logger.debug(f"Loaded schema {path} ({'warm' if cached else 'cold'}) in {elapsed_ms:.2f}ms")
+    return schema, cached is not None, elapsed_ms
+
+
+class SchemaRegistry:
+    """
+    A collection of named schemas, usually loaded from a directory of schema
+    files. Load timings are kept separately for cold loads (compiled) and
+    warm loads (read from the plan cache).
+    """
+
+    def __init__(self):
+        self._schemas: Dict[str, Schema] = {}
+        self._load_stats = {"cold": 0, "warm": 0, "cold_ms": 0.0, "warm_ms": 0.0}
+
+    @classmethod
+    def load_dir(
+        cls,
+        directory: Union[str, "os.PathLike[str]"],
+        regex_mode: RegexMode = "match",
+        cache_dir: Optional[str] = None,
+        cache: bool = True,
+    ) -> "SchemaRegistry":
+        """
+        Loads every .json, .yaml and .yml file in a directory, naming each
+        schema after its file name without the suffix.
+
+        :param directory: The directory holding schema files.
+        :param regex_mode: Default regex semantics for "regex" rules.
+        :param cache_dir: Directory for cached plans (see Schema.load).
+        :param cache: Set to False to bypass the disk cache.
+        :return: The populated registry.
+        :raises ValueError: If two files map to the same schema name.
+        """
+        registry = cls()
+        for entry in sorted(os.listdir(directory)):
+            name, suffix = os.path.splitext(entry)
+            path = os.path.join(directory, entry)
+            if suffix.lower() not in _SUFFIXES or not os.path.isfile(path):
+                continue
+            if name in registry:
+                raise ValueError(f"Duplicate schema name '{name}' in {directory}")
+            registry.load(path, name, regex_mode, cache_dir, cache)
+
+        stats = registry.load_stats()
+        logger.info(
+            f"Loaded {len(registry)} schemas from {directory}: "
+            f"{stats['warm']} warm in {stats['warm_ms']:.1f}ms, {stats['cold']} cold in {stats['cold_ms']:.1f}ms"
+        )
+        return registry
+
+    def load(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        name: Optional[str] = None,
+        regex_mode: RegexMode = "match",
+        cache_dir: Optional[str] = None,
+        cache: bool = True,
+    ) -> Schema:
+        """
+        Loads one schema file into the registry.
+
+        :param path: Path to the schema file.
+        :param name: Registry name; defaults to the file name without suffix.
+        :return: The loaded Schema.
+        """
+        schema, warm, elapsed_ms = load_schema(path, regex_mode, cache_dir, cache)
+        kind = "warm" if warm else "cold"
+        self._load_stats[kind] += 1
+        self._load_stats[f"{kind}_ms"] += elapsed_ms
+        if name is not None:
+            schema.name = name
+        self.register(schema.name, schema)
+        return schema
+
+    def register(self, name: str, schema: Schema) -> None:
+        """Adds or replaces a schema under the given name, naming unnamed schemas after it."""
+        if schema.name is None:
+            schema.name = name
+        self._schemas[name] = schema
+
+    def load_stats(self) -> Dict[str, Union[int, float]]:
+        """Returns the number of cold and warm loads and their total time in ms."""
+        return dict(self._load_stats)
+
+    def get(self, name: str) -> Optional[Schema]:
+        return self._schemas.get(name)
+
+    def names(self) -> List[str]:
+        return list(self._schemas)
+
+    def __getitem__(self, name: str) -> Schema:
+        return self._schemas[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._schemas
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schemas)
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def __repr__(self) -> str:
+        return f"<SchemaRegistry schemas={len(self._schemas)}>"
@@ -0,0 +1,536 @@
+import math
+import threading
+import weakref
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Latency histogram layout: each power-of-two range of milliseconds is split
+# into _SUB_BUCKETS linear buckets, so a recorded value is off by at most
+# 1/64 of itself when read back (the bucket midpoint is reported). The range
+# covers about 1µs (2**-10 ms) to 35 minutes (2**21 ms); smaller values land
+# in the first bucket and larger ones in the last.
+_SUB_BUCKETS = 32
+_MIN_EXPONENT = -9
+_MAX_EXPONENT = 21
+_LOWEST = math.ldexp(0.5, _MIN_EXPONENT)
+_BUCKETS = (_MAX_EXPONENT - _MIN_EXPONENT + 1) * _SUB_BUCKETS
+
+# Quantiles reported by LatencyHistogram.summary(), health checks and Prometheus output
+QUANTILES: Tuple[Tuple[str, float], ...] = (("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("p999", 0.999))
+
+
+class TimingBuffer:
+    """
+    Fixed-capacity ring buffer holding the most recent validation timings.
+
+    Timings are stored in a preallocated array of doubles; once the buffer is
+    full each new timing overwrites the oldest one, so memory stays bounded
+    by ``capacity`` however long the process runs. A capacity of 0 keeps no
+    timings at all.
+    """
+    __slots__ = ("_data", "_head", "_count")
+
+    def __init__(self, capacity: int):
+        """
+        :param capacity: The maximum number of timings kept.
+        :raises ValueError: If capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError("capacity must be non-negative")
+        self._data = array("d", [0.0]) * capacity
+        self._head = 0  # Next write position
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def append(self, value: float) -> None:
+        """Records a timing, overwriting the oldest one when full."""
+        data = self._data
+        if not data:
+            return
+        head = self._head
+        data[head] = value
+        head += 1
+        self._head = 0 if head == len(data) else head
+        if self._count < len(data):
+            self._count += 1
+
+    def snapshot(self) -> array:
+        """
+        Returns the retained timings, oldest first, as a new array that is not
+        affected by later appends.
+        """
+        if self._count < len(self._data):
+            return self._data[:self._count]
+        return self._data[self._head:] + self._data[:self._head]
+
+    def extend(self, values: array) -> None:
+        """Records several timings in order, as if appended one by one."""
+        capacity = len(self._data)
+        if not capacity:
+            return
+        if len(values) > capacity:
+            values = values[len(values) - capacity:]
+        count = len(values)
+        head = self._head
+        first = min(count, capacity - head)
+        self._data[head:head + first] = values[:first]
+        if count > first:
+            self._data[:count - first] = values[first:]
+        self._head = (head + count) % capacity
+        self._count = min(self._count + count, capacity)
+
+    def resized(self, capacity: int) -> "TimingBuffer":
+        """
+        Returns a copy with a new capacity, keeping the most recent timings
+        that still fit. The copy replaces the buffer rather than resizing it
+        in place, so a thread appending concurrently never sees a half-resized
+        buffer.
+
+        :raises ValueError: If capacity is negative.
+        """
+        copy = TimingBuffer(capacity)
+        copy.extend(self.snapshot())
+        return copy
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"<TimingBuffer {self._count}/{len(self._data)}>"
+
+
+def _bucket_index(value: float) -> int:
+    if value < _LOWEST:
+        return 0
+    mantissa, exponent = math.frexp(value)
+    if exponent > _MAX_EXPONENT:
+        return _BUCKETS - 1
+    return (exponent - _MIN_EXPONENT) * _SUB_BUCKETS + int((mantissa - 0.5) * 2 * _SUB_BUCKETS)
+
+
+def _bucket_midpoint(index: int) -> float:
+    exponent, sub_bucket = divmod(index, _SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub_bucket + 0.5) / (2 * _SUB_BUCKETS), exponent + _MIN_EXPONENT)
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed (HDR-style) histogram of latencies in milliseconds.
+
+    Memory is fixed (one counter per bucket) regardless of how many values
+    are recorded, and quantiles are read from the buckets with a relative
+    error of about 1.5%; the exact maximum is tracked separately.
+    Histograms can be merged, e.g. to combine windows or processes.
+
+    Example:
+        histogram = LatencyHistogram()
+        histogram.record(1.7)
+        histogram.quantile(0.99)
+    """
+    __slots__ = ("_counts", "count", "total", "max")
+
+    def __init__(self):
+        self._counts = array("Q", [0]) * _BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Records one latency in milliseconds."""
+        self._counts[_bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the estimated latency at quantile ``q`` (0 to 1), or 0.0 if
+        nothing was recorded.
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """
+        Returns the estimated latency at each quantile in one pass over the
+        buckets.
+
+        :param qs: Quantiles between 0 and 1.
+        :raises ValueError: If a quantile is outside [0, 1].
+        """
+        qs = list(qs)
+        if any(not 0.0 <= q <= 1.0 for q in qs):
+            raise ValueError("quantiles must be between 0 and 1")
+        results = [0.0] * len(qs)
+        if not self.count:
+            return results
+
+        # Rank of each quantile, visited in increasing order
+        pending = sorted((max(1, math.ceil(q * self.count)), i) for i, q in enumerate(qs))
+        position = 0
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            while position < len(pending) and pending[position][0] <= seen:
+                results[pending[position][1]] = min(_bucket_midpoint(index), self.max)
+                position += 1
+            if position == len(pending):
+                break
+        return results
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """Returns the count, sum, mean, max and standard quantiles (p50 to p999) in ms."""
+        values = self.quantiles(q for _, q in QUANTILES)
+        summary = {"count": self.count, "sum_ms": self.total, "mean_ms": self.mean, "max_ms": self.max}
+        for (name, _), value in zip(QUANTILES, values):
+            summary[f"{name}_ms"] = value
+        return summary
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Adds the values recorded by another histogram to this one and returns it."""
+        counts = self._counts
+        for index, bucket_count in enumerate(other._counts):
+            if bucket_count:
+                counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        if other.max > self.max:
+            self.max = other.max
+        return self
+
+    def since(self, earlier: "LatencyHistogram") -> "LatencyHistogram":
+        """
+        Returns the values recorded after ``earlier``, a snapshot of this
+        histogram, was taken. Their maximum is estimated from the highest
+        bucket that grew, capped by this histogram's maximum.
+        """
+        late = LatencyHistogram()
+        highest = -1
+        for index, (now, before) in enumerate(zip(self._counts, earlier._counts)):
+            if now != before:
+                late._counts[index] = now - before
+                highest = index
+        late.count = self.count - earlier.count
+        late.total = self.total - earlier.total
+        if highest >= 0:
+            late.max = min(_bucket_midpoint(highest), self.max)
+        return late
+
+    def snapshot(self) -> "LatencyHistogram":
+        """Returns an independent copy of this histogram."""
+        copy = LatencyHistogram.__new__(LatencyHistogram)
+        copy._counts = array("Q", self._counts)
+        copy.count = self.count
+        copy.total = self.total
+        copy.max = self.max
+        return copy
+
+    def clear(self) -> None:
+        self._counts = array("Q", [0]) * _BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"<LatencyHistogram count={self.count} p50={self.quantile(0.5):.3f}ms max={self.max:.3f}ms>"
+
+
+class MetricSeries:
+    """Call, failure and sampling-skip counters plus a latency histogram for one label set."""
+    __slots__ = ("calls", "failures", "sampling_skips", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.sampling_skips = 0
+        self.latency = LatencyHistogram()
+
+    def merge(self, other: "MetricSeries") -> None:
+        self.calls += other.calls
+        self.failures += other.failures
+        self.sampling_skips += other.sampling_skips
+        self.latency.merge(other.latency)
+
+    def __repr__(self) -> str:
+        return f"<MetricSeries calls={self.calls} failures={self.failures} skips={self.sampling_skips}>"
+
+
+class ValidatorSeries:
+    """Call count, evaluation count and cumulative time in seconds of one validator function."""
+    __slots__ = ("calls", "evaluations", "time")
+
+    def __init__(self):
+        self.calls = 0
+        self.evaluations = 0
+        self.time = 0.0
+
+    def merge(self, other: "ValidatorSeries") -> None:
+        self.calls += other.calls
+        self.evaluations += other.evaluations
+        self.time += other.time
+
+
+class MetricShard:
+    """
+    The validation metrics recorded by one thread, or merged from several.
+
+    Labeled series are keyed by the ids handed out by
+    ShardedMetrics.label_id(); validator series by the validator's
+    module-qualified name.
+
+    When a latency window is reset, the replaced histogram is kept with a
+    snapshot of what the window reported: the owning thread may still be
+    recording into it, and those late values belong to the next window.
+    """
+    __slots__ = (
+        "calls", "failures", "batches", "sampling_skips", "timings", "latency", "labeled", "validators",
+        "_previous", "_owner",
+    )
+
+    def __init__(self, history: int, owner: Optional[threading.Thread] = None):
+        """
+        :param history: Capacity of the timing ring buffer.
+        :param owner: The thread writing to this shard, if any.
+        """
+        self.calls = 0
+        self.failures = 0
+        self.batches = 0
+        self.sampling_skips = 0
+        self.timings = TimingBuffer(history)
+        self.latency = LatencyHistogram()
+        self.labeled: Dict[int, MetricSeries] = {}
+        self.validators: Dict[str, ValidatorSeries] = {}
+        # (replaced latency histogram, snapshot of it already reported)
+        self._previous: Optional[Tuple[LatencyHistogram, LatencyHistogram]] = None
+        self._owner = weakref.ref(owner) if owner is not None else None
+
+    def series(self, series_id: int) -> MetricSeries:
+        """Returns the labeled series with the given id, creating it on first use."""
+        series = self.labeled.get(series_id)
+        if series is None:
+            series = self.labeled[series_id] = MetricSeries()
+        return series
+
+    def validator(self, name: str) -> ValidatorSeries:
+        """Returns the series of a validator function, creating it on first use."""
+        series = self.validators.get(name)
+        if series is None:
+            series = self.validators[name] = ValidatorSeries()
+        return series
+
+    def record(self, elapsed_ms: float) -> None:
+        """Records one validation (or batch) timing."""
+        self.timings.append(elapsed_ms)
+        self.latency.record(elapsed_ms)
+
+    def late_latency(self) -> Optional[LatencyHistogram]:
+        """Returns the values recorded into the replaced histogram after its window was reported."""
+        if self._previous is None:
+            return None
+        replaced, reported = self._previous
+        return replaced.since(reported)
+
+    def reset_latency(self) -> LatencyHistogram:
+        """
+        Starts a new latency window and returns the one it closes, including
+        late values of the window before. Call with the ShardedMetrics lock held.
+        """
+        window = LatencyHistogram()
+        late = self.late_latency()
+        if late is not None:
+            window.merge(late)
+        replaced = self.latency
+        self.latency = LatencyHistogram()
+        reported = replaced.snapshot()
+        self._previous = (replaced, reported)
+        return window.merge(reported)
+
+    @property
+    def alive(self) -> bool:
+        """Whether the owning thread may still write to this shard."""
+        owner = self._owner() if self._owner is not None else None
+        return owner is not None and owner.is_alive()
+
+    def merge(self, other: "MetricShard") -> "MetricShard":
+        """Adds another shard's metrics to this one and returns it."""
+        self.calls += other.calls
+        self.failures += other.failures
+        self.batches += other.batches
+        self.sampling_skips += other.sampling_skips
+        self.timings.extend(other.timings.snapshot())
+        self.latency.merge(other.latency)
+        late = other.late_latency()
+        if late is not None:
+            self.latency.merge(late)
+        # Copied first: the owning thread may add series while we iterate
+        for series_id, series in other.labeled.copy().items():
+            self.series(series_id).merge(series)
+        for name, series in other.validators.copy().items():
+            self.validator(name).merge(series)
+        return self
+
+
+# Labels of a series: (module-qualified function name, schema name, "input" or "output")
+MetricKey = Tuple[str, str, str]
+
+
+class ShardedMetrics:
+    """
+    Validation metrics collected in per-thread shards.
+
+    Each thread records into its own MetricShard, found through a
+    thread-local, so the hot path takes no lock and no count is lost to
+    concurrent read-modify-write updates, with or without a GIL. collect()
+    merges the shards on read; shards of threads that have finished are
+    folded into a retired shard at that point so their memory is released
+    while their counts are kept.
+
+    Labeled series are addressed by integer ids from label_id(), which
+    decorators resolve once when they are applied.
+    """
+
+    def __init__(self, history: int):
+        """
+        :param history: Timing ring buffer capacity (max_metrics_history).
+        """
+        # Guards shard registration, collection and resets; never taken when recording
+        self._lock = threading.Lock()
+        self._history = history
+        self._labels: List[MetricKey] = []
+        self._label_ids: Dict[MetricKey, int] = {}
+        self._start()
+
+    def _start(self) -> None:
+        self._local = threading.local()
+        self._shards: List[MetricShard] = []
+        self._retired = MetricShard(self._history)
+
+    def shard(self) -> MetricShard:
+        """Returns the calling thread's shard, creating it on first use."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            pass
+        shard = MetricShard(self._history, threading.current_thread())
+        with self._lock:
+            self._local.shard = shard
+            self._shards.append(shard)
+        return shard
+
+    def label_id(self, function: str, schema: str, direction: str) -> int:
+        """Returns the id of a label set, assigning one on first use."""
+        key = (function, schema, direction)
+        with self._lock:
+            series_id = self._label_ids.get(key)
+            if series_id is None:
+                series_id = self._label_ids[key] = len(self._labels)
+                self._labels.append(key)
+        return series_id
+
+    def collect(self) -> MetricShard:
+        """Merges every shard into a new MetricShard."""
+        with self._lock:
+            live = []
+            for shard in self._shards:
+                if shard.alive:
+                    live.append(shard)
+                else:
+                    self._retired.merge(shard)
+            self._shards = live
+            total = MetricShard(self._history).merge(self._retired)
+            for shard in live:
+                total.merge(shard)
+        return total
+
+    def labeled_rows(self, total: MetricShard) -> List[Dict[str, Any]]:
+        """
+        Returns the labels, counters and latency summary of every series in a
+        collected shard that recorded anything, sorted by label.
+        """
+        rows = []
+        for series_id, series in total.labeled.items():
+            if not (series.calls or series.failures or series.sampling_skips):
+                continue
+            function, schema, direction = self._labels[series_id]
+            rows.append({
+                "function": function,
+                "schema": schema,
+                "direction": direction,
+                "calls": series.calls,
+                "failures": series.failures,
+                "sampling_skips": series.sampling_skips,
+                "latency": series.latency.summary(),
+            })
+        rows.sort(key=lambda row: (row["function"], row["schema"], row["direction"]))
+        return rows
+
+    @staticmethod
+    def validator_rows(total: MetricShard) -> Dict[str, Dict[str, Any]]:
+        """Returns call counts, memo hits and cumulative time per validator that ran."""
+        return {
+            name: {
+                "calls": series.calls,
+                "cache_hits": series.calls - series.evaluations,
+                "time_ms": series.time * 1000,
+            }
+            for name, series in total.validators.items()
+            if series.calls
+        }
+
+    def latency(self, reset: bool = False) -> LatencyHistogram:
+        """
+        Merges the latency histograms of all shards. With ``reset=True`` each
+        shard starts a new histogram, so successive calls return
+        non-overlapping windows. A value recorded while its window is being
+        reset is counted in the next window, so no value is lost.
+        """
+        total = LatencyHistogram()
+        with self._lock:
+            for shard in [self._retired, *self._shards]:
+                if reset:
+                    total.merge(shard.reset_latency())
+                    continue
+                total.merge(shard.latency)
+                late = shard.late_latency()
+                if late is not None:
+                    total.merge(late)
+        return total
+
+    def resize(self, history: int) -> None:
+        """Changes the timing history of every shard, keeping the newest timings."""
+        with self._lock:
+            self._history = history
+            for shard in [self._retired, *self._shards]:
+                shard.timings = shard.timings.resized(history)
+
+    def reinit(self) -> None:
+        """
+        Discards all recorded metrics after a fork. The lock is replaced too,
+        since another thread of the parent may have held it when forking.
+        """
+        self._lock = threading.Lock()
+        self._start()
+
+    def reset(self) -> None:
+        """
+        Discards all recorded metrics. Threads start new shards on their next
+        record; label ids stay valid.
+        """
+        with self._lock:
+            self._start()
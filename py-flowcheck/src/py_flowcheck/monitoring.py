@@ -1,7 +1,9 @@
 import time
 from typing import Dict, Any, Optional
 from py_flowcheck.decorators import get_metrics
+from py_flowcheck.metrics import QUANTILES
 from py_flowcheck.config import get_config
+from py_flowcheck.json_backend import BACKEND as JSON_BACKEND
 
 class HealthChecker:
     """Health check utilities for py-flowcheck in production."""
@@ -19,11 +21,7 @@ class HealthChecker:
         total_calls = metrics["validation_calls"]
         failures = metrics["validation_failures"]
         success_rate = ((total_calls - failures) / total_calls * 100) if total_calls > 0 else 100
-        
-        avg_time = (
-            sum(metrics["validation_time_ms"]) / len(metrics["validation_time_ms"])
-            if metrics["validation_time_ms"] else 0
-        )
+        latency = metrics["validation_latency"]
         
         status = {
             "status": "healthy" if success_rate >= 95 else "degraded" if success_rate >= 90 else "unhealthy",
@@ -33,11 +31,29 @@ class HealthChecker:
                 "sample_size": config.sample_size,
                 "mode": config.mode
             },
+            "json_backend": JSON_BACKEND,
             "metrics": {
                 "total_validations": total_calls,
+                "workers": metrics["workers"],
                 "success_rate_percent": round(success_rate, 2),
-                "average_time_ms": round(avg_time, 3),
-                "sampling_skips": metrics["sampling_skips"]
+                "average_time_ms": round(latency["mean_ms"], 3),
+                **{f"{name}_time_ms": round(latency[f"{name}_ms"], 3) for name, _ in QUANTILES},
+                "max_time_ms": round(latency["max_ms"], 3),
+                "sampling_skips": metrics["sampling_skips"],
+                "by_label": [
+                    {
+                        "function": row["function"],
+                        "schema": row["schema"],
+                        "direction": row["direction"],
+                        "total_validations": row["calls"],
+                        "failures": row["failures"],
+                        "sampling_skips": row["sampling_skips"],
+                        "average_time_ms": round(row["latency"]["mean_ms"], 3),
+                        "p99_time_ms": round(row["latency"]["p99_ms"], 3),
+                        "max_time_ms": round(row["latency"]["max_ms"], 3),
+                    }
+                    for row in metrics["labeled"]
+                ]
             }
         }
         
@@ -56,4 +72,66 @@ def get_health_status() -> Dict[str, Any]:
 
 def is_healthy() -> bool:
     """Check if py-flowcheck is healthy."""
-    return health_checker.is_healthy()
\ No newline at end of file
+    return health_checker.is_healthy()
+
+def _labels(row: Dict[str, Any]) -> str:
+    """Render the function, schema and direction of a labeled row as Prometheus labels."""
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return ",".join(f'{label}="{escape(row[label])}"' for label in ("function", "schema", "direction"))
+
+def get_prometheus_metrics() -> str:
+    """
+    Render validation metrics in the Prometheus text exposition format.
+
+    Latency is exported as a summary with p50/p90/p99/p999 quantiles read
+    from the latency histogram, next to the success rate and mean latency
+    gauges listed in PRODUCTION.md. Decorated functions are additionally
+    exported per function, schema and direction under
+    ``py_flowcheck_function_*``.
+    """
+    metrics = get_metrics()
+    latency = metrics["validation_latency"]
+    total_calls = metrics["validation_calls"]
+    success_rate = ((total_calls - metrics["validation_failures"]) / total_calls * 100) if total_calls > 0 else 100
+    lines = [
+        "# TYPE py_flowcheck_validation_calls_total counter",
+        f"py_flowcheck_validation_calls_total {metrics['validation_calls']}",
+        "# TYPE py_flowcheck_validation_failures_total counter",
+        f"py_flowcheck_validation_failures_total {metrics['validation_failures']}",
+        "# TYPE py_flowcheck_sampling_skips_total counter",
+        f"py_flowcheck_sampling_skips_total {metrics['sampling_skips']}",
+        "# TYPE py_flowcheck_success_rate_percent gauge",
+        f"py_flowcheck_success_rate_percent {success_rate}",
+        "# TYPE py_flowcheck_avg_validation_time_ms gauge",
+        f"py_flowcheck_avg_validation_time_ms {latency['mean_ms']}",
+        "# TYPE py_flowcheck_validation_latency_ms summary",
+    ]
+    for name, q in QUANTILES:
+        lines.append(f'py_flowcheck_validation_latency_ms{{quantile="{q}"}} {latency[f"{name}_ms"]}')
+    lines.append(f"py_flowcheck_validation_latency_ms_sum {latency['sum_ms']}")
+    lines.append(f"py_flowcheck_validation_latency_ms_count {latency['count']}")
+    lines.append("# TYPE py_flowcheck_validation_latency_max_ms gauge")
+    lines.append(f"py_flowcheck_validation_latency_max_ms {latency['max_ms']}")
+
+    labeled = metrics["labeled"]
+    if labeled:
+        for family, field in (("calls", "calls"), ("failures", "failures"), ("sampling_skips", "sampling_skips")):
+            lines.append(f"# TYPE py_flowcheck_function_validation_{family}_total counter")
+            for row in labeled:
+                lines.append(f"py_flowcheck_function_validation_{family}_total{{{_labels(row)}}} {row[field]}")
+        lines.append("# TYPE py_flowcheck_function_validation_latency_ms summary")
+        for row in labeled:
+            labels = _labels(row)
+            for name, q in QUANTILES:
+                lines.append(
+                    f'py_flowcheck_function_validation_latency_ms{{{labels},quantile="{q}"}} {row["latency"][f"{name}_ms"]}'
+                )
+            lines.append(f"py_flowcheck_function_validation_latency_ms_sum{{{labels}}} {row['latency']['sum_ms']}")
+            lines.append(f"py_flowcheck_function_validation_latency_ms_count{{{labels}}} {row['latency']['count']}")
+
+    lines.append("# TYPE py_flowcheck_workers gauge")
+    lines.append(f"py_flowcheck_workers {metrics['workers']}")
+    lines.append("# TYPE py_flowcheck_uptime_seconds gauge")
+    lines.append(f"py_flowcheck_uptime_seconds {time.time() - health_checker.start_time}")
+    return "\n".join(lines) + "\n"
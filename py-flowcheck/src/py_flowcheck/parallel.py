@@ -0,0 +1,375 @@
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union, TYPE_CHECKING
+from py_flowcheck.schema import Schema, BatchResult, Violation
+
+if TYPE_CHECKING:
+    from py_flowcheck.columnar import ColumnarResult
+
+# The schema each worker process validates against, set once by _init_worker
+_worker_schema: Optional[Schema] = None
+
+# Shared memory blocks this worker has attached to, by name
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+
+# Result of one chunk: (chunk position, valid flags, violations by index within the chunk)
+_ChunkResult = Tuple[int, bytearray, Dict[int, List[Violation]]]
+
+
+def _init_worker(schema: Schema) -> None:
+    """
+    Process pool initializer: receives the schema once per worker and turns
+    off metrics there, since the parent records each run as one batch.
+    """
+    global _worker_schema
+    _worker_schema = schema
+    from py_flowcheck.decorators import _disable_recording
+    _disable_recording()
+
+
+def _attach(name: str) -> memoryview:
+    """Returns the buffer of a shared memory block, attaching on first use."""
+    block = _attached.get(name)
+    if block is None:
+        block = _attached[name] = shared_memory.SharedMemory(name=name)
+    return block.buf
+
+
+def _flatten_paths(errors: Dict[int, List[Violation]]) -> Dict[int, List[Violation]]:
+    for violations in errors.values():
+        for violation in violations:
+            # Render linked paths now so violations pickle as flat strings
+            violation.path
+    return errors
+
+
+def _map_chunks(
+    schema: Schema,
+    workers: Optional[int],
+    func: Callable[..., Any],
+    tasks: Iterator[Tuple[Any, ...]],
+) -> Iterator[Any]:
+    """
+    Runs ``func(*task)`` for each task on a process pool whose workers hold
+    the schema, keeping at most two tasks per worker in flight so tasks are
+    produced lazily. Yields results in completion order.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(schema,)) as pool:
+        pending = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < workers * 2:
+                task = next(tasks, None)
+                if task is None:
+                    exhausted = True
+                    break
+                pending.add(pool.submit(func, *task))
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def _merge_chunks(results: Iterable[_ChunkResult]) -> BatchResult:
+    """Concatenates chunk results in chunk order, offsetting their record indices."""
+    valid = bytearray()
+    failures: Dict[int, List[Violation]] = {}
+    for _, chunk_valid, errors in sorted(results, key=lambda result: result[0]):
+        offset = len(valid)
+        for index, violations in errors.items():
+            failures[offset + index] = violations
+        valid += chunk_valid
+    return BatchResult(valid, failures)
+
+
+def _validate_chunk(
+    position: int,
+    records: List[Dict[str, Any]],
+    fail_fast: Optional[bool],
+    max_violations: Optional[int],
+) -> _ChunkResult:
+    """Validates one chunk of records in a worker process."""
+    result = _worker_schema.validate_many(records, fail_fast=fail_fast, max_violations=max_violations)
+    return position, result.valid, _flatten_paths(result.errors)
+
+
+def validate_parallel(
+    schema: Schema,
+    records: Iterable[Dict[str, Any]],
+    workers: Optional[int] = None,
+    chunk_size: int = 10000,
+    fail_fast: Optional[bool] = None,
+    max_violations: Optional[int] = None,
+) -> BatchResult:
+    """
+    Validates records across a pool of worker processes.
+
+    The schema is sent to each worker once, when the pool starts; records are
+    read from ``records`` in chunks of ``chunk_size`` with at most two chunks
+    per worker in flight, so a generator is never materialized whole. Results
+    are merged with their original record indices and a single aggregated
+    metrics entry is recorded, as with Schema.validate_many().
+
+    With the "spawn" or "forkserver" start methods the schema is pickled, so
+    any "validator" functions must be importable (not lambdas).
+
+    :param schema: The Schema to validate against.
+    :param records: The records to validate.
+    :param workers: Number of worker processes; defaults to the CPU count.
+    :param chunk_size: Records sent to a worker per task.
+    :param fail_fast: Stop at the first violation of each record.
+    :param max_violations: Stop after this many violations per record.
+    :return: A BatchResult with per-record valid flags and violations by index.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    start_time = time.perf_counter()
+    iterator = iter(records)
+
+    def tasks() -> Iterator[Tuple[Any, ...]]:
+        position = 0
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield position, chunk, fail_fast, max_violations
+            position += 1
+
+    result = _merge_chunks(_map_chunks(schema, workers, _validate_chunk, tasks()))
+
+    from py_flowcheck.decorators import _record_batch
+    _record_batch(len(result), len(result.errors), (time.perf_counter() - start_time) * 1000)
+    return result
+
+
+def _validate_jsonl_chunk(
+    position: int,
+    name: str,
+    start: int,
+    end: int,
+    fail_fast: Optional[bool],
+    max_violations: Optional[int],
+) -> _ChunkResult:
+    """Parses and validates the JSON Lines in bytes [start, end) of a shared block."""
+    schema = _worker_schema
+    collect = schema._collect
+    new_violations = schema._new_violations
+    loads = json.loads
+    valid = bytearray()
+    errors: Dict[int, List[Violation]] = {}
+
+    # Decoded straight from shared memory; only the result travels back
+    data = _attach(name)[start:end]
+    try:
+        lines = str(data, "utf-8").split("\n")
+    except UnicodeDecodeError:
+        # Decode line by line so that only the malformed lines are rejected
+        lines = bytes(data).split(b"\n")
+    del data
+
+    for raw in lines:
+        if not raw.strip():
+            continue
+        try:
+            record = loads(raw)
+        except ValueError as e:
+            violations = [Violation(None, "invalid_json", actual=e)]
+        else:
+            if type(record) is dict:
+                violations = new_violations(fail_fast, max_violations)
+                collect(record, violations)
+            else:
+                violations = [Violation(None, "record_type", dict, type(record))]
+
+        if violations:
+            errors[len(valid)] = violations
+            valid.append(0)
+        else:
+            valid.append(1)
+
+    return position, valid, _flatten_paths(errors)
+
+
+def _line_chunks(buffer: memoryview, size: int, chunk_bytes: int) -> Iterator[Tuple[int, int]]:
+    """Splits a buffer into [start, end) ranges of about chunk_bytes ending on line breaks."""
+    start = 0
+    while start < size:
+        end = min(start + chunk_bytes, size)
+        while end < size:
+            window = bytes(buffer[end:end + 4096])
+            newline = window.find(b"\n")
+            if newline >= 0:
+                end += newline + 1
+                break
+            end += len(window)
+        yield start, end
+        start = end
+
+
+def validate_jsonl_parallel(
+    schema: Schema,
+    source: Union[str, "os.PathLike[str]", bytes, bytearray, memoryview],
+    workers: Optional[int] = None,
+    chunk_bytes: int = 1 << 20,
+    fail_fast: Optional[bool] = None,
+    max_violations: Optional[int] = None,
+) -> BatchResult:
+    """
+    Validates a JSON Lines file or buffer across worker processes.
+
+    The raw bytes are placed once in a shared memory block (a file is read
+    straight into it). Workers decode and validate line-aligned slices of the
+    block in place, so only byte offsets are sent to them and only the valid
+    flags and violations come back; records are never pickled.
+
+    :param schema: The Schema to validate against.
+    :param source: A path to a JSON Lines file, or its raw bytes.
+    :param workers: Number of worker processes; defaults to the CPU count.
+    :param chunk_bytes: Approximate size of the slice each task validates.
+    :param fail_fast: Stop at the first violation of each record.
+    :param max_violations: Stop after this many violations per record.
+    :return: A BatchResult indexed by record (non-blank line) position.
+    """
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be at least 1")
+    start_time = time.perf_counter()
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        size = memoryview(source).nbytes
+    else:
+        size = os.path.getsize(source)
+
+    if size == 0:
+        result = BatchResult(bytearray(), {})
+    else:
+        block = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            buffer = block.buf
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                buffer[:size] = memoryview(source).cast("B")
+            else:
+                with open(source, "rb") as f:
+                    filled = 0
+                    while filled < size:
+                        read = f.readinto(buffer[filled:size])
+                        if not read:
+                            break
+                        filled += read
+
+            tasks = (
+                (position, block.name, start, end, fail_fast, max_violations)
+                for position, (start, end) in enumerate(_line_chunks(buffer, size, chunk_bytes))
+            )
+            result = _merge_chunks(_map_chunks(schema, workers, _validate_jsonl_chunk, tasks))
+        finally:
+            block.close()
+            block.unlink()
+
+    from py_flowcheck.decorators import _record_batch
+    _record_batch(len(result), len(result.errors), (time.perf_counter() - start_time) * 1000)
+    return result
+
+
+# Column sent to workers: ("shared", block name, dtype, length) or ("inline", array)
+_ColumnSpec = Tuple[Any, ...]
+
+
+def _validate_columns_chunk(specs: Dict[str, _ColumnSpec], start: int, stop: int) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+    """Validates rows [start, stop) of shared columns, returning local row indices."""
+    import numpy as np
+    from py_flowcheck.columnar import validate_columns
+
+    columns = {}
+    for name, spec in specs.items():
+        if spec[0] == "shared":
+            _, block_name, dtype, length = spec
+            columns[name] = np.ndarray((length,), dtype=dtype, buffer=_attach(block_name))[start:stop]
+        else:
+            columns[name] = spec[1]
+    result, _ = validate_columns(_worker_schema._plan, columns)
+    return start, result.violations
+
+
+def validate_columns_parallel(
+    schema: Schema,
+    columns: Mapping[str, Any],
+    workers: Optional[int] = None,
+    chunk_rows: int = 100000,
+) -> "ColumnarResult":
+    """
+    Validates columnar data across worker processes.
+
+    Columns with a native NumPy dtype (numbers, booleans, fixed-width
+    strings) are copied once into shared memory blocks and workers validate
+    zero-copy views of row ranges; object columns are sent per chunk.
+    Workers return only the offending row indices. Requires numpy.
+
+    :param schema: The Schema to validate against.
+    :param columns: Mapping of field name to a list or 1-D NumPy array.
+    :param workers: Number of worker processes; defaults to the CPU count.
+    :param chunk_rows: Rows validated per task.
+    :return: A ColumnarResult with offending row indices per field and rule.
+    """
+    from py_flowcheck.columnar import ColumnarResult, _NATIVE_KINDS, _as_array, _require_numpy
+    _require_numpy()
+    import numpy as np
+
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be at least 1")
+    start_time = time.perf_counter()
+
+    arrays = {name: _as_array(name, column) for name, column in columns.items()}
+    lengths = {len(array) for array in arrays.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"All columns must have the same length, got {sorted(lengths)}")
+    num_rows = lengths.pop() if lengths else 0
+
+    blocks: List[shared_memory.SharedMemory] = []
+    try:
+        shared: Dict[str, _ColumnSpec] = {}
+        for name, array in arrays.items():
+            if array.dtype.kind in _NATIVE_KINDS and array.nbytes:
+                block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+                blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+                shared[name] = ("shared", block.name, array.dtype.str, len(array))
+
+        def tasks() -> Iterator[Tuple[Any, ...]]:
+            for start in range(0, num_rows, chunk_rows):
+                stop = min(start + chunk_rows, num_rows)
+                specs = {
+                    name: shared.get(name) or ("inline", array[start:stop])
+                    for name, array in arrays.items()
+                }
+                yield specs, start, stop
+
+        merged: Dict[str, Dict[str, List[Any]]] = {}
+        for start, violations in _map_chunks(schema, workers, _validate_columns_chunk, tasks()):
+            for field, rules in violations.items():
+                for code, rows in rules.items():
+                    merged.setdefault(field, {}).setdefault(code, []).append(rows + start)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    if num_rows == 0:
+        # No chunks ran; validate the empty columns for the "required" rule
+        from py_flowcheck.columnar import validate_columns
+        result, _ = validate_columns(schema._plan, arrays)
+    else:
+        result = ColumnarResult(num_rows, {
+            field: {code: np.sort(np.concatenate(parts)) for code, parts in rules.items()}
+            for field, rules in merged.items()
+        })
+
+    from py_flowcheck.decorators import _record_batch
+    _record_batch(result.num_rows, len(result.invalid_rows), (time.perf_counter() - start_time) * 1000)
+    return result
@@ -1,36 +1,1222 @@
 import re
 import os
+import asyncio
+import inspect
+import logging
 import functools
-from typing import Any, Dict, Callable, Optional, List, Union
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from itertools import count, repeat
+from collections.abc import Mapping
+from typing import Any, Dict, Callable, Optional, List, Union, Pattern, Tuple, Literal, Iterable, Iterator, TYPE_CHECKING
+from py_flowcheck.config import get_config
+from py_flowcheck.json_backend import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from py_flowcheck.columnar import ColumnarResult
+
+RegexMode = Literal["match", "fullmatch"]
+
+def _type_name(value_type: Any) -> str:
+    if isinstance(value_type, tuple):
+        return " or ".join(_type_name(item) for item in value_type)
+    return getattr(value_type, "__name__", str(value_type))
+
+
+# Renders the human-readable message for each violation code
+_MESSAGES: Dict[str, Callable[["Violation"], str]] = {
+    "required": lambda v: f"Field '{v.path}' is required but missing",
+    "type": lambda v: f"Field '{v.path}' must be of type {_type_name(v.expected)}, got {_type_name(v.actual)}",
+    "pattern": lambda v: f"Field '{v.path}' does not match the required pattern",
+    "min": lambda v: f"Field '{v.path}' must be at least {v.expected}",
+    "max": lambda v: f"Field '{v.path}' must be at most {v.expected}",
+    "enum": lambda v: f"Field '{v.path}' must be one of {v.expected}",
+    "min_length": lambda v: f"Field '{v.path}' must be at least {v.expected} characters",
+    "max_length": lambda v: f"Field '{v.path}' must be at most {v.expected} characters",
+    "custom": lambda v: f"Field '{v.path}' failed custom validation",
+    "custom_error": lambda v: f"Field '{v.path}' custom validation error: {v.actual}",
+    "record_type": lambda v: f"Record must be of type dict, got {_type_name(v.actual)}",
+    "invalid_json": lambda v: f"Invalid JSON: {v.actual}",
+    "discriminator": lambda v: f"Field '{v.path}' must be one of {v.expected}, got {v.actual!r}",
+    "any_of": lambda v: f"Field '{v.path}' does not match any of the {v.expected} allowed schemas",
+    "one_of": lambda v: (
+        f"Field '{v.path}' does not match any of the {v.expected} allowed schemas" if not v.actual
+        else f"Field '{v.path}' matches {v.actual} of the {v.expected} allowed schemas, expected exactly one"
+    ),
+}
+
+
+# A nested field path: a (parent path, key) tuple linked to its parent
+# instead of a concatenated string, so descending one level costs O(1)
+# regardless of depth. Top-level paths are plain strings. It is rendered to a
+# string such as ``user.tags[3]`` only when a violation's path is read.
+_Path = Tuple[Any, Union[str, int]]
+
+
+def _render_path(path: Union[str, _Path]) -> str:
+    """Renders a linked path such as (("user", "tags"), 3) as ``user.tags[3]``."""
+    parts = []
+    while type(path) is tuple:
+        path, key = path
+        parts.append(f"[{key}]" if type(key) is int else "." + key)
+    parts.append(path)
+    parts.reverse()
+    return "".join(parts)
+
+
+class Violation:
+    """
+    A single structured rule violation.
+
+    Violations are cheap to create: the human-readable message is only
+    rendered when ``message`` (or ``str()``) is used.
+
+    :ivar path: Field path such as ``user.tags[3]``, or None for record-level violations.
+    :ivar code: Machine-readable rule code, e.g. "required", "type", "min".
+    :ivar expected: The rule's expected value (type, bound, choices), if any.
+    :ivar actual: The offending value's type, or the raised error for "custom_error".
+    """
+    __slots__ = ("_path", "code", "expected", "actual")
+
+    def __init__(self, path: Union[str, _Path, None], code: str, expected: Any = None, actual: Any = None):
+        self._path = path
+        self.code = code
+        self.expected = expected
+        self.actual = actual
+
+    @property
+    def path(self) -> Optional[str]:
+        path = self._path
+        if path is not None and type(path) is not str:
+            path = self._path = _render_path(path)
+        return path
+
+    @property
+    def message(self) -> str:
+        return _MESSAGES[self.code](self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a JSON-friendly representation of the violation."""
+        expected, actual = self.expected, self.actual
+        if isinstance(expected, (type, tuple)):
+            expected = _type_name(expected)
+        if isinstance(actual, type):
+            actual = _type_name(actual)
+        elif isinstance(actual, Exception):
+            actual = str(actual)
+        return {
+            "path": self.path,
+            "code": self.code,
+            "expected": expected,
+            "actual": actual,
+            "message": self.message,
+        }
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"<Violation {self.code} at {self.path!r}>"
+
+
+def _render(violations: List[Union[Violation, str]]) -> List[str]:
+    return [str(violation) for violation in violations]
+
 
 class ValidationError(Exception):
     """
     Custom exception raised when schema validation fails.
+
+    ``errors`` holds the structured violations; ``violations`` renders them
+    as human-readable strings on first access and can be reassigned, e.g.
+    to filter the messages before re-raising.
     """
-    def __init__(self, message: str, violations: Optional[List[str]] = None):
+    def __init__(self, message: str, violations: Optional[List[Union[Violation, str]]] = None):
         super().__init__(message)
-        self.violations = violations or []
+        self.errors = violations or []
+        self._rendered: Optional[List[str]] = None
+
+    @property
+    def violations(self) -> List[str]:
+        if self._rendered is None:
+            self._rendered = _render(self.errors)
+        return self._rendered
+
+    @violations.setter
+    def violations(self, violations: List[str]) -> None:
+        self._rendered = violations
+
+
+class _StopValidation(Exception):
+    """Raised internally once the violation limit has been reached."""
+
+
+class _LimitedViolations(list):
+    """
+    A violations list that stops validation once it holds ``limit`` entries.
+
+    Only used when fail_fast or max_violations is set, so unlimited
+    validation keeps appending to a plain list.
+    """
+    __slots__ = ("limit",)
+
+    def __init__(self, limit: int):
+        super().__init__()
+        self.limit = limit
+
+    def append(self, violation: Violation) -> None:
+        super().append(violation)
+        if len(self) >= self.limit:
+            raise _StopValidation
+
+    def __reduce__(self):
+        # Unpickling would replay append() and hit the limit; a plain list suffices
+        return (list, (list(self),))
+
+
+class _DeferredViolations(list):
+    """
+    Violations list used by Schema.avalidate(): async validator checks are
+    queued on ``pending`` instead of being called, and awaited together once
+    the synchronous rules have run.
+    """
+
+    def __init__(self, limit: Optional[int]):
+        super().__init__()
+        self.limit = limit
+        self.pending: List[Tuple["_AsyncValidatorCheck", Any, Union[str, "_Path"]]] = []
+
+    def append(self, violation: Violation) -> None:
+        super().append(violation)
+        if self.limit is not None and len(self) >= self.limit:
+            raise _StopValidation
+
+
+class _PatternCache:
+    """
+    A bounded, thread-safe LRU cache of compiled regex patterns shared by all
+    schemas in the process, keyed by (pattern, flags).
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._patterns: "OrderedDict[Tuple[str, int], Pattern]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, pattern: str, flags: int = 0) -> Pattern:
+        """
+        Returns the compiled pattern, compiling and caching it on a miss.
+
+        :param pattern: The regex source.
+        :param flags: The re module flags to compile with.
+        :return: The compiled pattern.
+        """
+        key = (pattern, flags)
+        with self._lock:
+            compiled = self._patterns.get(key)
+            if compiled is not None:
+                self._patterns.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent duplicate compile is harmless
+        compiled = re.compile(pattern, flags)
+        with self._lock:
+            self._patterns[key] = compiled
+            self._patterns.move_to_end(key)
+            while len(self._patterns) > self.maxsize:
+                self._patterns.popitem(last=False)
+        return compiled
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit/miss counters and the current cache size."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._patterns)}
+
+    def reset_stats(self) -> None:
+        """Resets the hit/miss counters without evicting patterns."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def clear(self) -> None:
+        """Evicts every cached pattern."""
+        with self._lock:
+            self._patterns.clear()
+
+
+# Process-wide regex cache used when compiling "regex" rules
+_pattern_cache = _PatternCache()
+
+
+# Scalar types whose value fully determines the validation verdict
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None), bytes))
+
+
+def _payload_key(data: Any, max_items: int) -> Optional[Tuple[Any, ...]]:
+    """
+    Builds a structural cache key for a payload: a flat pre-order encoding of
+    every container's type and length and every scalar's type and value, so
+    ``1``, ``1.0`` and ``True`` never collide. Returns None when the payload
+    holds more than ``max_items`` values or a value that is not a plain
+    scalar, dict, list or tuple.
+    """
+    tokens: List[Any] = []
+    append = tokens.append
+    stack = [data]
+    pop = stack.pop
+    remaining = max_items
+    while stack:
+        value = pop()
+        remaining -= 1
+        if remaining < 0:
+            return None
+        value_type = type(value)
+        append(value_type)
+        if value_type in _SCALAR_TYPES:
+            append(value)
+        elif value_type is dict or isinstance(value, Mapping):
+            append(len(value))
+            children = []
+            for key, item in value.items():
+                children.append(key)
+                children.append(item)
+            children.reverse()
+            stack.extend(children)
+        elif value_type is list or value_type is tuple:
+            append(len(value))
+            stack.extend(reversed(value))
+        else:
+            return None
+    return tuple(tokens)
+
+
+class _ResultCache:
+    """
+    A bounded, thread-safe LRU cache of validation verdicts with an optional
+    time-to-live, keyed by the structural payload key and violation limit.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None, max_items: int = 256):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.skips = 0
+        self._results: "OrderedDict[Any, Tuple[float, Tuple[Violation, ...]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        _result_caches.add(self)
+
+    def __reduce__(self):
+        # A copy sent to another process starts empty with fresh counters
+        return (_ResultCache, (self.maxsize, self.ttl, self.max_items))
+
+    def key(self, data: Any, limit: Optional[int]) -> Optional[Tuple[Any, ...]]:
+        """
+        Returns the cache key for a payload, or None (counted as a skip) when
+        the payload is too large or holds values that cannot be keyed.
+        """
+        key = _payload_key(data, self.max_items)
+        if key is None:
+            with self._lock:
+                self.skips += 1
+            return None
+        return (limit, key)
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Tuple[Violation, ...]]:
+        """
+        Returns the cached violations for a key, or None on a miss or expiry.
+
+        :param key: A key returned by key().
+        :return: The cached violations (empty for a valid payload) or None.
+        """
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None:
+                expires, errors = entry
+                if expires >= time.monotonic():
+                    self._results.move_to_end(key)
+                    self.hits += 1
+                    return errors
+                del self._results[key]
+                self.evictions += 1
+            self.misses += 1
+            return None
+
+    def put(self, key: Tuple[Any, ...], errors: List[Violation]) -> None:
+        """Stores the violations for a key, evicting the least recently used entries."""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._results[key] = (expires, tuple(errors))
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit/miss/eviction/skip counters and the current cache size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "skips": self.skips,
+                "size": len(self._results),
+            }
+
+    def reset_stats(self) -> None:
+        """Resets the counters without evicting results."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.skips = 0
+
+    def clear(self) -> None:
+        """Evicts every cached result."""
+        with self._lock:
+            self._results.clear()
+
+
+# Result caches of live schemas, aggregated by get_metrics()
+_result_caches: "weakref.WeakSet[_ResultCache]" = weakref.WeakSet()
+
+
+def _result_cache_stats() -> Dict[str, int]:
+    """Returns the counters of every live result cache summed together."""
+    totals = {"hits": 0, "misses": 0, "evictions": 0, "skips": 0, "size": 0}
+    for cache in list(_result_caches):
+        for name, value in cache.stats().items():
+            totals[name] += value
+    return totals
+
+
+def _reset_result_cache_stats() -> None:
+    """Resets the counters of every live result cache."""
+    for cache in list(_result_caches):
+        cache.reset_stats()
+
+
+class _Check:
+    """
+    A single compiled rule applied to a field value that already passed its type check.
+    """
+    __slots__ = ()
+
+    def __call__(self, value: Any, path: str, violations: List[Violation]) -> None:
+        raise NotImplementedError
+
+
+class _RegexCheck(_Check):
+    __slots__ = ("pattern", "mode", "matcher")
+
+    def __init__(self, pattern: str, flags: int = 0, mode: RegexMode = "match"):
+        if mode not in ("match", "fullmatch"):
+            raise ValueError("regex_mode must be 'match' or 'fullmatch'")
+        self.pattern = _pattern_cache.get(pattern, flags)
+        self.mode = mode
+        self.matcher = getattr(self.pattern, mode)
+
+    def __reduce__(self):
+        # Pickled plans re-fetch the pattern through the shared cache on load
+        return (_RegexCheck, (self.pattern.pattern, self.pattern.flags, self.mode))
+
+    def __call__(self, value: Any, path: str, violations: List[Violation]) -> None:
+        if not self.matcher(value if type(value) is str else str(value)):
+            violations.append(Violation(path, "pattern", self.pattern.pattern))
+
+
+class _MinCheck(_Check):
+    __slots__ = ("minimum",)
+
+    def __init__(self, minimum: Any):
+        self.minimum = minimum
+
+    def __call__(self, value: Any, path: str, violations: List[Violation]) -> None:
+        if value < self.minimum:
+            violations.append(Violation(path, "min", self.minimum))
+
+
+class _MaxCheck(_Check):
+    __slots__ = ("maximum",)
+
+    def __init__(self, maximum: Any):
+        self.maximum = maximum
+
+    def __call__(self, value: Any, path: str, violations: List[Violation]) -> None:
+        if value > self.maximum:
+            violations.append(Violation(path, "max", self.maximum))
+
+
+class _EnumCheck(_Check):
+    __slots__ = ("choices", "lookup")
+
+    def __init__(self, choices: List[Any]):
+        self.choices = list(choices)
+        try:
+            self.lookup = frozenset(self.choices)
+        except TypeError:
+            # Unhashable choices fall back to a linear scan
+            self.lookup = tuple(self.choices)
+
+    def __call__(self, value: Any, path: str, violations: List[Violation]) -> None:
+        try:
+            found = value in self.lookup
+        except TypeError:
+            found = value in self.choices
+        if not found:
+            violations.append(Violation(path, "enum", self.choices))
+
+
+class _LengthCheck(_Check):
+    __slots__ = ("min_length", "max_length")
+
+    def __init__(self, min_length: Optional[int], max_length: Optional[int]):
+        self.min_length = min_length
+        self.max_length = max_length
+
+    def __call__(self, value: Any, path: str, violations: List[Violation]) -> None:
+        length = len(value)
+        if self.min_length is not None and length < self.min_length:
+            violations.append(Violation(path, "min_length", self.min_length))
+        if self.max_length is not None and length > self.max_length:
+            violations.append(Violation(path, "max_length", self.max_length))
+
+
+def _validator_name(func: Callable[..., Any]) -> str:
+    """Returns the module-qualified name validator metrics are reported under."""
+    name = getattr(func, "__qualname__", None) or type(func).__qualname__
+    module = getattr(func, "__module__", None)
+    return f"{module}.{name}" if module else name
+
+
+class _ValidatorCheck(_Check):
+    """
+    A "validator" rule. Calls and time are recorded per validator function
+    in the calling thread's metrics shard; validators declared pure get a
+    per-rule LRU memo keyed by the value.
+    """
+    __slots__ = ("func", "pure", "memo_size", "name", "metrics", "memo")
+
+    def __init__(self, func: Callable[[Any], bool], pure: bool = False, memo_size: int = 1024):
+        from py_flowcheck.decorators import _metrics
+        self.func = func
+        self.pure = pure
+        self.memo_size = memo_size
+        self.name = name = _validator_name(func)
+        self.metrics = metrics = _metrics
+        self.memo: Optional[Callable[[Any], bool]] = None
+        if pure:
+            def evaluate(value: Any) -> bool:
+                metrics.shard().validator(name).evaluations += 1
+                return func(value)
+            self.memo = functools.lru_cache(maxsize=memo_size, typed=True)(evaluate)
+
+    def __reduce__(self):
+        # The memo is process-local; a copy starts with an empty one
+        return (_ValidatorCheck, (self.func, self.pure, self.memo_size))
+
+    def __call__(self, value: Any, path: str, violations: List[Violation]) -> None:
+        stats = self.metrics.shard().validator(self.name)
+        stats.calls += 1
+        start = time.perf_counter()
+        try:
+            memo = self.memo
+            if memo is not None:
+                try:
+                    hash(value)
+                except TypeError:
+                    memo = None
+            if memo is not None:
+                passed = memo(value)
+            else:
+                stats.evaluations += 1
+                passed = self.func(value)
+        except Exception as e:
+            violations.append(Violation(path, "custom_error", actual=e))
+            return
+        finally:
+            stats.time += time.perf_counter() - start
+        if not passed:
+            violations.append(Violation(path, "custom"))
+
+
+class _AsyncValidatorCheck(_Check):
+    """
+    A "validator" rule whose function is a coroutine function. It only runs
+    under Schema.avalidate(), which awaits all of a payload's async checks
+    concurrently.
+    """
+    __slots__ = ("func", "name", "metrics")
+
+    def __init__(self, func: Callable[[Any], Any]):
+        from py_flowcheck.decorators import _metrics
+        self.func = func
+        self.name = _validator_name(func)
+        self.metrics = _metrics
+
+    def __reduce__(self):
+        return (_AsyncValidatorCheck, (self.func,))
+
+    def __call__(self, value: Any, path: str, violations: List[Violation]) -> None:
+        pending = getattr(violations, "pending", None)
+        if pending is None:
+            raise TypeError("Schema has async validators; use 'await schema.avalidate(data)'")
+        pending.append((self, value, path))
+
+    async def run(self, value: Any, path: Union[str, "_Path"]) -> Optional[Violation]:
+        """Awaits the validator and returns its violation, if any."""
+        stats = self.metrics.shard().validator(self.name)
+        stats.calls += 1
+        stats.evaluations += 1
+        start = time.perf_counter()
+        try:
+            passed = await self.func(value)
+        except Exception as e:
+            return Violation(path, "custom_error", actual=e)
+        finally:
+            stats.time += time.perf_counter() - start
+        return None if passed else Violation(path, "custom")
+
+
+def _is_async_callable(func: Any) -> bool:
+    """True for coroutine functions and objects with an async __call__."""
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(getattr(func, "__call__", None))
+
+
+# Work for the iterative engine: (iterator, get, parent). When ``get`` is a
+# mapping's get method the iterator yields that mapping's field plans, whose
+# paths link to ``parent``; otherwise it yields (field plan, value, path).
+_Frames = Tuple[Iterator[Any], Optional[Callable[[str], Any]], Any]
+
+
+class _StructuralCheck(_Check):
+    """
+    A check that descends into a container value. Instead of recursing it
+    returns the container's children as frames for the iterative engine.
+    Violations of the container itself are appended to ``violations``.
+    """
+    __slots__ = ()
+
+    def frames(self, value: Any, path: Union[str, _Path], violations: List[Violation]) -> _Frames:
+        raise NotImplementedError
+
+    def __call__(self, value: Any, path: str, violations: List[Violation]) -> None:
+        _run_stack([self.frames(value, path, violations)], violations)
+
+
+class _NestedCheck(_StructuralCheck):
+    __slots__ = ("plan", "_index")
+
+    def __init__(self, plan: List["_FieldPlan"]):
+        self.plan = plan
+        self._index: Optional[Dict[str, "_FieldPlan"]] = None
+
+    def index(self) -> Dict[str, "_FieldPlan"]:
+        """Returns the nested field plans by name, built on first use."""
+        if self._index is None:
+            self._index = {field.name: field for field in self.plan}
+        return self._index
+
+    def frames(self, value: Any, path: Union[str, _Path], violations: List[Violation]) -> _Frames:
+        return iter(self.plan), value.get, path
+
+
+class _ItemsCheck(_StructuralCheck):
+    __slots__ = ("item",)
+
+    def __init__(self, item: Optional["_FieldPlan"] = None):
+        self.item = item
+
+    def frames(self, value: Any, path: Union[str, _Path], violations: List[Violation]) -> _Frames:
+        return zip(repeat(self.item), value, zip(repeat(path), count())), None, None
+
+
+class _UnionCheck(_StructuralCheck):
+    """
+    A "one_of" / "any_of" rule over mapping values. With a discriminator the
+    branch is picked from a dict index in O(1) and validated in place;
+    otherwise each branch is tried in order until the rule is decided.
+    """
+    __slots__ = ("mode", "branches", "discriminator", "index")
+
+    def __init__(
+        self,
+        mode: str,
+        branches: List[List["_FieldPlan"]],
+        discriminator: Optional[str] = None,
+        index: Optional[Dict[Any, List["_FieldPlan"]]] = None,
+    ):
+        self.mode = mode
+        self.branches = branches
+        self.discriminator = discriminator
+        self.index = index
+
+    def frames(self, value: Any, path: Union[str, _Path], violations: List[Violation]) -> _Frames:
+        get = value.get
+        if self.discriminator is not None:
+            tag = get(self.discriminator)
+            try:
+                branch = self.index.get(tag)
+            except TypeError:
+                branch = None
+            if branch is None:
+                violations.append(Violation((path, self.discriminator), "discriminator", list(self.index), tag))
+                return iter(()), None, None
+            return iter(branch), get, path
+
+        matches = 0
+        for branch in self.branches:
+            if _branch_matches(branch, value, path):
+                matches += 1
+                if self.mode == "any_of" or matches > 1:
+                    break
+        if matches == 0 or (self.mode == "one_of" and matches > 1):
+            violations.append(Violation(path, self.mode, len(self.branches), matches))
+        return iter(()), None, None
+
+
+def _branch_matches(branch: List["_FieldPlan"], value: Mapping, path: Union[str, _Path]) -> bool:
+    """Returns True if a union branch accepts the value, stopping at its first violation."""
+    failures = _LimitedViolations(1)
+    try:
+        _run_stack([(iter(branch), value.get, path)], failures)
+    except _StopValidation:
+        return False
+    return True
+
+
+class _FieldPlan:
+    """
+    The compiled form of one field rule: nullability, expected type and the
+    remaining checks, which only run once the type check has passed. Leaf
+    checks run first; structural checks (nested schemas, list items) then
+    hand their children to the iterative engine.
+    """
+    __slots__ = ("name", "nullable", "expected_type", "checks", "leaf_checks", "child_checks")
+
+    def __init__(self, name: str, nullable: bool, expected_type: Optional[type], checks: List[_Check]):
+        self.name = name
+        self.nullable = nullable
+        self.expected_type = expected_type
+        self.checks = checks
+        self.leaf_checks = [check for check in checks if not isinstance(check, _StructuralCheck)]
+        # Reversed so that pushing them onto the work stack visits them in order
+        self.child_checks = [check for check in reversed(checks) if isinstance(check, _StructuralCheck)]
+
+
+# A unit of work for the engine: definitions still to compile into a target
+_PendingCompile = Tuple[Union[List[_FieldPlan], _ItemsCheck], Any]
+
+
+def _compile_rule(
+    name: str, rule: Any, regex_mode: RegexMode, pending: List[_PendingCompile]
+) -> _FieldPlan:
+    """
+    Compiles a single field rule (a bare type or a rule dict) into a _FieldPlan.
+
+    Nested schemas and list item rules are not compiled recursively; they are
+    queued on ``pending`` and filled in by _compile_plan.
+
+    :param name: The field name the rule applies to.
+    :param rule: The raw rule from the schema definition.
+    :param regex_mode: Default regex semantics for rules without their own "regex_mode".
+    :param pending: Work list of nested definitions still to compile.
+    :return: The compiled field plan.
+    """
+    if not isinstance(rule, dict):
+        return _FieldPlan(name, False, rule if isinstance(rule, type) else None, [])
+
+    expected_type = rule.get("type")
+    checks: List[_Check] = []
+
+    if "regex" in rule:
+        checks.append(_RegexCheck(
+            rule["regex"], rule.get("regex_flags", 0), rule.get("regex_mode", regex_mode)
+        ))
+    if "min" in rule:
+        checks.append(_MinCheck(rule["min"]))
+    if "max" in rule:
+        checks.append(_MaxCheck(rule["max"]))
+    if "enum" in rule:
+        checks.append(_EnumCheck(rule["enum"]))
+    if "min_length" in rule or "max_length" in rule:
+        checks.append(_LengthCheck(rule.get("min_length"), rule.get("max_length")))
+    if "validator" in rule:
+        validator = rule["validator"]
+        if _is_async_callable(validator):
+            checks.append(_AsyncValidatorCheck(validator))
+        else:
+            checks.append(_ValidatorCheck(validator, bool(rule.get("pure")), rule.get("memo_size", 1024)))
+    if "schema" in rule:
+        nested = rule["schema"]
+        if isinstance(nested, Schema):
+            checks.append(_NestedCheck(nested._plan))
+        else:
+            nested_plan: List[_FieldPlan] = []
+            pending.append((nested_plan, nested))
+            checks.append(_NestedCheck(nested_plan))
+        expected_type = expected_type or dict
+    for mode in ("one_of", "any_of"):
+        if mode in rule:
+            checks.append(_compile_union(name, mode, rule[mode], rule.get("discriminator"), pending))
+            expected_type = expected_type or dict
+    if "items" in rule:
+        items_check = _ItemsCheck()
+        pending.append((items_check, rule["items"]))
+        checks.append(items_check)
+        expected_type = expected_type or list
+
+    return _FieldPlan(name, bool(rule.get("nullable")), expected_type, checks)
+
+
+def _queue_branch(definition: Any, pending: List[_PendingCompile]) -> List[_FieldPlan]:
+    """Returns the plan for a union branch, queuing dict definitions for compilation."""
+    if isinstance(definition, Schema):
+        return definition._plan
+    plan: List[_FieldPlan] = []
+    pending.append((plan, definition))
+    return plan
+
+
+def _compile_union(
+    name: str, mode: str, branches: Any, discriminator: Optional[str], pending: List[_PendingCompile]
+) -> _UnionCheck:
+    """
+    Compiles a "one_of" / "any_of" rule. Branches are nested schemas given
+    as a list, or as a mapping from discriminator value to schema. For a list
+    with a discriminator, each branch's values come from the "enum" of its
+    discriminator field.
+
+    :raises ValueError: If a discriminated branch declares no values or two
+        branches claim the same value.
+    """
+    if isinstance(branches, Mapping):
+        if discriminator is None:
+            raise ValueError(f"Field '{name}': {mode} given as a mapping requires a 'discriminator'")
+        tagged = list(branches.items())
+    elif discriminator is not None:
+        tagged = []
+        for position, branch in enumerate(branches):
+            definition = branch.schema if isinstance(branch, Schema) else branch
+            rule = definition.get(discriminator)
+            if not isinstance(rule, dict) or "enum" not in rule:
+                raise ValueError(
+                    f"Field '{name}': {mode} branch {position} must declare an 'enum' "
+                    f"for discriminator '{discriminator}'"
+                )
+            tagged.extend((tag, branch) for tag in rule["enum"])
+    else:
+        return _UnionCheck(mode, [_queue_branch(branch, pending) for branch in branches])
+
+    index: Dict[Any, List[_FieldPlan]] = {}
+    plans: Dict[int, List[_FieldPlan]] = {}
+    for tag, branch in tagged:
+        if tag in index:
+            raise ValueError(f"Field '{name}': discriminator value {tag!r} is used by more than one branch")
+        if id(branch) not in plans:
+            plans[id(branch)] = _queue_branch(branch, pending)
+        index[tag] = plans[id(branch)]
+    return _UnionCheck(mode, list(plans.values()), discriminator, index)
+
+
+def _compile_plan(schema: Dict[str, Any], regex_mode: RegexMode = "match") -> List[_FieldPlan]:
+    """
+    Compiles a schema definition into a flat list of field plans.
+
+    Nesting is handled with an explicit work list, so arbitrarily deep
+    definitions compile without hitting the recursion limit.
+
+    :param schema: A dictionary defining the schema rules.
+    :param regex_mode: Default regex semantics, "match" or "fullmatch".
+    :return: The compiled validation plan.
+    """
+    plan: List[_FieldPlan] = []
+    pending: List[_PendingCompile] = [(plan, schema)]
+
+    while pending:
+        target, definition = pending.pop()
+        if isinstance(target, _ItemsCheck):
+            target.item = _compile_rule("", definition, regex_mode, pending)
+        else:
+            target.extend(
+                _compile_rule(field, rule, regex_mode, pending) for field, rule in definition.items()
+            )
+
+    _reject_async_trial_branches(plan)
+    return plan
+
+
+def _child_plans(check: _Check) -> List[List[_FieldPlan]]:
+    """Returns the plans a structural check validates its children against."""
+    if isinstance(check, _NestedCheck):
+        return [check.plan]
+    if isinstance(check, _ItemsCheck):
+        return [[check.item]]
+    if isinstance(check, _UnionCheck):
+        return check.branches
+    return []
+
+
+def _has_async_checks(plans: List[List[_FieldPlan]]) -> bool:
+    """True if any of the plans, at any depth, has an async validator."""
+    stack = list(plans)
+    while stack:
+        for field in stack.pop():
+            for check in field.checks:
+                if isinstance(check, _AsyncValidatorCheck):
+                    return True
+                stack.extend(_child_plans(check))
+    return False
+
+
+def _reject_async_trial_branches(plan: List[_FieldPlan]) -> None:
+    """
+    Rejects async validators in union branches without a discriminator:
+    those branches are tried synchronously, before async checks could be
+    awaited.
+
+    :raises ValueError: If such a branch has an async validator.
+    """
+    stack = [plan]
+    while stack:
+        for field in stack.pop():
+            for check in field.checks:
+                if isinstance(check, _UnionCheck) and check.discriminator is None and _has_async_checks(check.branches):
+                    raise ValueError(
+                        f"Field '{field.name}': {check.mode} branches without a 'discriminator' "
+                        f"cannot use async validators"
+                    )
+                stack.extend(_child_plans(check))
+
+
+def _run_frames(frames: Iterator[Tuple[_FieldPlan, Any, str]], violations: List[Violation]) -> None:
+    """Validates (field plan, value, path) frames with the iterative engine."""
+    _run_stack([(frames, None, None)], violations)
+
+
+def _run_stack(stack: List[_Frames], violations: List[Violation]) -> None:
+    """
+    Validates frames from a stack of frame iterators, innermost last, instead
+    of recursing.
+
+    Descending into a container pushes its children's frames and suspends the
+    current iterator, so violations come out in depth-first definition order
+    and memory grows with nesting depth, not document size. Paths are linked
+    (parent, key) tuples, so each level costs the same regardless of depth.
+    """
+    push = stack.append
+
+    while stack:
+        frames, get, parent = stack[-1]
+        for frame in frames:
+            if get is None:
+                field, value, path = frame
+            else:
+                # Fields of a mapping: the common case, without per-field tuples to unpack
+                field = frame
+                value = get(field.name)
+                path = (parent, field.name)
+
+            if value is None:
+                if not field.nullable:
+                    violations.append(Violation(path, "required"))
+                continue
+
+            expected_type = field.expected_type
+            if expected_type is not None and not isinstance(value, expected_type):
+                violations.append(Violation(path, "type", expected_type, type(value)))
+                continue
+
+            for check in field.leaf_checks:
+                check(value, path, violations)
+
+            if field.child_checks:
+                for check in field.child_checks:
+                    push(check.frames(value, path, violations))
+                # Descend; this iterator resumes once the children are exhausted
+                break
+        else:
+            stack.pop()
+
+
+def _run_plan(plan: List[_FieldPlan], data: Dict[str, Any], prefix: str, violations: List[Violation]) -> None:
+    """
+    Runs a compiled plan against a mapping, appending violations in field order.
+
+    Fields are checked in a plain loop; only fields with nested schemas or
+    list items hand their children to the frame engine.
+    """
+    get = data.get
+    for field in plan:
+        value = get(field.name)
+        if value is None:
+            if not field.nullable:
+                violations.append(Violation(prefix + field.name, "required"))
+            continue
+
+        expected_type = field.expected_type
+        if expected_type is not None and not isinstance(value, expected_type):
+            violations.append(Violation(prefix + field.name, "type", expected_type, type(value)))
+            continue
+
+        path = prefix + field.name
+        for check in field.leaf_checks:
+            check(value, path, violations)
+
+        if field.child_checks:
+            _run_stack([check.frames(value, path, violations) for check in field.child_checks], violations)
+
+
+def _run_delta(
+    index: Dict[str, _FieldPlan],
+    previous: Mapping,
+    changes: Mapping,
+    violations: List[Violation],
+) -> Dict[str, Any]:
+    """
+    Applies a partial update to an already valid document, validating only
+    the fields it touches, and returns the merged document.
+
+    A change holding a mapping for a field with a nested schema is merged
+    into the previous nested document field by field; any other change
+    replaces the field's value and revalidates that field in full. Fields
+    without a rule are merged without checks. The previous document is not
+    modified. Changes are merged first so that rules on a partially updated
+    nested field (such as its validator) see the merged value.
+    """
+    merged = dict(previous)
+    # Checks to run once merging is done: (field plan, value, path, leaf checks only)
+    pending: List[Tuple[_FieldPlan, Any, Union[str, _Path], bool]] = []
+    stack = [(index, previous, merged, None, iter(changes.items()))]
+
+    while stack:
+        index, previous, target, prefix, items = stack[-1]
+        for name, value in items:
+            field = index.get(name)
+            old = previous.get(name)
+            path = name if prefix is None else (prefix, name)
+
+            nested = None
+            if field is not None and isinstance(value, Mapping) and isinstance(old, Mapping):
+                nested = next((check for check in field.checks if isinstance(check, _NestedCheck)), None)
+
+            if nested is None:
+                target[name] = value
+                if field is not None:
+                    pending.append((field, value, path, False))
+                continue
+
+            merged_child = dict(old)
+            target[name] = merged_child
+            pending.append((field, merged_child, path, True))
+            stack.append((nested.index(), old, merged_child, path, iter(value.items())))
+            break
+        else:
+            stack.pop()
+
+    for field, value, path, leaf_only in pending:
+        if leaf_only:
+            for check in field.leaf_checks:
+                check(value, path, violations)
+        else:
+            _run_frames(iter(((field, value, path),)), violations)
+
+    return merged
+
+
+def _parse_json(raw: Union[bytes, bytearray, memoryview, str]) -> Tuple[Any, Optional[List[Violation]]]:
+    """Parses a JSON document, returning it with violations if it cannot be validated."""
+    try:
+        data = _json_loads(raw)
+    except ValueError as e:
+        return None, [Violation(None, "invalid_json", actual=e)]
+    if type(data) is not dict:
+        return data, [Violation(None, "record_type", dict, type(data))]
+    return data, None
+
+
+class ValidationResult:
+    """
+    Result of a non-raising validation: ``ok`` tells whether the data is
+    valid, ``errors`` holds the structured violations and ``violations``
+    renders them as strings. ``value`` holds the parsed document for
+    check_json() and acheck_json().
+    """
+    __slots__ = ("errors", "value")
+
+    def __init__(self, errors: List[Violation], value: Any = None):
+        self.errors = errors
+        self.value = value
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def violations(self) -> List[str]:
+        return _render(self.errors)
+
+    def __bool__(self) -> bool:
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return f"<ValidationResult ok={not self.errors} errors={len(self.errors)}>"
+
+
+class BatchResult:
+    """
+    Compact result of validating a batch of records.
+
+    ``valid`` holds one byte per record (1 for valid, 0 for invalid) and
+    ``errors`` maps the index of each invalid record to its structured
+    violations; ``violations`` renders them as strings.
+    """
+    __slots__ = ("valid", "errors")
+
+    def __init__(self, valid: bytearray, errors: Dict[int, List[Violation]]):
+        self.valid = valid
+        self.errors = errors
+
+    @property
+    def violations(self) -> Dict[int, List[str]]:
+        return {index: _render(errors) for index, errors in self.errors.items()}
+
+    @property
+    def ok(self) -> bool:
+        """True if every record in the batch is valid."""
+        return not self.errors
+
+    @property
+    def valid_count(self) -> int:
+        return len(self.valid) - len(self.errors)
+
+    @property
+    def invalid_indices(self) -> List[int]:
+        return sorted(self.errors)
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def __repr__(self) -> str:
+        return f"<BatchResult records={len(self.valid)} invalid={len(self.errors)}>"
 
 
 class Schema:
     """
     A class for defining and validating schemas for data validation.
 
+    The definition is compiled once at construction time into a list of
+    per-field checkers, so validate() does not re-interpret the rule dict.
+    With codegen=True the plan is additionally turned into specialized Python
+    source and compiled into a single function; the source is kept on
+    ``schema.source`` for debugging.
+
     Example:
         user_schema = Schema({
             "id": int,
-            "email": {"type": str, "regex": r".+@.+\..+"},
+            "email": {"type": str, "regex": r".+@.+\\..+"},
             "age": {"type": int, "nullable": True, "min": 0},
         })
     """
 
-    def __init__(self, schema: Dict[str, Any]):
+    def __init__(
+        self,
+        schema: Dict[str, Any],
+        codegen: bool = False,
+        regex_mode: RegexMode = "match",
+        fail_fast: Optional[bool] = None,
+        max_violations: Optional[int] = None,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+        cache_max_items: int = 256,
+        name: Optional[str] = None,
+        *,
+        _plan: Optional[List[_FieldPlan]] = None,
+    ):
         """
         Initializes the schema with validation rules.
 
         :param schema: A dictionary defining the schema rules.
+        :param codegen: Generate and compile a specialized validation function.
+        :param regex_mode: Regex semantics for "regex" rules: "match" anchors at the
+            start only, "fullmatch" requires the whole value to match. A rule can
+            override it with its own "regex_mode" key.
+        :param fail_fast: Stop at the first violation. None uses the global config.
+        :param max_violations: Stop after this many violations (0 for no limit).
+            None uses the global config.
+        :param cache_size: Cache the verdicts of up to this many distinct payloads
+            in check() and validate() (0 disables the cache). Only enable it when
+            every "validator" rule is a pure function of its value.
+        :param cache_ttl: Seconds a cached verdict stays valid. None never expires.
+        :param cache_max_items: Payloads holding more values than this are
+            validated without caching, so keying never costs more than validating.
+        :param name: Name used to label this schema's metrics. Schemas loaded
+            from files are named after the file.
+        :param _plan: A previously compiled plan for this definition (used by
+            Schema.load to skip compilation).
         """
+        if max_violations is not None and max_violations < 0:
+            raise ValueError("max_violations must be non-negative")
+        if cache_size < 0:
+            raise ValueError("cache_size must be non-negative")
+        if cache_ttl is not None and cache_ttl <= 0:
+            raise ValueError("cache_ttl must be positive")
         self.schema = schema
+        self.name = name
+        self.fail_fast = fail_fast
+        self.max_violations = max_violations
+        self._plan = _plan if _plan is not None else _compile_plan(schema, regex_mode)
+        self._index: Optional[Dict[str, _FieldPlan]] = None
+        self._generated: Optional[Callable[[Dict[str, Any], List[Violation]], None]] = None
+        self.source: Optional[str] = None
+
+        if codegen:
+            from py_flowcheck.codegen import generate_validator
+            try:
+                self._generated, self.source = generate_validator(self._plan)
+            except (RecursionError, SyntaxError, MemoryError):
+                # Very deep schemas exceed the compiler's nesting limits; the
+                # iterative plan engine handles them without a generated function.
+                logger.warning("Schema too deeply nested for codegen, using the plan engine")
+
+        self._result_cache: Optional[_ResultCache] = None
+        if cache_size:
+            self._result_cache = _ResultCache(cache_size, cache_ttl, cache_max_items)
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        regex_mode: RegexMode = "match",
+        cache_dir: Optional[str] = None,
+        cache: bool = True,
+    ) -> "Schema":
+        """
+        Loads a schema definition from a JSON or YAML file.
+
+        The compiled plan is cached on disk keyed by a hash of the file's
+        content, so later loads of an unchanged file skip compilation.
+
+        :param path: Path to a .json, .yaml or .yml schema file.
+        :param regex_mode: Default regex semantics for "regex" rules.
+        :param cache_dir: Directory for cached plans. None uses the configured
+            schema_cache_dir, or a __flowcheck_cache__ directory next to the file.
+        :param cache: Set to False to neither read nor write the disk cache.
+        :return: The loaded Schema.
+        """
+        from py_flowcheck.loader import load_schema
+        schema, _, _ = load_schema(path, regex_mode, cache_dir, cache)
+        return schema
 
     @staticmethod
     def from_dict(defn: Dict[str, Any]) -> "Schema":
@@ -42,47 +1228,343 @@ class Schema:
         """
         return Schema(defn)
 
-    def validate(self, data: Dict[str, Any]) -> None:
+    def validate(
+        self,
+        data: Dict[str, Any],
+        fail_fast: Optional[bool] = None,
+        max_violations: Optional[int] = None,
+    ) -> None:
         """
         Validates the given data against the schema.
 
         :param data: The data to validate.
+        :param fail_fast: Override the schema's fail_fast setting for this call.
+        :param max_violations: Override the schema's max_violations setting for this call.
         :raises ValidationError: If validation fails.
         """
-        violations = []
+        violations = self._check_errors(data, fail_fast, max_violations)
 
-        for field, rule in self.schema.items():
-            value = data.get(field)
+        if violations:
+            raise ValidationError("Schema validation failed", violations)
 
-            # Check for missing required fields
-            if value is None and not (isinstance(rule, dict) and rule.get("nullable")):
-                violations.append(f"Field '{field}' is required but missing")
-                continue
+    def check(
+        self,
+        data: Dict[str, Any],
+        fail_fast: Optional[bool] = None,
+        max_violations: Optional[int] = None,
+    ) -> ValidationResult:
+        """
+        Validates the given data without raising.
 
-            # Handle nullable fields
-            if isinstance(rule, dict) and rule.get("nullable") and value is None:
-                continue
+        :param data: The data to validate.
+        :param fail_fast: Override the schema's fail_fast setting for this call.
+        :param max_violations: Override the schema's max_violations setting for this call.
+        :return: A ValidationResult with ``ok`` and the collected violations.
+        """
+        return ValidationResult(self._check_errors(data, fail_fast, max_violations))
 
-            # Type validation
-            expected_type = rule if isinstance(rule, type) else rule.get("type")
-            if expected_type and not isinstance(value, expected_type):
-                violations.append(f"Field '{field}' must be of type {expected_type.__name__}, got {type(value).__name__}")
-                continue
+    def validate_json(
+        self,
+        raw: Union[bytes, bytearray, memoryview, str],
+        fail_fast: Optional[bool] = None,
+        max_violations: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Parses a JSON document and validates it in one step.
+
+        The document is parsed once with the fastest available backend
+        (orjson if installed, the standard library otherwise); use the
+        returned object instead of parsing the body again.
+
+        :param raw: The raw JSON document.
+        :param fail_fast: Override the schema's fail_fast setting for this call.
+        :param max_violations: Override the schema's max_violations setting for this call.
+        :return: The parsed document.
+        :raises ValidationError: If the document is not valid JSON or violates the schema.
+        """
+        result = self.check_json(raw, fail_fast, max_violations)
+        if result.errors:
+            raise ValidationError("Schema validation failed", result.errors)
+        return result.value
+
+    def check_json(
+        self,
+        raw: Union[bytes, bytearray, memoryview, str],
+        fail_fast: Optional[bool] = None,
+        max_violations: Optional[int] = None,
+    ) -> ValidationResult:
+        """
+        Parses and validates a JSON document without raising.
+
+        Malformed JSON is reported as an "invalid_json" violation and a
+        document that is not an object as "record_type".
+
+        :param raw: The raw JSON document.
+        :param fail_fast: Override the schema's fail_fast setting for this call.
+        :param max_violations: Override the schema's max_violations setting for this call.
+        :return: A ValidationResult whose ``value`` is the parsed document.
+        """
+        data, errors = _parse_json(raw)
+        if errors is None:
+            errors = self._check_errors(data, fail_fast, max_violations)
+        return ValidationResult(errors, data)
+
+    async def acheck_json(
+        self,
+        raw: Union[bytes, bytearray, memoryview, str],
+        fail_fast: Optional[bool] = None,
+        max_violations: Optional[int] = None,
+    ) -> ValidationResult:
+        """
+        Parses and validates a JSON document without raising, awaiting async validators.
+
+        :param raw: The raw JSON document.
+        :param fail_fast: Override the schema's fail_fast setting for this call.
+        :param max_violations: Override the schema's max_violations setting for this call.
+        :return: A ValidationResult whose ``value`` is the parsed document.
+        """
+        data, errors = _parse_json(raw)
+        if errors is None:
+            errors = await self._acheck_errors(data, fail_fast, max_violations)
+        return ValidationResult(errors, data)
+
+    async def avalidate(
+        self,
+        data: Dict[str, Any],
+        fail_fast: Optional[bool] = None,
+        max_violations: Optional[int] = None,
+    ) -> None:
+        """
+        Validates the given data, awaiting ``async def`` validators.
+
+        Synchronous rules run first; the async validators of the payload are
+        then awaited concurrently with asyncio.gather. Their violations follow
+        the synchronous ones.
+
+        :param data: The data to validate.
+        :param fail_fast: Override the schema's fail_fast setting for this call.
+        :param max_violations: Override the schema's max_violations setting for this call.
+        :raises ValidationError: If validation fails.
+        """
+        violations = await self._acheck_errors(data, fail_fast, max_violations)
+
+        if violations:
+            raise ValidationError("Schema validation failed", violations)
+
+    async def acheck(
+        self,
+        data: Dict[str, Any],
+        fail_fast: Optional[bool] = None,
+        max_violations: Optional[int] = None,
+    ) -> ValidationResult:
+        """
+        Validates the given data without raising, awaiting async validators.
+
+        :param data: The data to validate.
+        :param fail_fast: Override the schema's fail_fast setting for this call.
+        :param max_violations: Override the schema's max_violations setting for this call.
+        :return: A ValidationResult with ``ok`` and the collected violations.
+        """
+        return ValidationResult(await self._acheck_errors(data, fail_fast, max_violations))
+
+    def validate_many(
+        self,
+        records: Iterable[Dict[str, Any]],
+        fail_fast: Optional[bool] = None,
+        max_violations: Optional[int] = None,
+    ) -> BatchResult:
+        """
+        Validates a batch of records in one call without raising per record.
+
+        A single aggregated metrics entry is recorded for the whole batch.
+
+        :param records: The records to validate.
+        :param fail_fast: Stop at the first violation of each record.
+        :param max_violations: Stop after this many violations per record.
+        :return: A BatchResult with per-record valid flags and violations by index.
+        """
+        start_time = time.perf_counter()
+        valid = bytearray()
+        failures: Dict[int, List[Violation]] = {}
+        collect = self._collect
+        limit = self._violation_limit(fail_fast, max_violations)
+
+        for index, record in enumerate(records):
+            if type(record) is dict or isinstance(record, Mapping):
+                violations: List[Violation] = [] if limit is None else _LimitedViolations(limit)
+                collect(record, violations)
+            else:
+                violations = [Violation(None, "record_type", dict, type(record))]
+
+            if violations:
+                failures[index] = violations
+                valid.append(0)
+            else:
+                valid.append(1)
+
+        from py_flowcheck.decorators import _record_batch
+        _record_batch(len(valid), len(failures), (time.perf_counter() - start_time) * 1000)
 
-            # Regex validation
-            if isinstance(rule, dict) and "regex" in rule:
-                if not re.match(rule["regex"], str(value)):
-                    violations.append(f"Field '{field}' does not match the required pattern")
+        return BatchResult(valid, failures)
+
+    def validate_columns(self, columns: Mapping) -> "ColumnarResult":
+        """
+        Validates columnar data (a dict of lists or 1-D NumPy arrays).
+
+        The type, nullable, min, max and enum rules are evaluated as vectorized
+        NumPy operations over whole columns; any other rules run row by row on
+        the values that passed those checks. Requires numpy.
+
+        :param columns: Mapping of field name to column values.
+        :return: A ColumnarResult with offending row indices per field and rule.
+        """
+        from py_flowcheck.columnar import validate_columns
+        result, elapsed_ms = validate_columns(self._plan, columns)
 
-            # Min value validation
-            if isinstance(rule, dict) and "min" in rule:
-                if value < rule["min"]:
-                    violations.append(f"Field '{field}' must be at least {rule['min']}")
+        from py_flowcheck.decorators import _record_batch
+        _record_batch(result.num_rows, len(result.invalid_rows), elapsed_ms)
+
+        return result
+
+    def _violation_limit(self, fail_fast: Optional[bool], max_violations: Optional[int]) -> Optional[int]:
+        """
+        Resolves the violation limit: call arguments override the schema's
+        settings, which override the global config. Returns None for no limit.
+        """
+        if fail_fast is None:
+            fail_fast = self.fail_fast
+        if max_violations is None:
+            max_violations = self.max_violations
+        if fail_fast is None or max_violations is None:
+            config = get_config()
+            if fail_fast is None:
+                fail_fast = config.fail_fast
+            if max_violations is None:
+                max_violations = config.max_violations
+        if fail_fast:
+            return 1
+        return max_violations or None
+
+    def _new_violations(
+        self, fail_fast: Optional[bool] = None, max_violations: Optional[int] = None
+    ) -> List[Violation]:
+        """Returns an empty violations list honoring the resolved violation limit."""
+        limit = self._violation_limit(fail_fast, max_violations)
+        return [] if limit is None else _LimitedViolations(limit)
+
+    def validate_delta(
+        self,
+        previous: Dict[str, Any],
+        changes: Dict[str, Any],
+        fail_fast: Optional[bool] = None,
+        max_violations: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Validates a partial update (PATCH body, change-data-capture event)
+        against a document that is already known to be valid.
+
+        Only the rules of the touched fields run, so the cost grows with the
+        size of ``changes`` rather than the document. A mapping given for a
+        field with a nested schema is merged into the previous value; any
+        other value replaces the field and is validated in full.
+
+        :param previous: The previously validated document; it is not modified.
+        :param changes: The partial document of changed fields.
+        :param fail_fast: Override the schema's fail_fast setting for this call.
+        :param max_violations: Override the schema's max_violations setting for this call.
+        :return: The merged document.
+        :raises ValidationError: If a changed field violates its rules.
+        """
+        if self._index is None:
+            self._index = {field.name: field for field in self._plan}
+        violations = self._new_violations(fail_fast, max_violations)
+        try:
+            merged = _run_delta(self._index, previous, changes, violations)
+        except _StopValidation:
+            # The violation limit was reached, so the error below is raised
+            merged = None
 
         if violations:
             raise ValidationError("Schema validation failed", violations)
+        return merged
+
+    def clear_cache(self) -> None:
+        """Evicts every cached verdict of this schema's result cache."""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def _check_errors(
+        self, data: Dict[str, Any], fail_fast: Optional[bool], max_violations: Optional[int]
+    ) -> List[Violation]:
+        """Validates data, consulting the result cache when one is enabled."""
+        limit = self._violation_limit(fail_fast, max_violations)
+        cache = self._result_cache
+        key = cache.key(data, limit) if cache is not None else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return list(cached)
+
+        violations: List[Violation] = [] if limit is None else _LimitedViolations(limit)
+        self._collect(data, violations)
+        if key is not None:
+            cache.put(key, violations)
+        return violations
+
+    async def _acheck_errors(
+        self, data: Dict[str, Any], fail_fast: Optional[bool], max_violations: Optional[int]
+    ) -> List[Violation]:
+        """Runs the synchronous rules, then awaits the queued async validators together."""
+        limit = self._violation_limit(fail_fast, max_violations)
+        cache = self._result_cache
+        key = cache.key(data, limit) if cache is not None else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return list(cached)
+
+        violations = _DeferredViolations(limit)
+        self._collect(data, violations)
+
+        pending = violations.pending
+        if pending and (violations.limit is None or len(violations) < violations.limit):
+            results = await asyncio.gather(*(check.run(value, path) for check, value, path in pending))
+            try:
+                for violation in results:
+                    if violation is not None:
+                        violations.append(violation)
+            except _StopValidation:
+                pass
+        if key is not None:
+            cache.put(key, violations)
+        return list(violations)
+
+    def _collect(self, data: Dict[str, Any], violations: List[Violation]) -> None:
+        """Runs the compiled validator, appending violations to the given list."""
+        try:
+            if self._generated is not None:
+                self._generated(data, violations)
+            else:
+                _run_plan(self._plan, data, "", violations)
+        except _StopValidation:
+            # The violation limit was reached; the list already holds the result
+            pass
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Generated functions cannot be pickled; they are rebuilt from the plan
+        state = self.__dict__.copy()
+        state["_generated"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if self.source is not None:
+            from py_flowcheck.codegen import generate_validator
+            self._generated, self.source = generate_validator(self._plan)
 
     def __repr__(self) -> str:
+        if self.name is not None:
+            return f"<Schema {self.name!r} rules={self.schema}>"
         return f"<Schema rules={self.schema}>"
 
 
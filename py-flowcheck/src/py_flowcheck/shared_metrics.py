@@ -0,0 +1,269 @@
+import contextlib
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from typing import Callable, Iterator, List, Optional, Tuple
+from py_flowcheck.metrics import MetricShard, _BUCKETS
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - exercised only on platforms without fcntl
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# File layout: a header, then fixed-size slots. Slot 0 accumulates the metrics
+# of workers that have exited; every other slot belongs to one live worker
+# process (pid 0 marks a free slot). Each slot holds the worker's counters,
+# latency summary and histogram buckets, guarded by a sequence number that is
+# odd while the owner is writing (a seqlock), so readers never take a lock.
+_MAGIC = b"PYFCMET1"
+_HEADER = struct.Struct("<8sII")  # magic, slot count, histogram bucket count
+_HEADER_SIZE = 64
+_SLOT = struct.Struct("<QqQQQQQdd")  # seq, pid, calls, failures, batches, sampling_skips, count, total, max
+_SEQ = struct.Struct("<Q")
+_SLOT_SIZE = _SLOT.size + _BUCKETS * 8
+_RETIRED = 0
+
+# Readers retry this many times while a slot is being written
+_READ_RETRIES = 1000
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedMetrics:
+    """
+    Metrics shared by the worker processes of one host through a memory-mapped file.
+
+    Each worker claims a slot and periodically copies its merged local metrics
+    into it from a background thread; any worker can then read every slot
+    and sum them without a round trip to the others. Slots of workers that
+    have exited are folded into a retired slot and freed, so counters never
+    go backwards when workers are recycled.
+
+    Only counters and the latency histogram are shared; timings, labeled
+    series and cache statistics stay per process.
+
+    Example:
+        shared = SharedMetrics("/dev/shm/py-flowcheck.metrics", source=collect_local_metrics)
+        shared.attach()
+        total, workers = shared.collect()
+    """
+
+    def __init__(
+        self,
+        path: str,
+        source: Callable[[], MetricShard],
+        slots: int = 128,
+        interval: float = 1.0,
+    ):
+        """
+        Opens the metrics file, creating and sizing it if needed.
+
+        :param path: The shared file, on a local file system (ideally tmpfs).
+        :param source: Returns this process's merged metrics for publishing.
+        :param slots: Number of worker slots when the file is created.
+        :param interval: Seconds between background publishes.
+        :raises ValueError: If the file exists but was not written by a
+            compatible version, or slots is below 2.
+        """
+        if slots < 2:
+            raise ValueError("slots must be at least 2")
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.path = path
+        self.interval = interval
+        self._source = source
+        self._slot: Optional[int] = None
+        self._pid: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Serializes publishes from the background thread and callers
+        self._publish_lock = threading.Lock()
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            with self._file_lock():
+                if os.fstat(self._fd).st_size == 0:
+                    os.ftruncate(self._fd, _HEADER_SIZE + slots * _SLOT_SIZE)
+                    os.pwrite(self._fd, _HEADER.pack(_MAGIC, slots, _BUCKETS), 0)
+                magic, file_slots, buckets = _HEADER.unpack(os.pread(self._fd, _HEADER.size, 0))
+                if magic != _MAGIC or buckets != _BUCKETS:
+                    raise ValueError(f"{path} is not a compatible py-flowcheck metrics file")
+                self.slots = file_slots
+            self._mmap = mmap.mmap(self._fd, _HEADER_SIZE + self.slots * _SLOT_SIZE)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    @contextlib.contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock for claiming slots and retiring dead ones; never held while recording."""
+        if fcntl is None:  # pragma: no cover
+            yield
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _offset(self, slot: int) -> int:
+        return _HEADER_SIZE + slot * _SLOT_SIZE
+
+    def _read(self, slot: int) -> Tuple[int, Optional[MetricShard]]:
+        """Returns a consistent (pid, metrics) copy of a slot; metrics is None if it never settles."""
+        offset = self._offset(slot)
+        for _ in range(_READ_RETRIES):
+            seq, pid, calls, failures, batches, skips, count, total, maximum = _SLOT.unpack_from(self._mmap, offset)
+            if seq % 2 == 0:
+                raw = self._mmap[offset + _SLOT.size:offset + _SLOT_SIZE]
+                if _SEQ.unpack_from(self._mmap, offset)[0] == seq:
+                    shard = MetricShard(0)
+                    shard.calls, shard.failures, shard.batches, shard.sampling_skips = calls, failures, batches, skips
+                    shard.latency._counts = array("Q", raw)
+                    shard.latency.count, shard.latency.total, shard.latency.max = count, total, maximum
+                    return pid, shard
+            time.sleep(0)
+        logger.debug(f"Skipping metrics slot {slot} of {self.path}: it kept changing while read")
+        return _SLOT.unpack_from(self._mmap, offset)[1], None
+
+    def _write(self, slot: int, pid: int, shard: Optional[MetricShard]) -> None:
+        """Overwrites a slot; a None shard zeroes its metrics."""
+        offset = self._offset(slot)
+        # Force odd rather than adding one: a writer killed mid-update leaves
+        # the sequence odd, and the slot must become readable once reused
+        seq = _SEQ.unpack_from(self._mmap, offset)[0] | 1
+        _SEQ.pack_into(self._mmap, offset, seq)
+        if shard is None:
+            _SLOT.pack_into(self._mmap, offset, seq, pid, 0, 0, 0, 0, 0, 0.0, 0.0)
+            self._mmap[offset + _SLOT.size:offset + _SLOT_SIZE] = bytes(_BUCKETS * 8)
+        else:
+            latency = shard.latency
+            _SLOT.pack_into(
+                self._mmap, offset, seq, pid, shard.calls, shard.failures, shard.batches,
+                shard.sampling_skips, latency.count, latency.total, latency.max,
+            )
+            self._mmap[offset + _SLOT.size:offset + _SLOT_SIZE] = latency._counts.tobytes()
+        _SEQ.pack_into(self._mmap, offset, seq + 1)
+
+    def _retire(self, slot: int) -> None:
+        """Folds a slot into the retired slot and frees it; call with the file lock held."""
+        _, metrics = self._read(slot)
+        if metrics is not None:
+            _, retired = self._read(_RETIRED)
+            self._write(_RETIRED, 0, (retired or MetricShard(0)).merge(metrics))
+        self._write(slot, 0, None)
+
+    def _collect_garbage(self) -> None:
+        """Retires the slots of processes that no longer exist; call with the file lock held."""
+        for slot in range(1, self.slots):
+            pid = _SLOT.unpack_from(self._mmap, self._offset(slot))[1]
+            if pid and not _pid_alive(pid):
+                self._retire(slot)
+
+    def attach(self) -> None:
+        """
+        Claims a slot for the current process and starts publishing to it.
+
+        :raises RuntimeError: If every slot belongs to a live process.
+        """
+        with self._file_lock():
+            self._collect_garbage()
+            for slot in range(1, self.slots):
+                if _SLOT.unpack_from(self._mmap, self._offset(slot))[1] == 0:
+                    break
+            else:
+                raise RuntimeError(f"No free worker slot in {self.path} ({self.slots - 1} workers)")
+            self._pid = os.getpid()
+            self._write(slot, self._pid, None)
+            self._slot = slot
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="py-flowcheck-shared-metrics", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.publish()
+            except Exception as e:  # pragma: no cover - keep publishing after transient errors
+                logger.debug(f"Could not publish metrics to {self.path}: {e}")
+
+    def publish(self, metrics: Optional[MetricShard] = None) -> None:
+        """
+        Copies this process's metrics into its slot.
+
+        :param metrics: Metrics to publish; defaults to calling ``source``.
+        """
+        if self._slot is None or self._pid != os.getpid():
+            return
+        with self._publish_lock:
+            self._write(self._slot, self._pid, metrics if metrics is not None else self._source())
+
+    def collect(self) -> Tuple[MetricShard, int]:
+        """
+        Sums every slot, retiring those of exited workers first.
+
+        :return: The merged metrics and the number of live workers.
+        """
+        with self._file_lock():
+            self._collect_garbage()
+        total = MetricShard(0)
+        workers = 0
+        for slot in range(self.slots):
+            pid, metrics = self._read(slot)
+            if slot != _RETIRED and pid:
+                workers += 1
+            if metrics is not None:
+                total.merge(metrics)
+        return total, workers
+
+    def workers(self) -> List[int]:
+        """Returns the pids of the workers holding a slot."""
+        pids = (_SLOT.unpack_from(self._mmap, self._offset(slot))[1] for slot in range(1, self.slots))
+        return [pid for pid in pids if pid]
+
+    def close(self) -> None:
+        """
+        Publishes a final update, folds this worker's slot into the retired
+        totals and releases the file.
+        """
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        if self._slot is not None and self._pid == os.getpid():
+            self.publish()
+            with self._file_lock():
+                self._retire(self._slot)
+        self._slot = None
+        self._release()
+
+    def abandon(self) -> None:
+        """
+        Releases the file without touching the slot; used in a forked child,
+        whose parent still owns the slot and the file lock description.
+        """
+        self._slot = None
+        self._release()
+
+    def _release(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+            os.close(self._fd)
+
+    def __repr__(self) -> str:
+        return f"<SharedMetrics {self.path} slot={self._slot}>"
@@ -0,0 +1,305 @@
+import codecs
+import json
+import logging
+import os
+import re
+import time
+from collections import deque
+from collections.abc import Mapping
+from typing import Any, Callable, Deque, Dict, IO, Iterable, Iterator, List, Optional, Union
+from py_flowcheck.schema import Schema, Violation, _render
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidRecord:
+    """
+    An invalid record sent to a stream sink.
+
+    ``line`` is the 1-based line number for JSON Lines input, or the 1-based
+    position of the record for other iterables. ``errors`` holds the
+    structured violations; ``violations`` renders them as strings.
+    """
+    __slots__ = ("line", "record", "errors")
+
+    def __init__(self, line: int, record: Any, errors: List[Violation]):
+        self.line = line
+        self.record = record
+        self.errors = errors
+
+    @property
+    def violations(self) -> List[str]:
+        return _render(self.errors)
+
+    def __repr__(self) -> str:
+        return f"<InvalidRecord line={self.line} errors={self.errors}>"
+
+
+Sink = Callable[[InvalidRecord], None]
+
+
+def log_sink(invalid: InvalidRecord) -> None:
+    """Default sink: logs each invalid record's line number and violations."""
+    logger.error(f"Stream validation failed at line {invalid.line}: {invalid.violations}")
+
+
+class CollectingSink:
+    """
+    Sink that keeps invalid records in memory, optionally bounded to the
+    most recent ``maxlen`` entries so memory stays constant.
+    """
+
+    def __init__(self, maxlen: Optional[int] = None):
+        self.records: Deque[InvalidRecord] = deque(maxlen=maxlen)
+        self.count = 0
+
+    def __call__(self, invalid: InvalidRecord) -> None:
+        self.count += 1
+        self.records.append(invalid)
+
+
+class JsonlSink:
+    """Sink that writes invalid records as JSON Lines to a file object."""
+
+    def __init__(self, file: IO[str]):
+        self.file = file
+
+    def __call__(self, invalid: InvalidRecord) -> None:
+        self.file.write(json.dumps({
+            "line": invalid.line,
+            "record": invalid.record,
+            "violations": invalid.violations,
+        }, default=str) + "\n")
+
+
+def _validate_records(
+    schema: Schema,
+    records: Iterable[Any],
+    sink: Sink,
+) -> Iterator[Dict[str, Any]]:
+    """Validates (line, record, violations) triples lazily, recording metrics on close."""
+    from py_flowcheck.decorators import _record_batch
+
+    collect = schema._collect
+    new_violations = schema._new_violations
+    start_time = time.perf_counter()
+    total = failures = 0
+    try:
+        for line, record, violations in records:
+            total += 1
+            if not violations:
+                if type(record) is dict or isinstance(record, Mapping):
+                    violations = new_violations()
+                    collect(record, violations)
+                else:
+                    violations.append(Violation(None, "record_type", dict, type(record)))
+
+            if violations:
+                failures += 1
+                sink(InvalidRecord(line, record, violations))
+            else:
+                yield record
+    finally:
+        if total:
+            _record_batch(total, failures, (time.perf_counter() - start_time) * 1000)
+
+
+def validate_stream(
+    schema: Schema,
+    iterable: Iterable[Any],
+    sink: Optional[Sink] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily validates records from any iterable, yielding the valid ones.
+
+    Invalid records are passed to ``sink`` with their violations and position.
+    Only one record is held at a time, so memory does not grow with the input.
+    A single aggregated metrics entry is recorded when the generator finishes
+    or is closed.
+
+    :param schema: The Schema to validate each record against.
+    :param iterable: The records to validate.
+    :param sink: Callable receiving an InvalidRecord for each invalid record.
+    :return: A generator of valid records.
+    """
+    records = ((line, record, []) for line, record in enumerate(iterable, start=1))
+    return _validate_records(schema, records, sink or log_sink)
+
+
+def _parse_lines(lines: Iterable[Union[str, bytes]]) -> Iterator[tuple]:
+    """Parses JSON Lines, turning malformed lines into violations."""
+    for line, raw in enumerate(lines, start=1):
+        if not raw.strip():
+            continue
+        try:
+            yield line, json.loads(raw), []
+        except ValueError as e:
+            text = raw.decode("utf-8", "replace") if isinstance(raw, bytes) else raw
+            yield line, text.rstrip("\r\n"), [Violation(None, "invalid_json", actual=e)]
+
+
+def validate_jsonl(
+    schema: Schema,
+    path_or_file: Union[str, "os.PathLike[str]", IO],
+    sink: Optional[Sink] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily reads and validates a JSON Lines file, yielding the valid records.
+
+    Blank lines are skipped; malformed lines and invalid records go to
+    ``sink`` with their 1-based line numbers.
+
+    :param schema: The Schema to validate each record against.
+    :param path_or_file: A file path or an open text or binary file object.
+    :param sink: Callable receiving an InvalidRecord for each rejected line.
+    :return: A generator of valid records.
+    """
+    if isinstance(path_or_file, (str, os.PathLike)):
+        return _validate_file(schema, path_or_file, sink or log_sink)
+    return _validate_records(schema, _parse_lines(path_or_file), sink or log_sink)
+
+
+def _validate_file(schema: Schema, path: Union[str, "os.PathLike[str]"], sink: Sink) -> Iterator[Dict[str, Any]]:
+    # Opened inside the generator so the file is closed when iteration ends
+    with open(path, "rb") as file:
+        yield from _validate_records(schema, _parse_lines(file), sink)
+
+
+_decoder = json.JSONDecoder()
+_skip_whitespace = re.compile(r"[ \t\n\r]*").match
+# Characters that may continue a number; a number followed only by these up to
+# the end of the buffer may be cut short by the chunk boundary (e.g. "12." or "1e-")
+_number_tail = re.compile(r"[0-9.eE+\-]*").fullmatch
+
+
+class _ChunkReader:
+    """Reads text from a text or binary file object, decoding bytes incrementally."""
+
+    def __init__(self, file: IO, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.eof = False
+
+    def read(self, size: int) -> str:
+        data = self.file.read(size)
+        if not data:
+            self.eof = True
+            if isinstance(data, bytes):
+                return self.decoder.decode(b"", final=True)
+            return ""
+        if isinstance(data, bytes):
+            return self.decoder.decode(data)
+        return data
+
+
+def iter_json_array(file: IO, chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Incrementally parses a JSON document whose top level is an array,
+    yielding one element at a time.
+
+    Only the element being parsed and the current chunk are held in memory,
+    so peak memory is proportional to the largest element rather than the
+    whole document.
+
+    :param file: An open text or binary file object positioned at the document.
+    :param chunk_size: Number of bytes or characters read per chunk.
+    :return: A generator of array elements.
+    :raises ValueError: If the document is not a well-formed JSON array.
+    """
+    reader = _ChunkReader(file, chunk_size)
+    buffer = ""
+    pos = 0
+    expect_comma = False
+
+    def skip_whitespace() -> bool:
+        """Advances past whitespace, reading more input as needed; False at EOF."""
+        nonlocal buffer, pos
+        while True:
+            pos = _skip_whitespace(buffer, pos).end()
+            if pos < len(buffer):
+                return True
+            if reader.eof:
+                return False
+            buffer, pos = reader.read(chunk_size), 0
+
+    if not skip_whitespace() or buffer[pos] != "[":
+        raise ValueError("Expected a JSON document with a top-level array")
+    pos += 1
+
+    while True:
+        if not skip_whitespace():
+            raise ValueError("Unexpected end of JSON array")
+
+        char = buffer[pos]
+        if char == "]":
+            pos += 1
+            if skip_whitespace():
+                raise ValueError(f"Unexpected data after JSON array: {buffer[pos:pos + 20]!r}")
+            return
+        if expect_comma:
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+            pos += 1
+            if not skip_whitespace():
+                raise ValueError("Unexpected end of JSON array")
+
+        read_size = chunk_size
+        while True:
+            try:
+                element, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if reader.eof:
+                    raise
+                element, end = None, None
+            # A value ending exactly at the buffer edge may continue in the
+            # next chunk, and a number may have been decoded from a prefix of
+            # its literal (e.g. "7773" from "7773." at the edge), so read more
+            if end is not None and (reader.eof or (
+                end < len(buffer)
+                and not (type(element) in (int, float) and _number_tail(buffer, end))
+            )):
+                break
+            buffer = buffer[pos:] + reader.read(read_size)
+            pos = 0
+            # Grow reads for large elements to avoid re-parsing quadratically
+            read_size *= 2
+
+        pos = end
+        expect_comma = True
+        if pos > chunk_size:
+            # Drop consumed input so the buffer never holds parsed elements
+            buffer, pos = buffer[pos:], 0
+        yield element
+
+
+def validate_json_array(
+    schema: Schema,
+    path_or_file: Union[str, "os.PathLike[str]", IO],
+    sink: Optional[Sink] = None,
+    chunk_size: int = 65536,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Validates the elements of a top-level JSON array as they are parsed,
+    yielding valid elements and discarding each one after validation.
+
+    Invalid elements go to ``sink``; their ``line`` is the 1-based position
+    of the element in the array.
+
+    :param schema: The Schema to validate each element against.
+    :param path_or_file: A file path or an open text or binary file object.
+    :param sink: Callable receiving an InvalidRecord for each invalid element.
+    :param chunk_size: Number of bytes or characters read per chunk.
+    :return: A generator of valid elements.
+    :raises ValueError: If the document is not a well-formed JSON array.
+    """
+    if isinstance(path_or_file, (str, os.PathLike)):
+        return _validate_array_file(schema, path_or_file, sink or log_sink, chunk_size)
+    return validate_stream(schema, iter_json_array(path_or_file, chunk_size), sink)
+
+
+def _validate_array_file(
+    schema: Schema, path: Union[str, "os.PathLike[str]"], sink: Sink, chunk_size: int
+) -> Iterator[Dict[str, Any]]:
+    with open(path, "rb") as file:
+        yield from validate_stream(schema, iter_json_array(file, chunk_size), sink)
@@ -0,0 +1,165 @@
+import asyncio
+import pytest
+from py_flowcheck import Schema, ValidationError, batched_validator
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+async def _exists(value):
+    await asyncio.sleep(0.01)
+    return value != 404
+
+
+def test_avalidate_with_async_validator():
+    """Test awaiting async validators alongside synchronous rules."""
+    schema = Schema({
+        "user_id": {"type": int, "validator": _exists},
+        "name": {"type": str, "min_length": 2},
+    })
+
+    _run(schema.avalidate({"user_id": 1, "name": "Al"}))
+    with pytest.raises(ValidationError) as exc_info:
+        _run(schema.avalidate({"user_id": 404, "name": "A"}))
+    assert [(v.path, v.code) for v in exc_info.value.errors] == [("name", "min_length"), ("user_id", "custom")]
+
+
+def test_async_checks_run_concurrently():
+    """Test that independent async checks in one payload overlap."""
+    async def slow(value):
+        await asyncio.sleep(0.05)
+        return True
+
+    schema = Schema({"refs": {"type": list, "items": {"type": int, "validator": slow}}})
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await schema.avalidate({"refs": list(range(20))})
+        return loop.time() - start
+
+    assert _run(main()) < 0.5
+
+
+def test_async_validator_errors_and_codegen():
+    """Test that async validator exceptions are violations, with codegen too."""
+    async def broken(value):
+        raise RuntimeError("cache down")
+
+    for codegen in (False, True):
+        schema = Schema({"ref": {"type": int, "validator": broken}, "x": int}, codegen=codegen)
+        result = _run(schema.acheck({"ref": 1, "x": 2}))
+        assert [v.code for v in result.errors] == ["custom_error"]
+        assert "cache down" in result.violations[0]
+
+
+def test_sync_validate_rejects_async_validators():
+    """Test that synchronous validation points to avalidate()."""
+    schema = Schema({"ref": {"type": int, "validator": _exists}})
+    with pytest.raises(TypeError, match="avalidate"):
+        schema.validate({"ref": 1})
+
+
+def test_async_checks_skipped_when_limit_reached():
+    """Test that fail_fast skips async checks once a synchronous rule failed."""
+    calls = []
+
+    async def tracked(value):
+        calls.append(value)
+        return True
+
+    schema = Schema({"a": int, "b": {"type": int, "validator": tracked}}, fail_fast=True)
+    result = _run(schema.acheck({"a": "x", "b": 1}))
+    assert len(result.errors) == 1 and calls == []
+
+
+def test_batched_validator_coalesces_concurrent_lookups():
+    """Test that identical lookups across concurrent validations share one batch call."""
+    batches = []
+
+    @batched_validator(max_batch_size=100)
+    async def users_exist(ids):
+        batches.append(sorted(ids))
+        await asyncio.sleep(0.01)
+        return {user_id: user_id < 100 for user_id in ids}
+
+    schema = Schema({
+        "owner": {"type": int, "validator": users_exist},
+        "members": {"type": list, "items": {"type": int, "validator": users_exist}},
+    })
+
+    async def main():
+        payloads = [{"owner": 1, "members": [2, 3, 1]}, {"owner": 2, "members": [150]}, {"owner": 3, "members": []}]
+        return await asyncio.gather(*(schema.acheck(payload) for payload in payloads))
+
+    results = _run(main())
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].errors[0].path == "members[0]"
+    assert batches == [[1, 2, 3, 150]]
+
+
+def test_batched_validator_joins_in_flight_lookup_and_splits_batches():
+    """Test batch size limits and joining a lookup that is already running."""
+    batches = []
+
+    @batched_validator(max_batch_size=2)
+    async def known(values):
+        batches.append(list(values))
+        await asyncio.sleep(0.02)
+        return [True] * len(values)
+
+    async def main():
+        first = asyncio.ensure_future(asyncio.gather(known(1), known(2), known(3)))
+        await asyncio.sleep(0.005)
+        # 1 is still being looked up, so this joins the in-flight batch
+        assert await known(1) is True
+        return await first
+
+    assert _run(main()) == [True, True, True]
+    assert batches == [[1, 2], [3]]
+
+
+def test_batched_validator_failure_is_reported():
+    """Test that a failing batch call becomes a custom_error for every caller."""
+    @batched_validator()
+    async def unavailable(values):
+        raise ConnectionError("no cache")
+
+    schema = Schema({"ref": {"type": int, "validator": unavailable}})
+    result = _run(schema.acheck({"ref": 1}))
+    assert result.errors[0].code == "custom_error"
+
+
+def test_batched_validator_keeps_equal_values_of_different_types_apart():
+    """Test that 1, True and 1.0 are looked up separately and get their own results."""
+    batches = []
+
+    @batched_validator()
+    async def is_int(values):
+        batches.append(values)
+        return [type(value) is int for value in values]
+
+    async def main():
+        return await asyncio.gather(is_int(1), is_int(True), is_int(1.0), is_int(1))
+
+    assert _run(main()) == [True, False, False, True]
+    assert batches == [[1, True, 1.0]]
+    assert [type(value) for value in batches[0]] == [int, bool, float]
+    assert not is_int._tasks
+
+
+def test_batched_validator_rejects_mapping_for_equal_values_of_different_types():
+    """Test that a mapping result cannot give 1, True and 1.0 the same verdict."""
+    @batched_validator()
+    async def is_int(values):
+        return {value: type(value) is int for value in values}
+
+    async def main():
+        return await asyncio.gather(is_int(1), is_int(True), is_int(1.0), return_exceptions=True)
+
+    results = _run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert "sequence" in str(results[0])
+    assert _run(is_int(1)) is True
+    assert not is_int._tasks
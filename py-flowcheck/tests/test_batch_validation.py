@@ -0,0 +1,61 @@
+import pytest
+from py_flowcheck import Schema, BatchResult, get_metrics, reset_metrics
+
+
+schema = Schema({
+    "id": int,
+    "name": {"type": str, "min_length": 1},
+})
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_validate_many_flags_and_violations(codegen):
+    """Test that batch validation reports valid flags and violations by index."""
+    batch_schema = Schema(schema.schema, codegen=codegen)
+    records = [
+        {"id": 1, "name": "a"},
+        {"id": "2", "name": "b"},
+        {"id": 3, "name": "c"},
+        {"id": 4, "name": ""},
+    ]
+
+    result = batch_schema.validate_many(records)
+
+    assert isinstance(result, BatchResult)
+    assert list(result.valid) == [1, 0, 1, 0]
+    assert result.invalid_indices == [1, 3]
+    assert result.valid_count == 2
+    assert len(result) == 4
+    assert not result.ok
+    assert "Field 'id' must be of type int, got str" in result.violations[1]
+
+
+def test_validate_many_accepts_iterables_and_non_mappings():
+    """Test that generators work and non-mapping records are reported, not raised."""
+    result = schema.validate_many(x for x in [{"id": 1, "name": "a"}, None, ["id"]])
+
+    assert list(result.valid) == [1, 0, 0]
+    assert result.violations[1] == ["Record must be of type dict, got NoneType"]
+    assert result.violations[2] == ["Record must be of type dict, got list"]
+
+
+def test_validate_many_records_single_metrics_entry():
+    """Test that a batch is recorded as one aggregated metrics entry."""
+    reset_metrics()
+
+    result = schema.validate_many([{"id": i, "name": "n"} for i in range(1000)] + [{}])
+
+    assert result.valid_count == 1000
+    metrics = get_metrics()
+    assert metrics["validation_calls"] == 1001
+    assert metrics["validation_failures"] == 1
+    assert metrics["validation_batches"] == 1
+    assert len(metrics["validation_time_ms"]) == 1
+
+
+def test_validate_many_empty_batch():
+    """Test that an empty batch is valid."""
+    result = schema.validate_many([])
+
+    assert result.ok
+    assert len(result) == 0
@@ -0,0 +1,107 @@
+import pytest
+from py_flowcheck import Schema, ValidationError
+
+
+DEFINITION = {
+    "id": int,
+    "email": {"type": str, "regex": r".+@.+\..+"},
+    "age": {"type": int, "nullable": True, "min": 0, "max": 120},
+    "status": {"type": str, "enum": ["active", "inactive"]},
+    "username": {"type": str, "min_length": 3, "max_length": 10},
+    "even": {"type": int, "nullable": True, "validator": lambda x: x % 2 == 0},
+    "profile": {
+        "type": dict,
+        "schema": {
+            "bio": {"type": str, "max_length": 20},
+            "tags": {"type": list, "items": {"type": str, "min_length": 2}},
+        },
+    },
+}
+
+
+def _violations(schema, data):
+    try:
+        schema.validate(data)
+    except ValidationError as e:
+        return e.violations
+    return []
+
+
+@pytest.mark.parametrize("data", [
+    {"id": 1, "email": "a@b.co", "age": 30, "status": "active", "username": "john",
+     "even": 2, "profile": {"bio": "hi", "tags": ["ab", "cd"]}},
+    {"id": "x", "email": "nope", "age": -1, "status": "gone", "username": "jo",
+     "even": 3, "profile": {"bio": "x" * 30, "tags": ["a", 5, None]}},
+    {"email": None, "age": None, "status": 1, "username": "waytoolongname",
+     "even": None, "profile": []},
+    {},
+])
+def test_codegen_matches_plan(data):
+    """Test that generated validators report exactly what the plan reports."""
+    planned = Schema(DEFINITION)
+    generated = Schema(DEFINITION, codegen=True)
+
+    assert _violations(generated, data) == _violations(planned, data)
+
+
+def test_generated_source_is_exposed():
+    """Test that the generated source is available for debugging."""
+    schema = Schema({"id": int, "user": {"type": dict, "schema": {"name": str}}}, codegen=True)
+
+    assert schema.source.startswith("def validate(data, violations):")
+    assert "type(v1) is not int" in schema.source
+    # Nested schemas are unrolled into the same function
+    assert 'Violation(f"user.name", \'required\')' in schema.source
+    assert Schema({"id": int}).source is None
+
+
+def test_codegen_escapes_field_names():
+    """Test that unusual field names are safely embedded in generated code."""
+    schema = Schema({'we"ird{name}': int, "back\\slash": str}, codegen=True)
+
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate({})
+    assert exc_info.value.violations == [
+        "Field 'we\"ird{name}' is required but missing",
+        "Field 'back\\slash' is required but missing",
+    ]
+
+
+def test_codegen_handles_infinite_bounds():
+    """Test that infinite bounds and enum members compile and match the plan."""
+    inf = float("inf")
+    definition = {
+        "low": {"type": float, "min": -inf, "max": 0.0},
+        "high": {"type": float, "min": 0.0, "max": inf},
+        "choice": {"type": float, "enum": [-inf, 1.5, inf]},
+    }
+    planned = Schema(definition)
+    generated = Schema(definition, codegen=True)
+
+    for data in (
+        {"low": -inf, "high": inf, "choice": inf},
+        {"low": 1.0, "high": -1.0, "choice": 2.0},
+        {"low": -1e308, "high": 1e308, "choice": -inf},
+    ):
+        assert _violations(generated, data) == _violations(planned, data)
+    assert generated.check({"low": -inf, "high": inf, "choice": -inf}).ok
+
+
+@pytest.mark.parametrize("data", [
+    {"x": 1, "tags": ["a", b"b"]},
+    {"x": 2.5, "tags": []},
+    {"x": -1, "tags": ["a", 3]},
+    {"x": "1", "tags": "ab"},
+    {"x": None, "tags": None},
+])
+def test_codegen_tuple_types_match_plan(data):
+    """Test that tuple types, as loaded for "number", compile and match the plan."""
+    definition = {
+        "x": {"type": (int, float), "min": 0},
+        "tags": {"type": (list, tuple), "nullable": True, "items": {"type": (str, bytes)}},
+    }
+    planned = Schema(definition)
+    generated = Schema(definition, codegen=True)
+
+    assert generated._generated is not None
+    assert _violations(generated, data) == _violations(planned, data)
@@ -0,0 +1,91 @@
+import pytest
+from py_flowcheck import Schema, ValidationError, get_metrics, reset_metrics
+
+np = pytest.importorskip("numpy")
+
+
+schema = Schema({
+    "id": {"type": int, "min": 1},
+    "score": {"type": float, "min": 0.0, "max": 100.0},
+    "status": {"type": str, "enum": ["active", "inactive"]},
+    "note": {"type": str, "nullable": True, "max_length": 5},
+})
+
+
+def _row_failures(columns):
+    """Reference result computed with row-at-a-time validation."""
+    failures = set()
+    num_rows = len(next(iter(columns.values())))
+    for row in range(num_rows):
+        record = {name: values[row] for name, values in columns.items()}
+        try:
+            schema.validate(record)
+        except ValidationError:
+            failures.add(row)
+    return failures
+
+
+def test_numpy_columns():
+    """Test vectorized validation over NumPy arrays."""
+    columns = {
+        "id": np.array([1, 2, 0, 4]),
+        "score": np.array([10.0, 101.0, 50.0, -1.0]),
+        "status": np.array(["active", "inactive", "active", "deleted"]),
+        "note": np.array([None, "ok", "too long", None], dtype=object),
+    }
+
+    result = schema.validate_columns(columns)
+
+    assert not result.ok
+    assert result.violations["id"]["min"].tolist() == [2]
+    assert result.violations["score"]["max"].tolist() == [1]
+    assert result.violations["score"]["min"].tolist() == [3]
+    assert result.violations["status"]["enum"].tolist() == [3]
+    assert result.violations["note"]["rules"].tolist() == [2]
+    assert result.rows["score"].tolist() == [1, 3]
+    assert result.invalid_rows.tolist() == [1, 2, 3]
+
+
+def test_list_columns_match_row_validation():
+    """Test that dict-of-lists input matches row-at-a-time semantics."""
+    columns = {
+        "id": [1, "2", None, True, 5],
+        "score": [1.0, 2, 3.5, 4.0, None],
+        "status": ["active", "inactive", 3, "active", "inactive"],
+        "note": [None, None, None, None, "hi"],
+    }
+
+    result = schema.validate_columns(columns)
+
+    assert set(result.invalid_rows.tolist()) == _row_failures(columns)
+    assert result.violations["id"]["type"].tolist() == [1]
+    assert result.violations["id"]["required"].tolist() == [2]
+    assert result.violations["score"]["type"].tolist() == [1]
+    assert result.violations["status"]["type"].tolist() == [2]
+
+
+def test_missing_column_and_length_mismatch():
+    """Test missing columns and columns of different lengths."""
+    result = Schema({"a": int, "b": {"type": int, "nullable": True}}).validate_columns({"a": [1, 2]})
+
+    assert result.ok
+
+    result = Schema({"a": int, "b": int}).validate_columns({"a": [1, 2]})
+    assert result.violations["b"]["required"].tolist() == [0, 1]
+
+    with pytest.raises(ValueError, match="same length"):
+        schema.validate_columns({"id": [1, 2], "score": [1.0]})
+
+
+def test_validate_columns_records_batch_metrics():
+    """Test that columnar validation records one aggregated metrics entry."""
+    reset_metrics()
+    columns = {"id": np.arange(1, 1001), "score": np.full(1000, 5.0),
+               "status": np.array(["active"] * 1000), "note": [None] * 1000}
+
+    assert schema.validate_columns(columns).ok
+
+    metrics = get_metrics()
+    assert metrics["validation_calls"] == 1000
+    assert metrics["validation_failures"] == 0
+    assert metrics["validation_batches"] == 1
@@ -0,0 +1,167 @@
+import pytest
+from py_flowcheck import Schema, ValidationError
+
+
+def test_schema_is_compiled_once():
+    """Test that the definition is compiled into one plan entry per field."""
+    schema = Schema({
+        "id": int,
+        "email": {"type": str, "regex": r".+@.+\..+"},
+        "age": {"type": int, "nullable": True, "min": 0, "max": 120},
+    })
+
+    assert [field.name for field in schema._plan] == ["id", "email", "age"]
+    assert schema._plan[2].nullable is True
+    assert len(schema._plan[2].checks) == 2
+
+
+def test_compiled_plan_does_not_read_definition():
+    """Test that validation runs from the compiled plan, not the raw rule dict."""
+    definition = {"value": {"type": int, "min": 10}}
+    schema = Schema(definition)
+
+    # Mutating the raw definition after construction has no effect
+    definition["value"]["min"] = 0
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate({"value": 5})
+    assert "must be at least 10" in str(exc_info.value.violations)
+
+
+def test_nested_schema_instance():
+    """Test that a Schema instance can be reused as a nested rule."""
+    address = Schema({"city": str, "zip": {"type": str, "regex": r"^\d{5}$"}})
+    schema = Schema({"address": {"type": dict, "schema": address}})
+
+    schema.validate({"address": {"city": "Springfield", "zip": "12345"}})
+
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate({"address": {"city": "Springfield", "zip": "abc"}})
+    assert "address.zip" in str(exc_info.value.violations)
+
+
+def test_violation_order_matches_field_order():
+    """Test that violations are reported in definition order."""
+    schema = Schema({"a": int, "b": str, "c": {"type": list, "items": int}})
+
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate({"a": "x", "b": 1, "c": [1, "two"]})
+    violations = exc_info.value.violations
+    assert violations[0].startswith("Field 'a'")
+    assert violations[1].startswith("Field 'b'")
+    assert violations[2].startswith("Field 'c[1]'")
+
+
+def test_regex_fullmatch_mode():
+    """Test choosing fullmatch instead of match semantics for regex rules."""
+    prefix = Schema({"code": {"type": str, "regex": r"[A-Z]{3}"}})
+    full = Schema({"code": {"type": str, "regex": r"[A-Z]{3}"}}, regex_mode="fullmatch")
+    per_rule = Schema({"code": {"type": str, "regex": r"[A-Z]{3}", "regex_mode": "fullmatch"}})
+
+    prefix.validate({"code": "ABCD"})
+    for schema in (full, per_rule):
+        schema.validate({"code": "ABC"})
+        with pytest.raises(ValidationError):
+            schema.validate({"code": "ABCD"})
+
+    with pytest.raises(ValueError):
+        Schema({"code": {"type": str, "regex": "x", "regex_mode": "search"}})
+
+
+def test_regex_rule_does_not_require_str_type():
+    """Test that non-string values are still stringified for regex rules."""
+    schema = Schema({"zip": {"regex": r"^\d{5}$"}}, codegen=True)
+
+    schema.validate({"zip": 12345})
+    with pytest.raises(ValidationError):
+        schema.validate({"zip": 123})
+
+
+def test_pattern_cache_is_shared():
+    """Test that schemas share compiled patterns and record hits and misses."""
+    from py_flowcheck import get_metrics, reset_metrics
+    from py_flowcheck.schema import _pattern_cache
+
+    reset_metrics()
+    first = Schema({"a": {"type": str, "regex": r"^shared-cache-\w+$"}})
+    second = Schema({"b": {"type": str, "regex": r"^shared-cache-\w+$"}})
+
+    assert first._plan[0].checks[0].pattern is second._plan[0].checks[0].pattern
+    stats = get_metrics()["regex_cache"]
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["size"] <= _pattern_cache.maxsize
+
+
+def test_pattern_cache_is_bounded():
+    """Test that the LRU pattern cache evicts the least recently used entry."""
+    from py_flowcheck.schema import _PatternCache
+
+    cache = _PatternCache(maxsize=2)
+    a = cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")  # Evicts "b"
+
+    assert cache.stats() == {"hits": 1, "misses": 3, "size": 2}
+    assert cache.get("a") is a
+    cache.get("b")
+    assert cache.stats()["misses"] == 4
+
+
+def _deep(depth, leaf):
+    definition = {"value": {"type": int, "min": 0}}
+    data = {"value": leaf}
+    for _ in range(depth - 1):
+        definition = {"nested": {"type": dict, "schema": definition}}
+        data = {"nested": data}
+    return definition, data
+
+
+def test_deeply_nested_schema_does_not_recurse():
+    """Test that nesting far past the recursion limit validates iteratively."""
+    definition, data = _deep(3000, 1)
+    schema = Schema(definition)
+    schema.validate(data)
+
+    definition, data = _deep(3000, -1)
+    result = Schema(definition).check(data)
+    assert not result.ok
+    assert result.errors[0].path == "nested." * 2999 + "value"
+
+
+def test_deep_codegen_falls_back_to_plan_engine():
+    """Test that codegen is skipped for schemas too deep to compile."""
+    definition, data = _deep(500, -1)
+    schema = Schema(definition, codegen=True)
+
+    assert schema._generated is None
+    assert not schema.check(data).ok
+
+
+def test_nested_item_path():
+    """Test that violation paths combine nested fields and item indices."""
+    schema = Schema({
+        "user": {"type": dict, "schema": {
+            "profile": {"type": dict, "schema": {
+                "interests": {"type": list, "items": {"type": str, "min_length": 2}},
+            }},
+        }},
+    })
+
+    result = schema.check({"user": {"profile": {"interests": ["go", "py", "ai", "x"]}}})
+    assert [v.path for v in result.errors] == ["user.profile.interests[3]"]
+
+
+def test_nested_violation_order_matches_codegen():
+    """Test that the plan engine reports nested violations depth-first like codegen."""
+    definition = {
+        "a": {"type": dict, "schema": {"x": int, "y": {"type": list, "items": int}}},
+        "b": {"type": list, "items": {"type": dict, "schema": {"z": str}}},
+        "c": int,
+    }
+    data = {"a": {"x": "1", "y": [1, "2"]}, "b": [{"z": 1}, {"z": 2}], "c": "3"}
+
+    plan = Schema(definition).check(data).violations
+    generated = Schema(definition, codegen=True).check(data).violations
+    assert plan == generated
+    assert len(plan) == 5
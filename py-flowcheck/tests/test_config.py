@@ -118,4 +118,19 @@ def test_environment_variables(monkeypatch):
     # Reset environment variables
     monkeypatch.delenv("PY_FLOWCHECK_ENV", raising=False)
     monkeypatch.delenv("PY_FLOWCHECK_SAMPLE_SIZE", raising=False)
-    monkeypatch.delenv("PY_FLOWCHECK_MODE", raising=False)
\ No newline at end of file
+    monkeypatch.delenv("PY_FLOWCHECK_MODE", raising=False)
+
+def test_violation_limit_configuration():
+    """
+    Test that fail_fast and max_violations can be configured globally.
+    """
+    configure(fail_fast=True, max_violations=5)
+    config = get_config()
+    assert config.fail_fast is True
+    assert config.max_violations == 5
+
+    with pytest.raises(ValueError, match="max_violations must be non-negative"):
+        Config(max_violations=-1)
+
+    # Reset the configuration to default
+    configure(fail_fast=False, max_violations=0)
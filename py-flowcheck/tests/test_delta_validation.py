@@ -0,0 +1,100 @@
+import pytest
+from py_flowcheck import Schema, ValidationError
+
+
+def _customer_schema(calls):
+    def tracked(name):
+        def validator(value):
+            calls.append(name)
+            return True
+        return validator
+
+    return Schema({
+        "id": {"type": int, "validator": tracked("id")},
+        "email": {"type": str, "regex": r".+@.+", "validator": tracked("email")},
+        "address": {
+            "type": dict,
+            "validator": lambda address: address.get("zip") != "00000" or address.get("city") == "Nowhere",
+            "schema": {
+                "city": {"type": str, "validator": tracked("city")},
+                "zip": {"type": str, "regex": r"^\d{5}$"},
+            },
+        },
+        "tags": {"type": list, "items": str},
+    })
+
+
+DOCUMENT = {
+    "id": 1,
+    "email": "a@example.com",
+    "address": {"city": "Springfield", "zip": "12345"},
+    "tags": ["vip"],
+}
+
+
+def test_delta_runs_only_touched_rules():
+    """Test that only the changed fields are validated and the merge is returned."""
+    calls = []
+    schema = _customer_schema(calls)
+
+    merged = schema.validate_delta(DOCUMENT, {"email": "b@example.com"})
+
+    assert calls == ["email"]
+    assert merged == dict(DOCUMENT, email="b@example.com")
+    assert DOCUMENT["email"] == "a@example.com"
+
+
+def test_delta_reports_touched_violations():
+    """Test that violations in changed fields are raised with their paths."""
+    schema = _customer_schema([])
+
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate_delta(DOCUMENT, {"email": "nope", "tags": ["ok", 3]})
+    assert [v.path for v in exc_info.value.errors] == ["email", "tags[1]"]
+
+
+def test_delta_merges_nested_changes():
+    """Test that nested mappings are merged and only the nested changes are checked."""
+    calls = []
+    schema = _customer_schema(calls)
+
+    merged = schema.validate_delta(DOCUMENT, {"address": {"zip": "54321"}})
+    assert merged["address"] == {"city": "Springfield", "zip": "54321"}
+    assert calls == []
+
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate_delta(DOCUMENT, {"address": {"zip": "bad"}})
+    assert [v.path for v in exc_info.value.errors] == ["address.zip"]
+
+
+def test_delta_field_rules_see_merged_value():
+    """Test that a nested field's own validator runs against the merged document."""
+    schema = _customer_schema([])
+
+    schema.validate_delta(DOCUMENT, {"address": {"zip": "00000", "city": "Nowhere"}})
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate_delta(DOCUMENT, {"address": {"zip": "00000"}})
+    assert [v.code for v in exc_info.value.errors] == ["custom"]
+
+
+def test_delta_replacing_nested_value_validates_in_full():
+    """Test that a non-mapping or new nested value is validated against the whole nested schema."""
+    schema = _customer_schema([])
+    previous = dict(DOCUMENT, address=None)
+
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate_delta(previous, {"address": {"zip": "12345"}})
+    assert [v.path for v in exc_info.value.errors] == ["address.city"]
+
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate_delta(DOCUMENT, {"address": "Main St"})
+    assert exc_info.value.errors[0].code == "type"
+
+
+def test_delta_removing_required_field():
+    """Test that setting a required field to None is reported."""
+    schema = _customer_schema([])
+
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate_delta(DOCUMENT, {"id": None}, fail_fast=True)
+    assert exc_info.value.errors[0].code == "required"
@@ -1,4 +1,4 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Depends
 from fastapi.testclient import TestClient
 import pytest
 from py_flowcheck import Schema
@@ -41,4 +41,67 @@ def test_perform_action_update():
 
 def test_perform_action_delete():
     response = client.post("/action", json={"user_id": 1, "action": "delete"})
-    assert response.status_code == 200
\ No newline at end of file
+    assert response.status_code == 200
+
+def test_validation_middleware_uses_result_objects():
+    """Test that the middleware rejects invalid requests without raising."""
+    from py_flowcheck.integrations.fastapi import setup_fastapi_validation
+
+    middleware_app = FastAPI()
+
+    @middleware_app.post("/items")
+    async def create_item(request: Request):
+        return {"success": True, "message": "created"}
+
+    setup_fastapi_validation(middleware_app, {
+        "post:/items": {"request_schema": request_schema, "response_schema": response_schema}
+    })
+    middleware_client = TestClient(middleware_app)
+
+    assert middleware_client.post("/items", json={"user_id": 1, "action": "a"}).status_code == 200
+
+    response = middleware_client.post("/items", json={"user_id": "x", "action": "a"})
+    assert response.status_code == 422
+    assert "Field 'user_id' must be of type int, got str" in response.json()["detail"]
+
+def test_dependency_awaits_async_validators():
+    """Test that the validation dependency supports async validators."""
+    import asyncio
+    from py_flowcheck.integrations.fastapi import create_validation_dependency
+
+    async def known_user(user_id):
+        await asyncio.sleep(0)
+        return user_id != 404
+
+    async_app = FastAPI()
+    dependency = create_validation_dependency(Schema({"user_id": {"type": int, "validator": known_user}}))
+
+    @async_app.post("/lookup")
+    async def lookup(data: dict = Depends(dependency)):
+        return data
+
+    async_client = TestClient(async_app)
+    assert async_client.post("/lookup", json={"user_id": 1}).status_code == 200
+    assert async_client.post("/lookup", json={"user_id": 404}).status_code == 422
+
+def test_malformed_json_body_is_rejected():
+    """Test that the middleware and dependency reject malformed JSON with a 400."""
+    from py_flowcheck.integrations.fastapi import create_validation_dependency, setup_fastapi_validation
+
+    json_app = FastAPI()
+    dependency = create_validation_dependency(request_schema)
+
+    @json_app.post("/parsed")
+    async def parsed(data: dict = Depends(dependency)):
+        return data
+
+    @json_app.post("/items")
+    async def create_item(request: Request):
+        return {"success": True, "message": "created"}
+
+    setup_fastapi_validation(json_app, {"post:/items": {"request_schema": request_schema}})
+    json_client = TestClient(json_app)
+
+    assert json_client.post("/parsed", json={"user_id": 1, "action": "a"}).json() == {"user_id": 1, "action": "a"}
+    assert json_client.post("/parsed", content=b'{"user_id": 1,').status_code == 400
+    assert json_client.post("/items", content=b'{"user_id": 1,').status_code == 400
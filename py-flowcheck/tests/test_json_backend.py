@@ -0,0 +1,62 @@
+import asyncio
+import json
+import pytest
+from py_flowcheck import Schema, ValidationError
+from py_flowcheck.json_backend import BACKEND, loads
+from py_flowcheck.monitoring import HealthChecker
+
+user_schema = Schema({"id": int, "name": str, "tags": {"type": list, "items": str}})
+
+
+def test_validate_json_returns_parsed_document():
+    """Test that validate_json parses bytes, memoryviews and str and returns the document."""
+    raw = json.dumps({"id": 1, "name": "a", "tags": ["x"]}).encode()
+    for source in (raw, bytearray(raw), memoryview(raw), raw.decode()):
+        assert user_schema.validate_json(source) == {"id": 1, "name": "a", "tags": ["x"]}
+
+
+def test_validate_json_reports_schema_violations():
+    """Test that schema violations in the parsed document raise ValidationError."""
+    with pytest.raises(ValidationError) as exc_info:
+        user_schema.validate_json(b'{"id": "1", "name": "a", "tags": [2]}')
+    assert [error.code for error in exc_info.value.errors] == ["type", "type"]
+
+
+def test_check_json_reports_malformed_and_non_object_documents():
+    """Test that malformed JSON and non-object documents become violations."""
+    result = user_schema.check_json(b'{"id": 1,')
+    assert not result.ok
+    assert [error.code for error in result.errors] == ["invalid_json"]
+    assert result.value is None
+
+    result = user_schema.check_json(b"[1, 2]")
+    assert [error.code for error in result.errors] == ["record_type"]
+    assert result.value == [1, 2]
+
+    with pytest.raises(ValidationError):
+        user_schema.validate_json(b"not json")
+
+
+def test_check_json_keeps_value_and_honours_options():
+    """Test that check_json returns the parsed value and respects per-call limits."""
+    result = user_schema.check_json(b'{"id": "x", "name": 2, "tags": []}', max_violations=1)
+    assert result.value == {"id": "x", "name": 2, "tags": []}
+    assert len(result.errors) == 1
+
+
+def test_acheck_json_awaits_async_validators():
+    """Test that acheck_json parses once and awaits async validators."""
+    async def known(value):
+        await asyncio.sleep(0)
+        return value != 404
+
+    schema = Schema({"id": {"type": int, "validator": known}})
+    assert asyncio.run(schema.acheck_json(b'{"id": 1}')).value == {"id": 1}
+    assert not asyncio.run(schema.acheck_json(b'{"id": 404}')).ok
+
+
+def test_backend_is_reported_in_health_status():
+    """Test that the selected JSON backend is visible in the health status."""
+    assert BACKEND in ("orjson", "json")
+    assert HealthChecker().get_health_status()["json_backend"] == BACKEND
+    assert loads(memoryview(b'{"a": 1}')) == {"a": 1}
@@ -0,0 +1,161 @@
+import json
+import os
+import pytest
+from py_flowcheck import Schema, SchemaRegistry, ValidationError
+from py_flowcheck import loader
+
+
+USER = {
+    "id": "int",
+    "email": {"type": "str", "regex": r".+@.+\..+"},
+    "age": {"type": "int", "nullable": True, "min": 0},
+    "score": {"type": "number"},
+    "tags": {"type": "list", "items": {"type": "str", "min_length": 2}},
+    "address": {"type": "dict", "schema": {"city": "str", "zip": {"type": "str", "regex": r"^\d{5}$"}}},
+}
+
+
+def _write(path, definition):
+    path.write_text(json.dumps(definition))
+    return path
+
+
+def test_load_json_schema(tmp_path):
+    """Test loading a JSON schema file with type names."""
+    schema = Schema.load(_write(tmp_path / "user.json", USER), cache=False)
+    data = {
+        "id": 1, "email": "a@example.com", "age": None, "score": 1.5,
+        "tags": ["ab"], "address": {"city": "X", "zip": "12345"},
+    }
+
+    schema.validate(data)
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate(dict(data, score="high", address={"city": "X", "zip": "1"}))
+    assert [v.path for v in exc_info.value.errors] == ["score", "address.zip"]
+
+
+def test_load_yaml_schema(tmp_path):
+    """Test loading a YAML schema file."""
+    pytest.importorskip("yaml")
+    path = tmp_path / "event.yaml"
+    path.write_text(
+        "kind:\n  type: str\n  enum: [click, view]\n"
+        "count:\n  type: int\n  min: 1\n"
+    )
+
+    schema = Schema.load(path, cache=False)
+    schema.validate({"kind": "click", "count": 2})
+    assert not schema.check({"kind": "scroll", "count": 0}).ok
+
+
+def test_warm_load_skips_compilation(tmp_path, monkeypatch):
+    """Test that a second load of an unchanged file reads the cached plan."""
+    path = _write(tmp_path / "user.json", USER)
+    schema, warm, _ = loader.load_schema(path)
+    assert not warm
+    assert len(os.listdir(tmp_path / "__flowcheck_cache__")) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("compiled on a warm load")
+    monkeypatch.setattr("py_flowcheck.schema._compile_plan", fail)
+
+    cached, warm, _ = loader.load_schema(path)
+    assert warm
+    assert cached.check({"id": "x"}).violations == schema.check({"id": "x"}).violations
+
+
+def test_changed_file_invalidates_cache(tmp_path):
+    """Test that editing a schema file recompiles it and replaces the stale cache entry."""
+    path = _write(tmp_path / "user.json", {"id": "int"})
+    cache_dir = tmp_path / "cache"
+    loader.load_schema(path, cache_dir=str(cache_dir))
+
+    _write(path, {"id": "str"})
+    schema, warm, _ = loader.load_schema(path, cache_dir=str(cache_dir))
+
+    assert not warm
+    schema.validate({"id": "abc"})
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    """Test that an unreadable cache entry falls back to compiling."""
+    path = _write(tmp_path / "user.json", {"id": "int"})
+    loader.load_schema(path)
+    cache_dir = tmp_path / "__flowcheck_cache__"
+    for entry in os.listdir(cache_dir):
+        (cache_dir / entry).write_bytes(b"not a pickle")
+
+    schema, warm, _ = loader.load_schema(path)
+    assert not warm
+    schema.validate({"id": 1})
+
+
+@pytest.mark.skipif(not hasattr(os, "geteuid"), reason="requires POSIX file ownership")
+def test_cache_writable_by_others_is_not_loaded(tmp_path, monkeypatch):
+    """Test that cache files other users could have written are never unpickled."""
+    path = _write(tmp_path / "user.json", {"id": "int"})
+    cache_dir = tmp_path / "cache"
+    loader.load_schema(path, cache_dir=str(cache_dir))
+    [entry] = cache_dir.iterdir()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unpickled an untrusted cache file")
+
+    entry.chmod(0o666)
+    with monkeypatch.context() as patch:
+        patch.setattr(loader.pickle, "load", fail)
+        assert loader._read_cached(str(entry)) is None
+    entry.chmod(0o600)
+    assert loader._read_cached(str(entry)) is not None
+
+    cache_dir.chmod(0o777)
+    assert loader._read_cached(str(entry)) is None
+    cache_dir.chmod(0o1777)  # Sticky: others cannot replace our files
+    assert loader._read_cached(str(entry)) is not None
+
+    if os.geteuid() == 0:
+        os.chown(entry, 12345, -1)
+        assert loader._read_cached(str(entry)) is None
+        # The untrusted entry is compiled again and replaced by our own
+        schema, warm, _ = loader.load_schema(path, cache_dir=str(cache_dir))
+        assert not warm
+        assert loader._read_cached(str(entry)) is not None
+        schema.validate({"id": 1})
+
+
+def test_invalid_schema_files(tmp_path):
+    """Test errors for unknown types, validators and unsupported files."""
+    with pytest.raises(ValueError, match="unknown type"):
+        Schema.load(_write(tmp_path / "a.json", {"id": "uuid"}), cache=False)
+    with pytest.raises(ValueError, match="cannot be loaded from files"):
+        Schema.load(_write(tmp_path / "b.json", {"id": {"type": "int", "validator": "x"}}), cache=False)
+    with pytest.raises(ValueError, match="unsupported schema file type"):
+        Schema.load(_write(tmp_path / "c.txt", {"id": "int"}), cache=False)
+
+
+def test_registry_load_dir(tmp_path):
+    """Test loading a directory of schemas and the cold/warm load statistics."""
+    _write(tmp_path / "user.json", USER)
+    _write(tmp_path / "order.json", {"id": "int", "total": {"type": "float", "min": 0}})
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    cold = SchemaRegistry.load_dir(tmp_path)
+    assert cold.names() == ["order", "user"]
+    assert cold.load_stats()["cold"] == 2
+
+    warm = SchemaRegistry.load_dir(tmp_path)
+    stats = warm.load_stats()
+    assert (stats["cold"], stats["warm"]) == (0, 2)
+    warm["order"].validate({"id": 1, "total": 9.5})
+    assert "user" in warm and len(warm) == 2
+
+
+def test_loaded_schemas_are_named_after_their_files(tmp_path):
+    """Test that file-loaded and registered schemas carry a name for metrics labels."""
+    (tmp_path / "user.json").write_text(json.dumps({"id": "int"}))
+    registry = SchemaRegistry.load_dir(tmp_path)
+    assert registry["user"].name == "user"
+
+    registry.register("order", Schema({"id": int}))
+    assert registry["order"].name == "order"
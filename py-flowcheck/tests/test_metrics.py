@@ -1,7 +1,7 @@
 import pytest
 from py_flowcheck import (
     Schema, ValidationError, check_input, check_output,
-    configure, get_config, get_metrics, reset_metrics
+    configure, get_config, get_metrics, reset_config, reset_metrics
 )
 from py_flowcheck.decorators import validate_with_mode
 
@@ -229,4 +229,370 @@ def test_environment_based_behavior():
     
     # In dev, all should be validated (sample_size ignored in dev for this test)
     # In prod, some should be skipped due to sampling
-    assert prod_metrics["sampling_skips"] > 0
\ No newline at end of file
+    assert prod_metrics["sampling_skips"] > 0
+
+def test_schema_check_does_not_raise():
+    """Test the non-raising validation path."""
+    schema = Schema({"value": int})
+
+    result = schema.check({"value": "invalid"})
+    assert not result.ok
+    assert not result
+    assert result.violations == ["Field 'value' must be of type int, got str"]
+    assert result.errors[0].code == "type"
+
+    assert schema.check({"value": 1}).ok
+
+
+def test_raise_mode_keeps_violations():
+    """Test that decorator errors carry the structured violations."""
+    configure(env="dev", sample_size=1.0, mode="raise")
+    schema = Schema({"value": int})
+
+    @check_input(schema, source="args")
+    def test_function(data):
+        return data["value"]
+
+    with pytest.raises(ValidationError) as exc_info:
+        test_function({"value": "x"})
+    assert "Input validation failed" in str(exc_info.value)
+    assert exc_info.value.errors[0].path == "value"
+
+
+def test_log_mode_counts_failures_without_raising():
+    """Test that log mode records failures through the non-raising path."""
+    reset_metrics()
+    configure(env="dev", sample_size=1.0, mode="log")
+    schema = Schema({"value": int})
+
+    @check_output(schema)
+    def test_function():
+        return {"value": "x"}
+
+    assert test_function() == {"value": "x"}
+    metrics = get_metrics()
+    assert metrics["validation_calls"] == 1
+    assert metrics["validation_failures"] == 1
+    configure(mode="raise")
+
+
+def test_timing_history_is_bounded():
+    """Test that only the most recent max_metrics_history timings are kept."""
+    configure(env="dev", sample_size=1.0, mode="raise", max_metrics_history=3)
+    try:
+        reset_metrics()
+        schema = Schema({"value": int})
+        for i in range(10):
+            validate_with_mode(schema, {"value": i})
+
+        metrics = get_metrics()
+        assert metrics["validation_calls"] == 10
+        assert len(metrics["validation_time_ms"]) == 3
+    finally:
+        configure(max_metrics_history=1000)
+
+
+def test_timing_history_resizes_with_configure():
+    """Test that configure() resizes the timing buffer, keeping the newest timings."""
+    from py_flowcheck.decorators import _record_batch
+
+    configure(max_metrics_history=5)
+    try:
+        reset_metrics()
+        for elapsed_ms in range(1, 6):
+            _record_batch(1, 0, float(elapsed_ms))
+
+        configure(max_metrics_history=2)
+        assert list(get_metrics()["validation_time_ms"]) == [4.0, 5.0]
+
+        configure(max_metrics_history=4)
+        _record_batch(1, 0, 6.0)
+        assert list(get_metrics()["validation_time_ms"]) == [4.0, 5.0, 6.0]
+
+        configure(max_metrics_history=0)
+        _record_batch(1, 0, 7.0)
+        assert len(get_metrics()["validation_time_ms"]) == 0
+    finally:
+        configure(max_metrics_history=1000)
+
+
+def test_timing_snapshot_is_detached():
+    """Test that get_metrics() returns a snapshot unaffected by later validations."""
+    reset_metrics()
+    configure(env="dev", sample_size=1.0, mode="raise")
+    schema = Schema({"value": int})
+    validate_with_mode(schema, {"value": 1})
+
+    snapshot = get_metrics()["validation_time_ms"]
+    validate_with_mode(schema, {"value": 2})
+    assert len(snapshot) == 1
+    assert len(get_metrics()["validation_time_ms"]) == 2
+
+
+def test_timing_buffer_wraps_in_order():
+    """Test that the ring buffer returns timings oldest first after wrapping."""
+    from py_flowcheck.metrics import TimingBuffer
+
+    buffer = TimingBuffer(3)
+    for value in range(7):
+        buffer.append(float(value))
+    assert list(buffer.snapshot()) == [4.0, 5.0, 6.0]
+    assert len(buffer) == 3 and buffer.capacity == 3
+
+    with pytest.raises(ValueError):
+        TimingBuffer(-1)
+
+
+def test_latency_histogram_quantiles():
+    """Test that histogram quantiles stay within the bucket precision."""
+    from py_flowcheck import LatencyHistogram
+
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value / 10)
+
+    for q, expected in [(0.5, 50.0), (0.9, 90.0), (0.99, 99.0), (0.999, 99.9)]:
+        assert histogram.quantile(q) == pytest.approx(expected, rel=0.02)
+    assert histogram.max == 100.0
+    assert histogram.mean == pytest.approx(50.05)
+    assert histogram.quantile(1.0) <= histogram.max
+    assert LatencyHistogram().quantile(0.99) == 0.0
+
+    with pytest.raises(ValueError):
+        histogram.quantile(1.5)
+
+
+def test_latency_histograms_merge():
+    """Test that merged histograms match one histogram fed all values."""
+    from py_flowcheck import LatencyHistogram
+
+    fast, slow, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in range(100):
+        fast.record(0.01 * (value + 1))
+        slow.record(10.0 * (value + 1))
+        combined.record(0.01 * (value + 1))
+        combined.record(10.0 * (value + 1))
+
+    merged = fast.snapshot().merge(slow)
+    assert merged.summary() == combined.summary()
+    assert fast.count == 100
+
+
+def test_latency_histogram_window_reset():
+    """Test that get_latency_histogram(reset=True) returns non-overlapping windows."""
+    from py_flowcheck import get_latency_histogram
+    from py_flowcheck.decorators import _record_batch
+
+    reset_metrics()
+    _record_batch(1, 0, 2.0)
+    _record_batch(1, 0, 4.0)
+
+    window = get_latency_histogram(reset=True)
+    assert window.count == 2 and window.max == 4.0
+    _record_batch(1, 0, 1.0)
+    assert get_latency_histogram().count == 1
+    assert get_metrics()["validation_calls"] == 3
+
+
+def test_latency_recorded_during_window_reset_is_not_lost():
+    """Test that a value written into a histogram being reset lands in the next window."""
+    from py_flowcheck import get_latency_histogram
+    from py_flowcheck.decorators import _metrics, _record_batch
+
+    reset_metrics()
+    _record_batch(1, 0, 2.0)
+    # A thread that fetched its histogram just before the reset swapped it
+    held = _metrics.shard().latency
+    assert get_latency_histogram(reset=True).count == 1
+    held.record(8.0)
+    _record_batch(1, 0, 1.0)
+
+    assert get_latency_histogram().count == 2
+    assert get_metrics()["validation_latency"]["count"] == 2
+    window = get_latency_histogram(reset=True)
+    assert window.count == 2 and window.total == 9.0
+    assert window.max == pytest.approx(8.0, rel=0.02)
+    assert get_latency_histogram(reset=True).count == 0
+
+
+def test_health_and_prometheus_report_quantiles():
+    """Test that health status and Prometheus output expose latency quantiles."""
+    from py_flowcheck import get_health_status, get_prometheus_metrics
+    from py_flowcheck.decorators import _record_batch
+
+    reset_metrics()
+    for value in range(1, 101):
+        _record_batch(1, 0, float(value))
+
+    health = get_health_status()["metrics"]
+    assert health["p99_time_ms"] == pytest.approx(99.0, rel=0.02)
+    assert health["max_time_ms"] == 100.0
+    assert health["average_time_ms"] == pytest.approx(50.5)
+
+    output = get_prometheus_metrics()
+    assert 'py_flowcheck_validation_latency_ms{quantile="0.99"}' in output
+    assert "py_flowcheck_validation_latency_ms_count 100" in output
+    assert "py_flowcheck_validation_calls_total 100" in output
+    assert "py_flowcheck_success_rate_percent 100" in output
+    assert "py_flowcheck_avg_validation_time_ms 50.5" in output
+
+
+def test_labeled_metrics_per_function_schema_and_direction():
+    """Test that decorated functions report their own counters and latency."""
+    reset_metrics()
+    configure(env="dev", sample_size=1.0, mode="silent")
+    try:
+        order_schema = Schema({"id": int}, name="order")
+        receipt_schema = Schema({"total": float}, name="receipt")
+
+        @check_input(order_schema, source="args")
+        @check_output(receipt_schema)
+        def place_order(data):
+            return {"total": 1.0} if data["id"] else {"total": "free"}
+
+        place_order({"id": 1})
+        place_order({"id": 0})
+        place_order({"id": "x"})
+
+        rows = {(row["schema"], row["direction"]): row for row in get_metrics()["labeled"]}
+        function = f"{__name__}.test_labeled_metrics_per_function_schema_and_direction.<locals>.place_order"
+        assert rows[("order", "input")]["function"] == function
+        assert rows[("order", "input")]["calls"] == 3
+        assert rows[("order", "input")]["failures"] == 1
+        assert rows[("receipt", "output")]["failures"] == 1
+        assert rows[("receipt", "output")]["latency"]["count"] == 3
+    finally:
+        reset_config()
+
+
+def test_labeled_metrics_use_schema_name_given_after_decoration():
+    """Test that a schema named by a registry after decoration is labeled by that name."""
+    from py_flowcheck import SchemaRegistry
+
+    configure(env="dev", sample_size=1.0, mode="silent")
+    try:
+        reset_metrics()
+        schema = Schema({"id": int})
+
+        @check_input(schema, source="args")
+        def handler(data):
+            return data
+
+        SchemaRegistry().register("invoice", schema)
+        handler({"id": 1})
+
+        [row] = get_metrics()["labeled"]
+        assert row["schema"] == "invoice"
+    finally:
+        reset_config()
+
+
+def test_labeled_metrics_survive_reset_and_count_skips():
+    """Test that reset zeroes labeled series in place and sampling skips are labeled."""
+    configure(env="prod", sample_size=0.0, mode="silent")
+    try:
+        schema = Schema({"value": int})
+
+        @check_input(schema, source="args")
+        def sampled(data):
+            return data
+
+        reset_metrics()
+        assert get_metrics()["labeled"] == []
+        sampled({"value": 1})
+        sampled({"value": 2})
+
+        [row] = get_metrics()["labeled"]
+        assert row["schema"] == "anonymous"
+        assert row["sampling_skips"] == 2 and row["calls"] == 0
+    finally:
+        reset_config()
+
+
+def test_labeled_metrics_in_health_and_prometheus():
+    """Test that the health status and Prometheus output break metrics down by label."""
+    from py_flowcheck import get_health_status, get_prometheus_metrics
+
+    reset_metrics()
+    configure(env="dev", sample_size=1.0, mode="silent")
+    try:
+        @check_input(Schema({"value": int}, name="payload"), source="args")
+        def handler(data):
+            return data
+
+        handler({"value": 1})
+        [row] = get_health_status()["metrics"]["by_label"]
+        assert row["schema"] == "payload" and row["direction"] == "input"
+        assert row["total_validations"] == 1
+
+        output = get_prometheus_metrics()
+        assert 'py_flowcheck_function_validation_calls_total{function="' in output
+        assert 'schema="payload",direction="input"} 1' in output
+    finally:
+        reset_config()
+
+
+def test_threaded_check_input_counts_are_exact():
+    """Test that 32 threads hammering check_input lose no counts."""
+    import sys
+    import threading
+
+    configure(env="dev", sample_size=1.0, mode="silent")
+    try:
+        reset_metrics()
+        schema = Schema({"value": int}, name="stress")
+
+        @check_input(schema, source="args")
+        def handler(data):
+            return data
+
+        threads, calls_per_thread = 32, 2000
+        barrier = threading.Barrier(threads)
+
+        def hammer(worker):
+            barrier.wait()
+            for i in range(calls_per_thread):
+                # Every fourth call fails validation
+                handler({"value": "bad" if i % 4 == 0 else i})
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            workers = [threading.Thread(target=hammer, args=(n,)) for n in range(threads)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        metrics = get_metrics()
+        total = threads * calls_per_thread
+        assert metrics["validation_calls"] == total
+        assert metrics["validation_failures"] == total // 4
+        assert metrics["validation_latency"]["count"] == total
+        [row] = metrics["labeled"]
+        assert row["calls"] == total and row["failures"] == total // 4
+        assert row["latency"]["count"] == total
+    finally:
+        reset_config()
+
+
+def test_finished_thread_shards_are_retired():
+    """Test that shards of finished threads are folded in without losing counts."""
+    import threading
+    from py_flowcheck.decorators import _metrics, _record_batch
+
+    reset_metrics()
+    for _ in range(3):
+        worker = threading.Thread(target=_record_batch, args=(5, 1, 1.0))
+        worker.start()
+        worker.join()
+    _record_batch(1, 0, 1.0)
+
+    metrics = get_metrics()
+    assert metrics["validation_calls"] == 16
+    assert metrics["validation_failures"] == 3
+    assert metrics["validation_batches"] == 4
+    assert len(_metrics._shards) == 1
+    assert get_metrics()["validation_calls"] == 16
@@ -0,0 +1,129 @@
+import pytest
+from py_flowcheck import (
+    Schema, get_metrics, reset_metrics,
+    validate_parallel, validate_jsonl_parallel, validate_columns_parallel,
+)
+
+
+SCHEMA = Schema({
+    "id": {"type": int, "min": 0},
+    "name": {"type": str, "validator": lambda name: name.isalpha()},
+    "tags": {"type": list, "items": str},
+})
+
+
+def _records(count):
+    for i in range(count):
+        if i % 7 == 3:
+            yield {"id": -i, "name": "bad1", "tags": ["a", i]}
+        elif i % 11 == 5:
+            yield "not a record"
+        else:
+            yield {"id": i, "name": "ok", "tags": ["a"]}
+
+
+def test_parallel_matches_validate_many():
+    """Test that parallel results equal sequential results with original indices."""
+    expected = SCHEMA.validate_many(_records(500))
+    result = validate_parallel(SCHEMA, _records(500), workers=2, chunk_size=37)
+
+    assert result.valid == expected.valid
+    assert result.invalid_indices == expected.invalid_indices
+    assert result.violations == expected.violations
+    assert result.violations[3] == [
+        "Field 'id' must be at least 0",
+        "Field 'name' failed custom validation",
+        "Field 'tags[1]' must be of type str, got int",
+    ]
+
+
+def test_parallel_violation_limits():
+    """Test that violation limits apply per record in the workers."""
+    result = validate_parallel(SCHEMA, _records(20), workers=2, chunk_size=4, fail_fast=True)
+    assert all(len(errors) == 1 for errors in result.errors.values())
+
+
+def test_parallel_records_merged_metrics():
+    """Test that one aggregated metrics entry covers the whole parallel run."""
+    reset_metrics()
+    result = validate_parallel(SCHEMA, _records(100), workers=2, chunk_size=10)
+
+    metrics = get_metrics()
+    assert metrics["validation_calls"] == 100
+    assert metrics["validation_failures"] == len(result.errors)
+    assert metrics["validation_batches"] == 1
+
+
+def test_parallel_empty_input():
+    """Test validating no records."""
+    result = validate_parallel(SCHEMA, [], workers=2)
+    assert len(result) == 0 and result.ok
+
+
+def test_parallel_rejects_bad_chunk_size():
+    """Test that chunk_size must be positive."""
+    with pytest.raises(ValueError):
+        validate_parallel(SCHEMA, [], chunk_size=0)
+
+
+def _jsonl(count):
+    import json
+    lines = []
+    for record in _records(count):
+        lines.append(json.dumps(record))
+        if len(lines) % 13 == 0:
+            lines.append("")
+    lines.append("{broken")
+    return ("\n".join(lines) + "\n").encode()
+
+
+def test_jsonl_parallel_matches_sequential(tmp_path):
+    """Test shared-memory JSONL validation from bytes and from a file."""
+    import json
+    raw = _jsonl(300)
+    records = [json.loads(line) for line in raw.decode().splitlines()[:-1] if line]
+    expected = SCHEMA.validate_many(records)
+
+    path = tmp_path / "records.jsonl"
+    path.write_bytes(raw)
+    for source in (raw, path):
+        result = validate_jsonl_parallel(SCHEMA, source, workers=2, chunk_bytes=512)
+
+        assert len(result) == len(records) + 1
+        assert result.valid[:-1] == expected.valid
+        assert result.violations[3] == expected.violations[3]
+        assert result.errors[len(records)][0].code == "invalid_json"
+
+
+def test_jsonl_parallel_invalid_utf8():
+    """Test that undecodable lines are rejected individually."""
+    raw = b'{"id": 1, "name": "ok", "tags": []}\n{"id": 2, "name": "\xff", "tags": []}\n'
+    result = validate_jsonl_parallel(SCHEMA, raw, workers=1)
+
+    assert list(result.valid) == [1, 0]
+    assert result.errors[1][0].code == "invalid_json"
+
+
+def test_jsonl_parallel_empty():
+    """Test validating an empty buffer."""
+    assert len(validate_jsonl_parallel(SCHEMA, b"", workers=1)) == 0
+
+
+def test_columns_parallel_matches_sequential():
+    """Test shared-memory columnar validation with native and object columns."""
+    np = pytest.importorskip("numpy")
+    schema = Schema({"id": {"type": int, "min": 0}, "score": {"type": float, "max": 1.0}, "name": str})
+    columns = {
+        "id": np.arange(-5, 995),
+        "score": np.linspace(0, 1.2, 1000),
+        "name": ["x"] * 990 + [None] * 10,
+    }
+
+    expected = schema.validate_columns(columns)
+    result = validate_columns_parallel(schema, columns, workers=2, chunk_rows=128)
+
+    assert result.num_rows == 1000
+    assert result.violations.keys() == expected.violations.keys()
+    for field, rules in expected.violations.items():
+        for code, rows in rules.items():
+            assert np.array_equal(result.violations[field][code], rows)
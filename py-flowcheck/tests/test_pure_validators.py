@@ -0,0 +1,119 @@
+import pickle
+import sys
+import threading
+from py_flowcheck import Schema, get_metrics, reset_metrics
+
+
+CALLS = []
+
+
+def iban_checksum(value):
+    CALLS.append(value)
+    return value.endswith("00")
+
+
+def test_pure_validator_is_memoized():
+    """Test that a pure validator runs once per distinct value."""
+    CALLS.clear()
+    schema = Schema({"iban": {"type": str, "validator": iban_checksum, "pure": True}})
+
+    for value in ["DE00", "DE00", "FR01", "DE00", "FR01"]:
+        schema.check({"iban": value})
+
+    assert CALLS == ["DE00", "FR01"]
+    assert not schema.check({"iban": "FR01"}).ok
+
+
+def test_impure_validator_runs_every_time():
+    """Test that validators are not memoized unless declared pure."""
+    CALLS.clear()
+    schema = Schema({"iban": {"type": str, "validator": iban_checksum}})
+
+    schema.check({"iban": "DE00"})
+    schema.check({"iban": "DE00"})
+    assert CALLS == ["DE00", "DE00"]
+
+
+def test_pure_memo_is_bounded_and_typed():
+    """Test the memo size limit and that equal values of different types are distinct."""
+    seen = []
+
+    def positive(value):
+        seen.append(value)
+        return value > 0
+
+    schema = Schema({"n": {"type": (int, float), "validator": positive, "pure": True, "memo_size": 2}})
+    for value in [1, 1.0, 2, 1]:
+        schema.check({"n": value})
+
+    assert seen == [1, 1.0, 2, 1]
+
+
+def test_pure_validator_with_unhashable_value():
+    """Test that unhashable values bypass the memo."""
+    seen = []
+
+    def non_empty(value):
+        seen.append(value)
+        return bool(value)
+
+    schema = Schema({"tags": {"type": list, "validator": non_empty, "pure": True}})
+    schema.check({"tags": ["a"]})
+    schema.check({"tags": ["a"]})
+    assert len(seen) == 2
+
+
+def test_validator_metrics():
+    """Test per-validator call counts, memo hits and time in get_metrics()."""
+    reset_metrics()
+    schema = Schema({
+        "iban": {"type": str, "validator": iban_checksum, "pure": True},
+        "code": {"type": str, "validator": str.isupper},
+    })
+    for _ in range(3):
+        schema.check({"iban": "NL00", "code": "AB"})
+
+    validators = get_metrics()["validators"]
+    stats = validators[f"{__name__}.iban_checksum"]
+    assert stats["calls"] == 3
+    assert stats["cache_hits"] >= 2
+    assert stats["time_ms"] >= 0
+    assert validators["str.isupper"]["calls"] == 3
+
+    reset_metrics()
+    assert get_metrics()["validators"] == {}
+
+
+def test_threaded_validator_metrics_are_exact():
+    """Test that validator calls from many threads are all counted."""
+    reset_metrics()
+    schema = Schema({"code": {"type": str, "validator": str.isupper}})
+    threads, calls_per_thread = 16, 2000
+    barrier = threading.Barrier(threads)
+
+    def hammer():
+        barrier.wait()
+        for _ in range(calls_per_thread):
+            schema.check({"code": "AB"})
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        workers = [threading.Thread(target=hammer) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert get_metrics()["validators"]["str.isupper"]["calls"] == threads * calls_per_thread
+
+
+def test_pure_validator_schema_pickles():
+    """Test that schemas with memoized validators can be pickled."""
+    schema = Schema({"iban": {"type": str, "validator": iban_checksum, "pure": True}})
+    schema.check({"iban": "DE00"})
+
+    copy = pickle.loads(pickle.dumps(schema))
+    assert copy.check({"iban": "DE00"}).ok
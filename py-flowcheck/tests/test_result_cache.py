@@ -0,0 +1,127 @@
+import threading
+import pytest
+from py_flowcheck import Schema, ValidationError, get_metrics, reset_metrics
+
+
+def _counting_schema(**options):
+    calls = []
+
+    def positive(value):
+        calls.append(value)
+        return value > 0
+
+    schema = Schema({"id": {"type": int, "validator": positive}, "tags": {"type": list, "items": str}}, **options)
+    return schema, calls
+
+
+def test_cache_is_opt_in():
+    """Test that schemas validate every call unless a cache is configured."""
+    schema, calls = _counting_schema()
+    schema.check({"id": 1, "tags": []})
+    schema.check({"id": 1, "tags": []})
+    assert len(calls) == 2
+
+
+def test_repeated_payload_uses_cached_verdict():
+    """Test that identical payloads reuse the verdict, including violations."""
+    reset_metrics()
+    schema, calls = _counting_schema(cache_size=8)
+
+    assert schema.check({"id": 1, "tags": ["a"]}).ok
+    assert schema.check({"id": 1, "tags": ["a"]}).ok
+    assert len(calls) == 1
+
+    for _ in range(2):
+        with pytest.raises(ValidationError) as exc_info:
+            schema.validate({"id": -1, "tags": [1]})
+        assert len(exc_info.value.errors) == 2
+    assert len(calls) == 2
+
+    stats = get_metrics()["result_cache"]
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+
+
+def test_cache_key_distinguishes_types():
+    """Test that equal values of different types are cached separately."""
+    schema = Schema({"value": int}, cache_size=8)
+
+    assert schema.check({"value": 1}).ok
+    assert not schema.check({"value": 1.0}).ok
+    assert not schema.check({"value": "1"}).ok
+    assert not schema.check({"value": [1]}).ok
+    assert schema._result_cache.stats()["size"] == 4
+
+
+def test_cache_key_includes_violation_limit():
+    """Test that verdicts computed under a violation limit are not reused without it."""
+    schema = Schema({"a": int, "b": int}, cache_size=8)
+
+    assert len(schema.check({"a": "x", "b": "y"}, fail_fast=True).errors) == 1
+    assert len(schema.check({"a": "x", "b": "y"}).errors) == 2
+
+
+def test_lru_eviction():
+    """Test that the cache holds at most cache_size verdicts."""
+    reset_metrics()
+    schema, calls = _counting_schema(cache_size=2)
+
+    for value in (1, 2, 3, 1):
+        schema.check({"id": value, "tags": []})
+
+    assert len(calls) == 4
+    stats = get_metrics()["result_cache"]
+    assert stats["evictions"] == 2
+    assert schema._result_cache.stats()["size"] == 2
+
+
+def test_ttl_expiry(monkeypatch):
+    """Test that cached verdicts expire after cache_ttl seconds."""
+    import py_flowcheck.schema as schema_module
+    now = [1000.0]
+    monkeypatch.setattr(schema_module.time, "monotonic", lambda: now[0])
+    schema, calls = _counting_schema(cache_size=8, cache_ttl=5.0)
+
+    schema.check({"id": 1, "tags": []})
+    now[0] += 4.0
+    schema.check({"id": 1, "tags": []})
+    assert len(calls) == 1
+
+    now[0] += 2.0
+    schema.check({"id": 1, "tags": []})
+    assert len(calls) == 2
+
+
+def test_large_payloads_skip_cache():
+    """Test that payloads above cache_max_items are validated without caching."""
+    reset_metrics()
+    schema, calls = _counting_schema(cache_size=8, cache_max_items=10)
+    payload = {"id": 1, "tags": ["t"] * 20}
+
+    schema.check(payload)
+    schema.check(payload)
+
+    assert len(calls) == 2
+    assert get_metrics()["result_cache"]["skips"] == 2
+
+
+def test_cache_is_thread_safe():
+    """Test concurrent checks against a shared cache give consistent verdicts."""
+    reset_metrics()
+    schema = Schema({"id": {"type": int, "min": 0}}, cache_size=16)
+    results = []
+
+    def worker():
+        for value in range(-10, 40):
+            results.append(schema.check({"id": value}).ok == (value >= 0))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(results)
+    stats = get_metrics()["result_cache"]
+    assert stats["hits"] + stats["misses"] == 8 * 50
+    assert schema._result_cache.stats()["size"] <= 16
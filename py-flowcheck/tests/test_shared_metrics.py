@@ -0,0 +1,240 @@
+import functools
+import multiprocessing
+import os
+import pytest
+from py_flowcheck import Schema, check_input, configure, get_metrics, reset_config, reset_metrics
+from py_flowcheck.metrics import MetricShard
+from py_flowcheck.shared_metrics import SharedMetrics, _SEQ
+
+fork = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires the fork start method"
+)
+
+
+def _shard(calls, failures=0, latencies=()):
+    shard = MetricShard(0)
+    shard.calls = calls
+    shard.failures = failures
+    for value in latencies:
+        shard.latency.record(value)
+    return shard
+
+
+def test_workers_see_the_aggregate(tmp_path):
+    """Test that every attached handle reads the sum of all slots."""
+    path = str(tmp_path / "metrics")
+    first = SharedMetrics(path, lambda: _shard(3, 1, [1.0, 2.0, 3.0]), slots=4)
+    second = SharedMetrics(path, lambda: _shard(5, 0, [10.0]), slots=4)
+    try:
+        first.attach()
+        second.attach()
+        first.publish()
+        second.publish()
+
+        for handle in (first, second):
+            total, workers = handle.collect()
+            assert workers == 2
+            assert (total.calls, total.failures) == (8, 1)
+            assert total.latency.count == 4 and total.latency.max == 10.0
+    finally:
+        first.close()
+        second.close()
+
+
+def test_closed_workers_are_retired_into_totals(tmp_path):
+    """Test that a detached worker's counts are kept and its slot is freed."""
+    path = str(tmp_path / "metrics")
+    leaving = SharedMetrics(path, lambda: _shard(7), slots=2)
+    leaving.attach()
+    leaving.close()
+
+    staying = SharedMetrics(path, lambda: _shard(1), slots=2)
+    try:
+        staying.attach()  # Reuses the only worker slot
+        staying.publish()
+        total, workers = staying.collect()
+        assert workers == 1
+        assert total.calls == 8
+    finally:
+        staying.close()
+
+
+def test_slots_are_limited(tmp_path):
+    """Test that attaching fails when every slot belongs to a live process."""
+    path = str(tmp_path / "metrics")
+    owner = SharedMetrics(path, lambda: _shard(0), slots=2)
+    extra = SharedMetrics(path, lambda: _shard(0))
+    try:
+        owner.attach()
+        assert extra.slots == 2  # The existing file's layout wins
+        with pytest.raises(RuntimeError):
+            extra.attach()
+    finally:
+        owner.close()
+        extra.close()
+
+
+def test_incompatible_file_is_rejected(tmp_path):
+    """Test that a file not written by SharedMetrics is refused."""
+    path = tmp_path / "metrics"
+    path.write_bytes(b"not a metrics file" * 10)
+    with pytest.raises(ValueError):
+        SharedMetrics(str(path), lambda: _shard(0))
+
+
+def _crashing_worker(path):
+    shared = SharedMetrics(path, lambda: _shard(11, 2, [4.0]))
+    shared.attach()
+    shared.publish()
+    os._exit(0)  # Exit without detaching, like a killed worker
+
+
+@fork
+def test_dead_worker_slots_are_garbage_collected(tmp_path):
+    """Test that slots of processes that died are folded into the totals and freed."""
+    path = str(tmp_path / "metrics")
+    reader = SharedMetrics(path, lambda: _shard(0), slots=4)
+    try:
+        worker = multiprocessing.get_context("fork").Process(target=_crashing_worker, args=(path,))
+        worker.start()
+        worker.join()
+        assert worker.pid in reader.workers()
+
+        total, workers = reader.collect()
+        assert workers == 0
+        assert reader.workers() == []
+        assert (total.calls, total.failures, total.latency.count) == (11, 2, 1)
+    finally:
+        reader.close()
+
+
+def _worker_killed_mid_write(path):
+    shared = SharedMetrics(path, lambda: _shard(11))
+    shared.attach()
+    offset = shared._offset(shared._slot)
+    _SEQ.pack_into(shared._mmap, offset, _SEQ.unpack_from(shared._mmap, offset)[0] + 1)
+    os._exit(0)  # Die with the sequence number left odd
+
+
+@fork
+def test_slot_left_mid_write_is_reusable(tmp_path):
+    """Test that a slot whose writer died mid-update becomes readable again once reused."""
+    path = str(tmp_path / "metrics")
+    reader = SharedMetrics(path, lambda: _shard(0), slots=2)
+    worker = multiprocessing.get_context("fork").Process(target=_worker_killed_mid_write, args=(path,))
+    worker.start()
+    worker.join()
+    reader.collect()  # Retires the dead worker's slot
+
+    successor = SharedMetrics(path, lambda: _shard(5), slots=2)
+    try:
+        successor.attach()  # Reuses the only worker slot
+        successor.publish()
+        total, workers = reader.collect()
+        assert workers == 1
+        assert total.calls == 5
+    finally:
+        successor.close()
+        reader.close()
+
+
+def _validating_worker(ready):
+    @check_input(Schema({"value": int}), source="args")
+    def handler(data):
+        return data
+
+    for i in range(20):
+        handler({"value": i if i % 5 else "bad"})
+    get_metrics()  # Publishes this worker's metrics
+    ready.set()
+    os._exit(0)
+
+
+@fork
+def test_get_metrics_aggregates_forked_workers(tmp_path):
+    """Test that forked workers get their own slot and get_metrics() sums them."""
+    configure(env="dev", sample_size=1.0, mode="silent", shared_metrics_path=str(tmp_path / "metrics"))
+    try:
+        reset_metrics()
+        context = multiprocessing.get_context("fork")
+        for _ in range(3):
+            ready = context.Event()
+            worker = context.Process(target=_validating_worker, args=(ready,))
+            worker.start()
+            worker.join()
+            assert ready.is_set()
+
+        metrics = get_metrics()
+        assert metrics["workers"] == 0  # This process never validated
+        assert metrics["validation_calls"] == 60
+        assert metrics["validation_failures"] == 12
+        assert metrics["validation_latency"]["count"] == 60
+    finally:
+        reset_config()
+    assert get_metrics()["workers"] == 1
+
+
+def _long_lived_worker(ready, done):
+    @check_input(Schema({"value": int}), source="args")
+    def handler(data):
+        return data
+
+    handler({"value": 1})
+    get_metrics()  # Publishes this worker's metrics
+    ready.set()
+    done.wait(10)
+    os._exit(0)
+
+
+@fork
+def test_process_that_only_forks_is_not_a_worker(tmp_path):
+    """Test that a preloading master claims no slot until it validates itself."""
+    configure(env="dev", sample_size=1.0, mode="silent", shared_metrics_path=str(tmp_path / "metrics"))
+    context = multiprocessing.get_context("fork")
+    done = context.Event()
+    workers = []
+    try:
+        reset_metrics()
+        for _ in range(2):
+            ready = context.Event()
+            worker = context.Process(target=_long_lived_worker, args=(ready, done))
+            worker.start()
+            workers.append(worker)
+            assert ready.wait(10)
+
+        metrics = get_metrics()
+        assert metrics["workers"] == 2
+        assert metrics["validation_calls"] == 2
+
+        @check_input(Schema({"value": int}), source="args")
+        def handler(data):
+            return data
+
+        handler({"value": 1})
+        assert get_metrics()["workers"] == 3
+    finally:
+        done.set()
+        for worker in workers:
+            worker.join()
+        reset_config()
+
+
+def test_parallel_workers_do_not_publish_their_chunks(tmp_path, monkeypatch):
+    """Test that validate_parallel counts each record once with shared metrics enabled."""
+    from py_flowcheck import decorators, validate_parallel
+
+    # Forked pool workers would publish their chunks well before the pool shuts down
+    monkeypatch.setattr(decorators, "SharedMetrics", functools.partial(SharedMetrics, interval=0.001))
+    configure(env="dev", sample_size=1.0, mode="silent", shared_metrics_path=str(tmp_path / "metrics"))
+    try:
+        reset_metrics()
+        records = [{"value": i if i % 10 else "bad"} for i in range(1000)]
+        validate_parallel(Schema({"value": int}), records, workers=2, chunk_size=100)
+
+        metrics = get_metrics()
+        assert metrics["validation_calls"] == 1000
+        assert metrics["validation_failures"] == 100
+        assert metrics["validation_batches"] == 1
+        assert metrics["workers"] == 1
+    finally:
+        reset_config()
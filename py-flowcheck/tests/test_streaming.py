@@ -0,0 +1,159 @@
+import io
+import json
+from py_flowcheck import (
+    Schema, validate_stream, validate_jsonl, CollectingSink, JsonlSink,
+    get_metrics, reset_metrics
+)
+
+
+schema = Schema({"id": int, "name": str})
+
+
+def test_validate_stream_yields_valid_records():
+    """Test that valid records are yielded and invalid ones go to the sink."""
+    sink = CollectingSink()
+    records = [{"id": 1, "name": "a"}, {"id": "x", "name": "b"}, {"id": 3, "name": "c"}, None]
+
+    valid = list(validate_stream(schema, records, sink=sink))
+
+    assert valid == [{"id": 1, "name": "a"}, {"id": 3, "name": "c"}]
+    assert sink.count == 2
+    assert [invalid.line for invalid in sink.records] == [2, 4]
+    assert "Field 'id' must be of type int, got str" in sink.records[0].violations
+
+
+def test_validate_stream_is_lazy():
+    """Test that records are pulled from the source only as they are consumed."""
+    pulled = []
+
+    def source():
+        for i in range(1_000_000):
+            pulled.append(i)
+            yield {"id": i, "name": "n"}
+
+    stream = validate_stream(schema, source())
+    assert next(stream) == {"id": 0, "name": "n"}
+    assert next(stream) == {"id": 1, "name": "n"}
+    stream.close()
+    assert len(pulled) == 2
+
+
+def test_validate_jsonl_from_file_object():
+    """Test JSON Lines parsing with malformed and blank lines."""
+    data = io.StringIO(
+        '{"id": 1, "name": "a"}\n'
+        '\n'
+        '{"id": 2, "name": 5}\n'
+        'not json\n'
+        '{"id": 4, "name": "d"}\n'
+    )
+    sink = CollectingSink()
+
+    valid = list(validate_jsonl(schema, data, sink=sink))
+
+    assert [record["id"] for record in valid] == [1, 4]
+    assert [invalid.line for invalid in sink.records] == [3, 4]
+    assert sink.records[1].record == "not json"
+    assert sink.records[1].violations[0].startswith("Invalid JSON")
+
+
+def test_validate_jsonl_from_path(tmp_path):
+    """Test reading from a path and writing rejects with JsonlSink."""
+    path = tmp_path / "records.jsonl"
+    path.write_text("\n".join(json.dumps({"id": i, "name": str(i)}) for i in range(100)) + '\n{"id": null}\n')
+    rejects = io.StringIO()
+
+    reset_metrics()
+    valid = list(validate_jsonl(schema, path, sink=JsonlSink(rejects)))
+
+    assert len(valid) == 100
+    rejected = json.loads(rejects.getvalue())
+    assert rejected["line"] == 101
+    assert "Field 'id' is required but missing" in rejected["violations"]
+
+    metrics = get_metrics()
+    assert metrics["validation_calls"] == 101
+    assert metrics["validation_failures"] == 1
+    assert metrics["validation_batches"] == 1
+
+
+def test_collecting_sink_is_bounded():
+    """Test that a bounded sink keeps only the most recent rejects."""
+    sink = CollectingSink(maxlen=3)
+
+    list(validate_stream(schema, ({"id": str(i)} for i in range(10)), sink=sink))
+
+    assert sink.count == 10
+    assert [invalid.line for invalid in sink.records] == [8, 9, 10]
+
+
+def test_iter_json_array_across_chunk_boundaries():
+    """Test that elements split across tiny chunks are parsed correctly."""
+    from py_flowcheck import iter_json_array
+
+    elements = [123456789, -1.5e10, "café ☃", True, None, {"nested": [1, {"a": "]"}]}, [], {}]
+    document = json.dumps(elements, ensure_ascii=False)
+
+    for chunk_size in (1, 2, 3, 7, 64):
+        assert list(iter_json_array(io.BytesIO(document.encode("utf-8")), chunk_size)) == elements
+        assert list(iter_json_array(io.StringIO(document), chunk_size)) == elements
+
+    assert list(iter_json_array(io.StringIO("  [ ]  "))) == []
+
+
+def test_iter_json_array_numbers_split_at_every_position():
+    """Test that float and exponent literals split at any position parse whole."""
+    from py_flowcheck import iter_json_array
+
+    for literal in ("7773.25", "-0.5e-10", "1E+300", "12e3", "3.0"):
+        prefix = "[1,1,"
+        document = f"{prefix}{literal}, 2]"
+        for boundary in range(len(prefix), len(prefix) + len(literal) + 1):
+            # Chunk sizes are fixed, so position the boundary by padding the prefix
+            padded = " " * (64 - boundary) + document
+            assert list(iter_json_array(io.StringIO(padded), chunk_size=64)) == [1, 1, json.loads(literal), 2]
+
+
+def test_iter_json_array_rejects_malformed_documents():
+    """Test that malformed documents raise ValueError."""
+    import pytest
+    from py_flowcheck import iter_json_array
+
+    for document in ('{"a": 1}', "[1, 2", "[1 2]", "[1, tru]", "[1] 2", ""):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO(document), chunk_size=2))
+
+
+def test_validate_json_array(tmp_path):
+    """Test validating array elements as they are parsed from a file."""
+    from py_flowcheck import validate_json_array
+
+    path = tmp_path / "feed.json"
+    items = [{"id": i, "name": f"n{i}"} for i in range(1000)]
+    items[500] = {"id": "bad", "name": "x"}
+    path.write_text(json.dumps(items))
+    sink = CollectingSink()
+
+    valid = validate_json_array(schema, path, sink=sink, chunk_size=128)
+
+    assert sum(1 for _ in valid) == 999
+    assert [invalid.line for invalid in sink.records] == [501]
+
+
+def test_iter_json_array_is_incremental():
+    """Test that elements are yielded before the whole document is read."""
+    from py_flowcheck import iter_json_array
+
+    class CountingReader(io.StringIO):
+        reads = 0
+
+        def read(self, size=-1):
+            self.reads += 1
+            return super().read(size)
+
+    source = CountingReader("[" + ",".join(['{"id": 1, "name": "a"}'] * 10000) + "]")
+    elements = iter_json_array(source, chunk_size=64)
+    next(elements)
+
+    assert source.reads < 5
+    assert source.tell() < 1024
@@ -0,0 +1,123 @@
+import asyncio
+import pytest
+from py_flowcheck import Schema, ValidationError
+
+
+CLICK = {"kind": {"type": str, "enum": ["click"]}, "x": int, "y": int}
+VIEW = {"kind": {"type": str, "enum": ["view", "impression"]}, "url": {"type": str, "regex": r"^https?://"}}
+
+
+def _errors(schema, data):
+    return schema.check(data).errors
+
+
+def test_discriminated_union_selects_branch():
+    """Test that the discriminator picks exactly one branch to validate."""
+    schema = Schema({"event": {"one_of": [CLICK, VIEW], "discriminator": "kind"}})
+
+    schema.validate({"event": {"kind": "click", "x": 1, "y": 2}})
+    schema.validate({"event": {"kind": "impression", "url": "https://example.com"}})
+
+    errors = _errors(schema, {"event": {"kind": "view", "url": "ftp://example.com"}})
+    assert [(v.path, v.code) for v in errors] == [("event.url", "pattern")]
+
+
+def test_discriminated_union_mapping_form():
+    """Test declaring branches as a mapping from discriminator value to schema."""
+    schema = Schema({"event": {
+        "any_of": {"click": Schema(CLICK), "view": VIEW},
+        "discriminator": "kind",
+    }})
+
+    schema.validate({"event": {"kind": "click", "x": 1, "y": 2}})
+    errors = _errors(schema, {"event": {"kind": "click", "x": "1", "y": 2}})
+    assert [v.path for v in errors] == ["event.x"]
+
+
+def test_unknown_discriminator_value():
+    """Test that a missing or unknown discriminator value is a single violation."""
+    schema = Schema({"event": {"one_of": [CLICK, VIEW], "discriminator": "kind"}})
+
+    for tag in ("scroll", None, ["click"]):
+        errors = _errors(schema, {"event": {"kind": tag}})
+        assert len(errors) == 1
+        assert errors[0].path == "event.kind"
+        assert errors[0].code == "discriminator"
+        assert errors[0].expected == ["click", "view", "impression"]
+
+
+def test_discriminated_branch_is_only_branch_checked():
+    """Test that only the selected branch's rules run."""
+    calls = []
+    branches = {
+        tag: {"kind": str, "value": {"type": int, "validator": lambda v, tag=tag: calls.append(tag) or True}}
+        for tag in ("a", "b", "c")
+    }
+    schema = Schema({"event": {"one_of": branches, "discriminator": "kind"}})
+
+    schema.validate({"event": {"kind": "b", "value": 1}})
+    assert calls == ["b"]
+
+
+def test_ordered_trial_without_discriminator():
+    """Test any_of and one_of semantics when branches must be tried in order."""
+    by_id = {"id": int}
+    by_email = {"email": {"type": str, "regex": r".+@.+"}}
+    any_schema = Schema({"lookup": {"any_of": [by_id, by_email]}})
+    one_schema = Schema({"lookup": {"one_of": [by_id, by_email]}})
+
+    any_schema.validate({"lookup": {"id": 1, "email": "a@b"}})
+    one_schema.validate({"lookup": {"email": "a@b"}})
+
+    errors = _errors(any_schema, {"lookup": {"id": "x"}})
+    assert [(v.path, v.code) for v in errors] == [("lookup", "any_of")]
+    assert "any of the 2 allowed schemas" in errors[0].message
+
+    errors = _errors(one_schema, {"lookup": {"id": 1, "email": "a@b"}})
+    assert [(v.path, v.code, v.actual) for v in errors] == [("lookup", "one_of", 2)]
+    assert "expected exactly one" in errors[0].message
+
+
+def test_union_inside_items_and_codegen():
+    """Test unions in list items give the same violations with codegen."""
+    definition = {"events": {"type": list, "items": {"one_of": [CLICK, VIEW], "discriminator": "kind"}}}
+    data = {"events": [{"kind": "click", "x": 1, "y": 2}, {"kind": "view", "url": 3}, {"kind": "zoom"}]}
+
+    planned = Schema(definition).check(data).violations
+    generated = Schema(definition, codegen=True).check(data).violations
+    assert planned == generated
+    assert len(planned) == 2
+
+
+def test_union_requires_mapping_value():
+    """Test that union fields default to dict type."""
+    schema = Schema({"event": {"one_of": [CLICK, VIEW], "discriminator": "kind"}})
+
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate({"event": "click"})
+    assert exc_info.value.errors[0].code == "type"
+
+
+def test_invalid_union_definitions():
+    """Test that ambiguous discriminated unions are rejected at compile time."""
+    with pytest.raises(ValueError, match="must declare an 'enum'"):
+        Schema({"event": {"one_of": [CLICK, {"kind": str}], "discriminator": "kind"}})
+    with pytest.raises(ValueError, match="more than one branch"):
+        Schema({"event": {"one_of": [CLICK, CLICK.copy()], "discriminator": "kind"}})
+    with pytest.raises(ValueError, match="requires a 'discriminator'"):
+        Schema({"event": {"one_of": {"click": CLICK}}})
+
+
+def test_async_validator_in_trial_branch_is_rejected():
+    """Test that async validators are only allowed in discriminated union branches."""
+    async def known(value):
+        return True
+
+    branch = {"kind": {"type": str, "enum": ["ref"]}, "id": {"type": int, "validator": known}}
+    with pytest.raises(ValueError, match="cannot use async validators"):
+        Schema({"event": {"any_of": [CLICK, branch]}})
+    with pytest.raises(ValueError, match="cannot use async validators"):
+        Schema({"events": {"type": list, "items": {"one_of": [CLICK, {"ref": {"type": dict, "schema": branch}}]}}})
+
+    schema = Schema({"event": {"one_of": [CLICK, branch], "discriminator": "kind"}})
+    assert asyncio.run(schema.acheck({"event": {"kind": "ref", "id": 1}})).ok
@@ -0,0 +1,89 @@
+import pytest
+from py_flowcheck import Schema, ValidationError, check_input, configure
+
+
+DEFINITION = {
+    "a": int,
+    "b": int,
+    "c": int,
+    "items": {"type": list, "items": int},
+}
+BAD = {"a": "x", "b": "y", "c": "z", "items": ["1"] * 1000}
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_fail_fast_stops_at_first_violation(codegen):
+    """Test that fail_fast stops validation after one violation."""
+    schema = Schema(DEFINITION, codegen=codegen, fail_fast=True)
+
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate(BAD)
+    assert exc_info.value.violations == ["Field 'a' must be of type int, got str"]
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_max_violations_caps_collection(codegen):
+    """Test that max_violations caps collected violations, even inside lists."""
+    schema = Schema(DEFINITION, codegen=codegen, max_violations=10)
+
+    result = schema.check(BAD)
+    assert len(result.errors) == 10
+    assert result.errors[-1].path == "items[6]"
+
+    # Unlimited by default
+    assert len(Schema(DEFINITION, codegen=codegen).check(BAD).errors) == 1003
+
+
+def test_call_overrides_schema_and_config():
+    """Test precedence: call arguments, then schema settings, then config."""
+    schema = Schema(DEFINITION, max_violations=2)
+
+    assert len(schema.check(BAD).errors) == 2
+    assert len(schema.check(BAD, fail_fast=True).errors) == 1
+    assert len(schema.check(BAD, max_violations=0).errors) == 1003
+
+    configure(max_violations=3)
+    try:
+        assert len(Schema(DEFINITION).check(BAD).errors) == 3
+        assert len(schema.check(BAD).errors) == 2
+    finally:
+        configure(max_violations=0)
+
+
+def test_decorator_violation_limits():
+    """Test fail_fast set on a decorator."""
+    configure(env="dev", sample_size=1.0, mode="raise")
+    schema = Schema(DEFINITION)
+
+    @check_input(schema, source="args", fail_fast=True)
+    def handler(data):
+        return data
+
+    with pytest.raises(ValidationError) as exc_info:
+        handler(BAD)
+    assert len(exc_info.value.errors) == 1
+
+
+def test_validate_many_limits_per_record():
+    """Test that batch limits apply to each record independently."""
+    result = Schema(DEFINITION).validate_many([BAD, BAD], max_violations=2)
+
+    assert [len(errors) for errors in result.errors.values()] == [2, 2]
+
+
+def test_validate_many_fail_fast_non_mapping_record():
+    """Test that a non-dict record under fail_fast is reported, not raised."""
+    result = Schema(DEFINITION).validate_many([BAD, "oops"], fail_fast=True)
+
+    assert [errors[0].code for errors in result.errors.values()][1] == "record_type"
+
+
+def test_custom_validator_respects_limit():
+    """Test that a custom validator failure still stops at the limit."""
+    schema = Schema({
+        "x": {"type": int, "validator": lambda v: False},
+        "y": int,
+    }, fail_fast=True)
+
+    result = schema.check({"x": 1, "y": "bad"})
+    assert [e.code for e in result.errors] == ["custom"]
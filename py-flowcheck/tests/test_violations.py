@@ -0,0 +1,88 @@
+import pytest
+from py_flowcheck import Schema, ValidationError, Violation
+
+
+schema = Schema({
+    "id": int,
+    "age": {"type": int, "min": 0},
+    "tags": {"type": list, "items": str},
+})
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_structured_violations(codegen):
+    """Test that violations carry machine-readable codes and paths."""
+    checked = Schema(schema.schema, codegen=codegen)
+
+    with pytest.raises(ValidationError) as exc_info:
+        checked.validate({"age": -1, "tags": ["a", 2]})
+
+    errors = exc_info.value.errors
+    assert [(e.path, e.code) for e in errors] == [
+        ("id", "required"),
+        ("age", "min"),
+        ("tags[1]", "type"),
+    ]
+    assert errors[1].expected == 0
+    assert errors[2].expected is str
+    assert errors[2].actual is int
+
+
+def test_messages_render_lazily():
+    """Test that messages are rendered only when violations are read."""
+    rendered = []
+
+    class Spy(int):
+        def __str__(self):
+            rendered.append(True)
+            return "0"
+
+    lazy = Schema({"age": {"type": int, "min": Spy(0)}})
+
+    with pytest.raises(ValidationError) as exc_info:
+        lazy.validate({"age": -1})
+    assert rendered == []
+
+    assert exc_info.value.violations == ["Field 'age' must be at least 0"]
+    assert rendered == [True]
+    # Rendered messages are cached
+    exc_info.value.violations
+    assert rendered == [True]
+
+
+def test_violation_to_dict():
+    """Test the JSON-friendly representation of a violation."""
+    violation = Violation("user.age", "type", int, str)
+
+    assert violation.to_dict() == {
+        "path": "user.age",
+        "code": "type",
+        "expected": "int",
+        "actual": "str",
+        "message": "Field 'user.age' must be of type int, got str",
+    }
+    assert str(Violation("x", "custom_error", actual=ValueError("boom"))) == (
+        "Field 'x' custom validation error: boom"
+    )
+
+
+def test_validation_error_accepts_strings():
+    """Test that ValidationError still accepts plain string violations."""
+    error = ValidationError("failed", ["something went wrong"])
+
+    assert error.violations == ["something went wrong"]
+    assert ValidationError("failed").violations == []
+
+
+def test_validation_error_violations_can_be_reassigned():
+    """Test that violations can still be set, e.g. to filter messages before re-raising."""
+    schema = Schema({"id": int, "name": str})
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate({})
+    error = exc_info.value
+
+    error.violations = [message for message in error.violations if "'id'" in message]
+    assert error.violations == ["Field 'id' is required but missing"]
+    error.violations.append("extra")
+    assert error.violations[-1] == "extra"
+    assert len(error.errors) == 2